@@ -52,7 +52,7 @@ from .basetypes import (
 )
 from .constructeddata import Any, Sequence, SequenceOf
 from .debugging import DebugContents, ModuleLogger, bacpypes_debugging
-from .errors import DecodingError
+from .errors import DecodingError, InvalidTag
 from .pdu import PCI, PDU, PDUData
 from .primitivedata import (
     Boolean,
@@ -981,6 +981,10 @@ class AbortPDU(APDU, ErrorRejectAbortNack):
 
 @bacpypes_debugging
 class APCISequence(APCI, Sequence):
+    # undecoded service parameters of a lazily decoded sequence
+    _lazy_data: Optional[bytearray] = None
+    _eager_class: type
+
     def __init__(self, **kwargs) -> None:
         if _debug:
             APCISequence._debug("__init__ %r", kwargs)
@@ -989,6 +993,36 @@ class APCISequence(APCI, Sequence):
         # pass the rest of the kwargs to the sequence
         Sequence.__init__(self, **kwargs)
 
+    def materialize(self) -> None:
+        """
+        Decode the service parameters of a lazily decoded sequence, this is
+        called when one of the elements is first referenced.
+        """
+        lazy_data = self._lazy_data
+        if lazy_data is None:
+            return
+        if _debug:
+            APCISequence._debug("materialize")
+
+        # back to the real class, the elements are now ordinary attributes
+        sequence_class = self._eager_class
+        self.__class__ = sequence_class
+        self._lazy_data = None
+
+        try:
+            tag_list = TagList.decode(PDUData(lazy_data))
+            apci_sequence = Sequence.decode(tag_list, class_=sequence_class)
+        except (AttributeError, InvalidTag, ValueError) as err:
+            if _debug:
+                APCISequence._debug("    - decoding error: %r", err)
+            raise DecodingError(str(err)) from err
+
+        # copy the decoded elements
+        instance_dict = self.__dict__
+        decoded_dict = apci_sequence.__dict__
+        for attr in sequence_class._elements:
+            instance_dict[attr] = decoded_dict.get(attr, None)
+
     def encode(self) -> APDU:  # type: ignore[override]
         if _debug:
             APCISequence._debug("encode")
@@ -1000,11 +1034,6 @@ class APCISequence(APCI, Sequence):
             for i, t in enumerate(tag_list):
                 APCISequence._debug("        [%r]: %r", i, t)
 
-        # encode the tag list
-        pdu_data = tag_list.encode()
-        if _debug:
-            APCISequence._debug("    - pdu_data: %r", pdu_data)
-
         # create an APDU, copy the header fields
         apdu: APDU
         if isinstance(self, ConfirmedRequestPDU):
@@ -1015,18 +1044,25 @@ class APCISequence(APCI, Sequence):
             apdu = UnconfirmedRequestPDU()
         elif isinstance(self, ErrorPDU):
             apdu = ErrorPDU()
-
         apdu.update(self)
-        apdu.put_data(pdu_data.pduData)
+
+        # encode the tag list directly into the APDU
+        tag_list.encode(apdu)
         if _debug:
             APCISequence._debug("    - apdu: %r, %r", apdu, apdu.pduData)
 
         return apdu
 
     @classmethod
-    def decode(class_, apdu) -> APCISequence:  # type: ignore[override]
+    def decode(class_, apdu, lazy: bool = False) -> APCISequence:  # type: ignore[override]
+        """
+        Decode the APDU as an instance of the APCISequence subclass registered
+        for the service choice.  When lazy is set only the APCI header is
+        copied and the service parameters are decoded the first time one of
+        the elements is referenced.
+        """
         if _debug:
-            APCISequence._debug("decode %r", apdu)
+            APCISequence._debug("decode %r lazy=%r", apdu, lazy)
 
         try:
             if apdu.apduType == ConfirmedRequestPDU.pduType:
@@ -1048,6 +1084,19 @@ class APCISequence(APCI, Sequence):
                 apci_sequence_subclass.decode,
             )
 
+        # elements that are properties are decoded eagerly
+        if lazy and not apci_sequence_subclass._property_elements:
+            apci_sequence = apci_sequence_subclass()
+            apci_sequence.__class__ = _lazy_class(apci_sequence_subclass)
+
+            # save the rest of the data for later
+            apci_sequence._lazy_data = apdu.get_data(apdu.remaining())
+
+            # copy the header fields
+            apci_sequence.update(apdu)
+
+            return cast(APCISequence, apci_sequence)
+
         # decode the APDU data as a TagList
         tag_list = TagList.decode(apdu)
         if _debug:
@@ -1102,6 +1151,54 @@ class APCISequence(APCI, Sequence):
         return use_dict
 
 
+#
+#   Lazy Decoding
+#
+
+# subclasses of APCISequence subclasses for lazy decoding
+_lazy_classes: Dict[type, type] = {}
+
+
+class _LazyElement:
+    """
+    A data descriptor for an element of a lazily decoded sequence, the first
+    reference decodes all of the elements.
+    """
+
+    def __init__(self, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        obj.materialize()
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj, value) -> None:
+        obj.materialize()
+        setattr(obj, self.attr, value)
+
+
+def _lazy_class(class_: type) -> type:
+    """
+    Return a subclass of the APCISequence subclass where the elements are
+    lazy, instances are changed back to the original class when they are
+    decoded.
+    """
+    lazy_class = _lazy_classes.get(class_, None)
+    if lazy_class is None:
+        lazy_class = type(class_)(
+            class_.__name__, (class_,), {"__module__": class_.__module__}
+        )
+        lazy_class._eager_class = class_
+        for attr in class_._elements:
+            setattr(lazy_class, attr, _LazyElement(attr))
+
+        _lazy_classes[class_] = lazy_class
+
+    return lazy_class
+
+
 #
 #   ConfirmedRequestSequence
 #
@@ -9,10 +9,12 @@ import asyncio
 import dataclasses
 import re
 
+from collections import OrderedDict, deque
+from contextvars import ContextVar
 from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any as _Any
-from typing import Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union, cast
 
 # for computing protocol services supported
 from .apdu import (
@@ -23,7 +25,11 @@ from .apdu import (
     ConfirmedServiceChoice,
     Error,
     ErrorPDU,
+    ErrorRejectAbortNack,
     IAmRequest,
+    ReadPropertyMultipleRequest,
+    ReadPropertyRequest,
+    ReadRangeRequest,
     RejectPDU,
     SimpleAckPDU,
     UnconfirmedRequestPDU,
@@ -44,7 +50,13 @@ from .basetypes import (
 )
 from .comm import ApplicationServiceElement, bind
 from .debugging import DebugContents, ModuleLogger, bacpypes_debugging
-from .errors import AbortException, ExecutionError, RejectException, UnrecognizedService
+from .errors import (
+    AbortException,
+    ExecutionError,
+    OutOfResources,
+    RejectException,
+    UnrecognizedService,
+)
 from .ipv4.link import BBMDLinkLayer as BBMDLinkLayer_ipv4
 from .ipv4.link import ForeignLinkLayer as ForeignLinkLayer_ipv4
 from .ipv4.link import NormalLinkLayer as NormalLinkLayer_ipv4
@@ -65,11 +77,14 @@ from .netservice import (
 from .object import DeviceObject, Object
 from .pdu import Address
 from .primitivedata import ObjectIdentifier, ObjectType
+from .settings import settings
+from .timer import RESOLUTION as TIMER_RESOLUTION
 from .service.cov import ChangeOfValueServices
 
 # basic services
 from .service.device import WhoHasIHaveServices, WhoIsIAmServices
 from .service.object import (
+    ReadPropertyCoalescer,
     ReadRangeServices,
     ReadWritePropertyMultipleServices,
     ReadWritePropertyServices,
@@ -91,6 +106,33 @@ _log = ModuleLogger(globals())
 # 'property[index]' matching
 property_index_re = re.compile(r"^([0-9A-Za-z-_]+)(?:\[([0-9]+)\])?$")
 
+# request priority classes, when the requests are limited by a scheduler the
+# interactive ones are sent before the bulk ones
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+# the priority class of requests made in this context, tasks get a copy,
+# values other than PRIORITY_INTERACTIVE are PRIORITY_BULK
+request_priority: ContextVar[int] = ContextVar(
+    "request_priority", default=PRIORITY_INTERACTIVE
+)
+
+# requests that only read so identical ones can share a response
+single_flight_request_types = (
+    ReadPropertyRequest,
+    ReadPropertyMultipleRequest,
+    ReadRangeRequest,
+)
+
+# requests that have already been encoded, like a compiled read property
+# multiple request, are recognized by their service choice
+single_flight_services = {
+    request_type.service_choice for request_type in single_flight_request_types
+}
+
+# destination, service choice, encoded service parameters
+SingleFlightKey = Tuple[Address, int, bytes]
+
 
 #
 #   DeviceInfo
@@ -109,6 +151,10 @@ class DeviceInfo(DebugContents):
         "max_npdu_length",
         "max_segments_accepted",
         "protocol_services_supported",
+        "srtt",
+        "rttvar",
+        "rto",
+        "rtt_samples",
     )
 
     device_instance: int
@@ -120,6 +166,70 @@ class DeviceInfo(DebugContents):
     max_npdu_length: Optional[int] = None  # See Clause 19.4
     protocol_services_supported: Optional[ServicesSupported] = None
 
+    # round trip time statistics in milliseconds
+    srtt: Optional[float] = None
+    rttvar: Optional[float] = None
+    rto: Optional[float] = None
+    rtt_samples: int = 0
+
+    def service_supported(self, service: int) -> Optional[bool]:
+        """
+        Return True if the device supports the service, False if it does not,
+        or None if the services it supports are not known.  A bit string that
+        is too short for the service is from a device that does not know it.
+        """
+        services_supported = self.protocol_services_supported
+        if services_supported is None:
+            return None
+        return (len(services_supported) > service) and bool(
+            services_supported[service]
+        )
+
+    def rtt_sample(self, rtt: float) -> None:
+        """
+        Update the smoothed round trip time and its variation with a new
+        measurement in milliseconds and compute a new timeout the same way
+        as the TCP retransmission timer (RFC 6298), limited by the adaptive
+        timeout settings.
+        """
+        if _debug:
+            DeviceInfo._debug("rtt_sample %r", rtt)
+
+        if not self.rtt_samples:
+            self.srtt = rtt
+            self.rttvar = rtt / 2.0
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.rtt_samples += 1
+
+        # the variation is at least the timer resolution
+        rto = self.srtt + max(TIMER_RESOLUTION * 1000.0, 4.0 * self.rttvar)
+        self.rto = min(
+            max(rto, settings.adaptive_timeout_min), settings.adaptive_timeout_max
+        )
+        if _debug:
+            DeviceInfo._debug("    - rto: %r", self.rto)
+
+    def rtt_timeout(self) -> None:
+        """
+        There was no response from the device, back off the timeout.
+        """
+        if _debug:
+            DeviceInfo._debug("rtt_timeout")
+
+        if self.rto is not None:
+            self.rto = min(self.rto * 2.0, settings.adaptive_timeout_max)
+
+    def apdu_timeout(self, default: int) -> int:
+        """
+        Return the APDU timeout to use for a request to this device, or the
+        default if there have not been any measurements.
+        """
+        if self.rto is None:
+            return default
+        return int(self.rto)
+
 
 #
 #   DeviceInfoCache
@@ -267,6 +377,624 @@ class DeviceInfoCache(DebugContents):
         # decrement the reference count
         device_info._ref_count -= 1
 
+    def rtt_stats(self) -> Dict[Address, Dict[str, _Any]]:
+        """
+        Return the round trip time statistics of the devices that have been
+        measured.
+        """
+        return {
+            device_address: {
+                "device_instance": device_info.device_instance,
+                "srtt": device_info.srtt,
+                "rttvar": device_info.rttvar,
+                "rto": device_info.rto,
+                "samples": device_info.rtt_samples,
+            }
+            for device_address, device_info in self.address_cache.items()
+            if device_info.rtt_samples
+        }
+
+
+#
+#   InvokeIDPool
+#
+
+
+@bacpypes_debugging
+class InvokeIDPool(DebugContents):
+    """
+    The invoke IDs of the outstanding confirmed requests to a peer, the
+    invoke IDs that are free to be used, and the requests that are waiting
+    for one to be released.  The free IDs are used in the order they were
+    released so a late response does not match a recent request.
+    """
+
+    _debug_contents = ("requests", "free", "pending")
+    _debug: Callable[..., None]
+
+    requests: Dict[int, Tuple[APDU, APDUFuture]]
+    free: Deque[int]
+    pending: Deque[Tuple[APDU, APDUFuture]]
+
+    def __init__(self, start: int = 0) -> None:
+        if _debug:
+            InvokeIDPool._debug("__init__ start=%r", start)
+
+        self.requests = {}
+        self.free = deque(range(256))
+        self.free.rotate(-start)
+        self.pending = deque()
+
+    def allocate(self, apdu: APDU, future: APDUFuture) -> bool:
+        """
+        Give the request an invoke ID, keeping the one it already has if
+        it is not being used, and return True.  If they are all being used
+        the request waits for one to be released and this returns False.
+        """
+        if _debug:
+            InvokeIDPool._debug("allocate %r", apdu)
+
+        invoke_id = apdu.apduInvokeID
+        if (invoke_id is not None) and (invoke_id not in self.requests):
+            self.free.remove(invoke_id)
+        elif self.free:
+            invoke_id = apdu.apduInvokeID = self.free.popleft()
+        else:
+            if _debug:
+                InvokeIDPool._debug("    - pending")
+            self.pending.append((apdu, future))
+            return False
+
+        self.requests[invoke_id] = (apdu, future)
+        return True
+
+    def release(self, apdu: APDU) -> Optional[Tuple[APDU, APDUFuture]]:
+        """
+        The request has completed or was canceled, release its invoke ID.
+        If there is a request waiting for one, return it with the ID it was
+        given so it can be sent.
+        """
+        if _debug:
+            InvokeIDPool._debug("release %r", apdu)
+
+        invoke_id = apdu.apduInvokeID
+        request = self.requests.get(invoke_id, None)
+        if (request is None) or (request[0] is not apdu):
+            # canceled while it was waiting
+            for indx, (pdu, fut) in enumerate(self.pending):
+                if pdu is apdu:
+                    del self.pending[indx]
+                    break
+            return None
+
+        del self.requests[invoke_id]
+        self.free.append(invoke_id)
+
+        # next request that is still waiting
+        while self.pending:
+            pdu, fut = self.pending.popleft()
+            if fut.done():
+                continue
+            pdu.apduInvokeID = self.free.popleft()
+            self.requests[pdu.apduInvokeID] = (pdu, fut)
+            return (pdu, fut)
+
+        return None
+
+
+#
+#   RequestScheduler
+#
+
+
+@bacpypes_debugging
+class RequestScheduler(DebugContents):
+    """
+    Limit the number of confirmed requests that are outstanding in total,
+    to each device, and to each remote network.  Requests that are over a
+    limit wait in a queue for their priority class and destination, when a
+    request completes the waiting ones are sent in priority order taking
+    turns between the destinations.
+
+    A limit of zero is no limit.  Devices that are known to not support
+    segmentation are limited to one request at a time unless they have an
+    entry in device_limits, networks can have an entry in network_limits.
+    """
+
+    _debug_contents = (
+        "max_requests",
+        "max_device_requests",
+        "max_network_requests",
+        "outstanding",
+        "queued",
+        "max_waiting",
+    )
+    _debug: Callable[..., None]
+
+    max_requests: int
+    max_device_requests: int
+    max_network_requests: int
+    device_limits: Dict[Address, int]
+    network_limits: Dict[int, int]
+
+    outstanding: int
+    device_outstanding: Dict[Address, int]
+    network_outstanding: Dict[int, int]
+    queues: List[OrderedDict[Address, Deque[Tuple[APDU, APDUFuture]]]]
+
+    queued: int
+    max_waiting: int
+
+    def __init__(
+        self,
+        max_requests: int = 0,
+        max_device_requests: int = 0,
+        max_network_requests: int = 0,
+        device_info_cache: Optional[DeviceInfoCache] = None,
+    ) -> None:
+        if _debug:
+            RequestScheduler._debug(
+                "__init__ max_requests=%r max_device_requests=%r max_network_requests=%r",
+                max_requests,
+                max_device_requests,
+                max_network_requests,
+            )
+
+        self.max_requests = max_requests
+        self.max_device_requests = max_device_requests
+        self.max_network_requests = max_network_requests
+        self.device_info_cache = device_info_cache
+        self.device_limits = {}
+        self.network_limits = {}
+
+        # requests that have been sent, by the id() of the APDU
+        self._sent: Dict[int, Address] = {}
+        self.outstanding = 0
+        self.device_outstanding = {}
+        self.network_outstanding = {}
+
+        # requests waiting to be sent, one queue for each priority class
+        self.queues = [OrderedDict(), OrderedDict()]
+        self._waiting = 0
+
+        # the number of requests that had to wait, the most at one time
+        self.queued = 0
+        self.max_waiting = 0
+
+    def device_limit(self, address: Address) -> int:
+        """
+        Return the limit of outstanding requests to a device.
+        """
+        limit = self.device_limits.get(address, None)
+        if limit is not None:
+            return limit
+
+        if self.device_info_cache:
+            device_info = self.device_info_cache.address_cache.get(address, None)
+            if device_info and (
+                device_info.segmentation_supported == Segmentation.noSegmentation
+            ):
+                return 1
+
+        return self.max_device_requests
+
+    def available(self, address: Address) -> bool:
+        """
+        Return True if a request to the address is not over any of the limits.
+        """
+        if self.max_requests and (self.outstanding >= self.max_requests):
+            return False
+
+        limit = self.device_limit(address)
+        if limit and (self.device_outstanding.get(address, 0) >= limit):
+            return False
+
+        if address.addrType == Address.remoteStationAddr:
+            limit = self.network_limits.get(address.addrNet, self.max_network_requests)
+            if limit and (self.network_outstanding.get(address.addrNet, 0) >= limit):
+                return False
+
+        return True
+
+    def submit(self, apdu: APDU, future: APDUFuture) -> bool:
+        """
+        Return True if the request can be sent now, otherwise it waits to be
+        returned by release() when another one completes.
+        """
+        if _debug:
+            RequestScheduler._debug("submit %r", apdu)
+
+        pdu_destination = apdu.pduDestination
+        if self.available(pdu_destination):
+            self._send(apdu)
+            return True
+
+        # anything other than interactive is bulk
+        priority = request_priority.get()
+        if priority != PRIORITY_INTERACTIVE:
+            priority = PRIORITY_BULK
+
+        queue = self.queues[priority]
+        if pdu_destination not in queue:
+            queue[pdu_destination] = deque()
+        queue[pdu_destination].append((apdu, future))
+
+        self._waiting += 1
+        self.queued += 1
+        self.max_waiting = max(self.max_waiting, self._waiting)
+        if _debug:
+            RequestScheduler._debug("    - waiting: %r", self._waiting)
+
+        return False
+
+    def _send(self, apdu: APDU) -> None:
+        pdu_destination = apdu.pduDestination
+        self._sent[id(apdu)] = pdu_destination
+
+        self.outstanding += 1
+        self.device_outstanding[pdu_destination] = (
+            self.device_outstanding.get(pdu_destination, 0) + 1
+        )
+        if pdu_destination.addrType == Address.remoteStationAddr:
+            self.network_outstanding[pdu_destination.addrNet] = (
+                self.network_outstanding.get(pdu_destination.addrNet, 0) + 1
+            )
+
+    def release(self, apdu: APDU) -> List[Tuple[APDU, APDUFuture]]:
+        """
+        The request has completed or was canceled, return the list of waiting
+        requests that can now be sent.
+        """
+        if _debug:
+            RequestScheduler._debug("release %r", apdu)
+
+        pdu_destination = self._sent.pop(id(apdu), None)
+        if pdu_destination is None:
+            # canceled while it was waiting
+            for queue in self.queues:
+                requests = queue.get(apdu.pduDestination, None)
+                if not requests:
+                    continue
+                for indx, (pdu, fut) in enumerate(requests):
+                    if pdu is apdu:
+                        del requests[indx]
+                        self._waiting -= 1
+                        if not requests:
+                            del queue[apdu.pduDestination]
+                        return []
+            return []
+
+        self.outstanding -= 1
+        count = self.device_outstanding[pdu_destination] - 1
+        if count:
+            self.device_outstanding[pdu_destination] = count
+        else:
+            del self.device_outstanding[pdu_destination]
+        if pdu_destination.addrType == Address.remoteStationAddr:
+            count = self.network_outstanding[pdu_destination.addrNet] - 1
+            if count:
+                self.network_outstanding[pdu_destination.addrNet] = count
+            else:
+                del self.network_outstanding[pdu_destination.addrNet]
+
+        next_requests: List[Tuple[APDU, APDUFuture]] = []
+        while self._waiting:
+            next_request = self._next_request()
+            if not next_request:
+                break
+            next_requests.append(next_request)
+        if _debug:
+            RequestScheduler._debug("    - next_requests: %r", next_requests)
+
+        return next_requests
+
+    def _next_request(self) -> Optional[Tuple[APDU, APDUFuture]]:
+        """
+        Return the next waiting request that can be sent.  The destination
+        it came from goes to the end of the line.
+        """
+        for queue in self.queues:
+            for pdu_destination, requests in queue.items():
+                if self.available(pdu_destination):
+                    break
+            else:
+                continue
+
+            apdu, future = requests.popleft()
+            if requests:
+                queue.move_to_end(pdu_destination)
+            else:
+                del queue[pdu_destination]
+            self._waiting -= 1
+
+            self._send(apdu)
+            return (apdu, future)
+
+        return None
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Return the number of requests outstanding and waiting.
+        """
+        return {
+            "outstanding": self.outstanding,
+            "waiting": self._waiting,
+            "waiting_interactive": sum(
+                len(requests) for requests in self.queues[PRIORITY_INTERACTIVE].values()
+            ),
+            "waiting_bulk": sum(
+                len(requests) for requests in self.queues[PRIORITY_BULK].values()
+            ),
+            "waiting_devices": len(
+                set(self.queues[PRIORITY_INTERACTIVE]) | set(self.queues[PRIORITY_BULK])
+            ),
+            "queued": self.queued,
+            "max_waiting": self.max_waiting,
+        }
+
+
+#
+#   SingleFlight
+#
+
+
+@bacpypes_debugging
+class SingleFlight(DebugContents):
+    """
+    The read requests that are outstanding, keyed by the destination, the
+    service and the encoded service parameters, so an identical request
+    shares the response rather than being sent again.  Each request gets
+    its own future, the one that was sent is canceled when all of them
+    have been canceled.
+    """
+
+    _debug_contents = ("flights", "requests", "hits")
+    _debug: Callable[..., None]
+
+    flights: Dict[SingleFlightKey, Tuple[APDUFuture, List[APDUFuture]]]
+
+    def __init__(self) -> None:
+        if _debug:
+            SingleFlight._debug("__init__")
+
+        self.flights = {}
+
+        # counters
+        self.requests = 0
+        self.hits = 0
+
+    def request_key(self, apdu: APDU) -> Optional[SingleFlightKey]:
+        """
+        Return the key for an encoded request or None if it is not a read.
+        """
+        if (type(apdu) is not ConfirmedRequestPDU) or (
+            apdu.apduService not in single_flight_services
+        ):
+            return None
+
+        return (apdu.pduDestination, apdu.apduService, bytes(apdu.pduData))
+
+    def follow(self, key: SingleFlightKey) -> Optional[APDUFuture]:
+        """
+        Return a future for the response to an identical request that is
+        already outstanding, or None if there isn't one.
+        """
+        self.requests += 1
+
+        flight = self.flights.get(key, None)
+        if flight is None:
+            return None
+        if _debug:
+            SingleFlight._debug("follow %r", key)
+
+        self.hits += 1
+        return self._follower(key, flight)
+
+    def start(self, key: SingleFlightKey, future: APDUFuture) -> APDUFuture:
+        """
+        The request has been sent and the future will have its response,
+        return a future for the caller.
+        """
+        if _debug:
+            SingleFlight._debug("start %r", key)
+
+        flight: Tuple[APDUFuture, List[APDUFuture]] = (future, [])
+        self.flights[key] = flight
+        future.add_done_callback(partial(self._flight_done, key))
+
+        return self._follower(key, flight)
+
+    def _follower(
+        self, key: SingleFlightKey, flight: Tuple[APDUFuture, List[APDUFuture]]
+    ) -> APDUFuture:
+        follower = APDUFuture()
+        follower.add_done_callback(partial(self._follower_done, key))
+        flight[1].append(follower)
+
+        return follower
+
+    def _flight_done(self, key: SingleFlightKey, future: APDUFuture) -> None:
+        """
+        The response has been received, pass it along to all of the
+        requests that are still waiting for it.
+        """
+        if _debug:
+            SingleFlight._debug("_flight_done %r", key)
+
+        flight = self.flights.get(key, None)
+        if (flight is None) or (flight[0] is not future):
+            return
+        del self.flights[key]
+
+        for follower in flight[1]:
+            if follower.done():
+                continue
+            if future.cancelled():
+                follower.cancel()
+            elif future.exception():
+                follower.set_exception(future.exception())
+            else:
+                follower.set_result(future.result())
+
+    def _follower_done(self, key: SingleFlightKey, follower: APDUFuture) -> None:
+        """
+        When all of the requests have been canceled there is no point
+        in waiting for the response.
+        """
+        if not follower.cancelled():
+            return
+
+        flight = self.flights.get(key, None)
+        if flight and all(follower.cancelled() for follower in flight[1]):
+            if _debug:
+                SingleFlight._debug("    - all canceled: %r", key)
+            flight[0].cancel()
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Return the number of read requests, how many of them shared a
+        response, and the number outstanding.
+        """
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "in_flight": len(self.flights),
+        }
+
+
+#
+#   RequestExecutor
+#
+
+
+@bacpypes_debugging
+class RequestExecutor(DebugContents):
+    """
+    Limit the number of incoming confirmed requests that are being processed
+    at the same time, the ones that arrive when the limit has been reached
+    wait in a bounded queue.  When the queue is full the request is aborted
+    with out-of-resources or dropped, depending on the policy.
+    """
+
+    _debug_contents = ("max_workers", "max_queue", "policy", "running", "waiting")
+    _debug: Callable[..., None]
+
+    max_workers: int
+    max_queue: int
+    policy: str
+    running: int
+    waiting: Deque[asyncio.Future]
+
+    def __init__(self, max_workers: int, max_queue: int = 0, policy="abort") -> None:
+        if _debug:
+            RequestExecutor._debug("__init__ %r %r %r", max_workers, max_queue, policy)
+        if policy not in ("abort", "drop"):
+            raise ValueError("policy: abort or drop")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.policy = policy
+
+        self.running = 0
+        self.waiting = deque()
+
+        # counters
+        self.executed = 0
+        self.aborted = 0
+        self.dropped = 0
+        self.max_waiting = 0
+
+        # seconds waiting in the queue and running
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.run_time = 0.0
+        self.max_run_time = 0.0
+
+    async def run(self, fn: Callable[[APDU], _Any], apdu: APDU) -> bool:
+        """
+        Wait for a turn and run the helper function with the request.
+        Return False if the request was dropped, raise OutOfResources if
+        it should be aborted.
+        """
+        if _debug:
+            RequestExecutor._debug("run %r %r", fn, apdu)
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        if (self.running >= self.max_workers) or self.waiting:
+            if len(self.waiting) >= self.max_queue:
+                if _debug:
+                    RequestExecutor._debug("    - queue full")
+                if self.policy == "drop":
+                    self.dropped += 1
+                    return False
+                self.aborted += 1
+                raise OutOfResources()
+
+            # wait for one of the running requests to hand over its turn
+            future = loop.create_future()
+            self.waiting.append(future)
+            self.max_waiting = max(self.max_waiting, len(self.waiting))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future in self.waiting:
+                    self.waiting.remove(future)
+                else:
+                    self.running -= 1
+                    self._release()
+                raise
+        else:
+            self.running += 1
+
+        wait_time = loop.time() - start_time
+        self.wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        try:
+            await fn(apdu)
+        finally:
+            run_time = loop.time() - start_time - wait_time
+            self.run_time += run_time
+            self.max_run_time = max(self.max_run_time, run_time)
+            self.executed += 1
+
+            self.running -= 1
+            self._release()
+
+        return True
+
+    def _release(self) -> None:
+        """
+        Give the next waiting request a turn, it is counted as running
+        until it has finished.
+        """
+        while self.waiting and (self.running < self.max_workers):
+            future = self.waiting.popleft()
+            if not future.done():
+                self.running += 1
+                future.set_result(None)
+                break
+
+    def metrics(self) -> Dict[str, _Any]:
+        """
+        Return the number of requests running and waiting, the counters,
+        and the average and maximum seconds the requests waited and ran.
+        """
+        return {
+            "running": self.running,
+            "waiting": len(self.waiting),
+            "max_waiting": self.max_waiting,
+            "executed": self.executed,
+            "aborted": self.aborted,
+            "dropped": self.dropped,
+            "wait_time": (self.wait_time / self.executed) if self.executed else 0.0,
+            "max_wait_time": self.max_wait_time,
+            "run_time": (self.run_time / self.executed) if self.executed else 0.0,
+            "max_run_time": self.max_run_time,
+        }
+
 
 #
 #   Application
@@ -299,7 +1027,11 @@ class Application(
     link_layers: Dict[ObjectIdentifier, _Any]
 
     next_invoke_id: int
-    _requests: Dict[Address, List[Tuple[APDU, APDUFuture]]]
+    _requests: Dict[Address, InvokeIDPool]
+    request_scheduler: Optional[RequestScheduler]
+    read_property_coalescer: Optional[ReadPropertyCoalescer]
+    single_flight: Optional[SingleFlight]
+    request_executor: Optional[RequestExecutor]
 
     def __init__(
         self, *args, device_info_cache: Optional[DeviceInfoCache] = None, **kwargs
@@ -324,6 +1056,42 @@ class Application(
         self.next_invoke_id = 0
         self._requests = {}
 
+        # limit the number of outstanding requests
+        if settings.request_scheduler:
+            self.request_scheduler = RequestScheduler(
+                max_requests=settings.request_limit,
+                max_device_requests=settings.device_request_limit,
+                max_network_requests=settings.network_request_limit,
+                device_info_cache=self.device_info_cache,
+            )
+        else:
+            self.request_scheduler = None
+
+        # gather concurrent reads into read property multiple requests, the
+        # window is in milliseconds
+        if settings.read_coalescing:
+            self.read_property_coalescer = ReadPropertyCoalescer(
+                self, window=settings.read_coalescing_window / 1000.0
+            )
+        else:
+            self.read_property_coalescer = None
+
+        # identical reads share a response
+        if settings.single_flight:
+            self.single_flight = SingleFlight()
+        else:
+            self.single_flight = None
+
+        # limit the incoming requests being processed at the same time
+        if settings.server_workers:
+            self.request_executor = RequestExecutor(
+                max_workers=settings.server_workers,
+                max_queue=settings.server_queue,
+                policy=settings.server_overload,
+            )
+        else:
+            self.request_executor = None
+
         # other services
         ChangeOfValueServices.__init__(self)
 
@@ -1042,6 +1810,9 @@ class Application(
         if _debug:
             Application._debug("close")
 
+        if self.read_property_coalescer:
+            self.read_property_coalescer.close()
+
         for link_layer in self.link_layers.values():
             if _debug:
                 Application._debug("    - link_layer: %r", link_layer)
@@ -1059,7 +1830,16 @@ class Application(
         it will be reassigned to a new one if there is already an outstanding
         request with the same one.
 
-        There is no throttling of the number of outstanding requests.
+        The invoke IDs are allocated for each destination, when all 256 of
+        them are being used the request is not sent until one is released.
+
+        If there is a request scheduler the number of outstanding requests
+        is limited and the request may wait for others to complete, the
+        priority class of the request comes from the request_priority
+        context variable.
+
+        If single flight is enabled, a read request that is identical to one
+        that is outstanding is not sent, it shares the response.
         """
         if _debug:
             Application._debug("request %r", apdu)
@@ -1069,41 +1849,83 @@ class Application(
         if isinstance(apdu, UnconfirmedRequestPDU):
             future.set_result(None)
 
-        elif isinstance(apdu, ConfirmedRequestPDU):
-            pdu_destination = apdu.pduDestination
-            assert pdu_destination
-
-            # make sure the invoke ID is set
-            if apdu.apduInvokeID is None:
-                apdu.apduInvokeID = self.next_invoke_id
-                self.next_invoke_id = (self.next_invoke_id + 1) % 256
-
-            # check to see if there are any requests for this destination
-            if pdu_destination in self._requests:
-                # make sure the invoke ID isn't already being used
-                used_invoke_ids: Set[int] = set(
-                    pdu.apduInvokeID for pdu, fut in self._requests[pdu_destination]
-                )
-                while apdu.apduInvokeID in used_invoke_ids:
-                    apdu.apduInvokeID = self.next_invoke_id
-                    self.next_invoke_id = (self.next_invoke_id + 1) % 256
+            # send it
+            self._send_apdu(apdu)
 
-                self._requests[pdu_destination].append((apdu, future))
-            else:
-                self._requests[pdu_destination] = [(apdu, future)]
-            if _debug:
-                Application._debug("    - _requests: %r", self._requests)
+        elif isinstance(apdu, ConfirmedRequestPDU):
+            assert apdu.pduDestination
+
+            # share the response of an identical read, the request is encoded
+            # for the key and the encoded request is the one that is sent
+            single_flight_key = None
+            if self.single_flight:
+                if isinstance(apdu, single_flight_request_types):
+                    apdu = apdu.encode()
+                single_flight_key = self.single_flight.request_key(apdu)
+                if single_flight_key is not None:
+                    follower = self.single_flight.follow(single_flight_key)
+                    if follower:
+                        if _debug:
+                            Application._debug("    - already in flight")
+                        return follower
 
             # add a callback in case the request is canceled (timeout)
             future.add_done_callback(partial(self._request_done, apdu))
+
+            # the scheduler may hold on to it until others complete
+            if self.request_scheduler and not self.request_scheduler.submit(
+                apdu, future
+            ):
+                if _debug:
+                    Application._debug("    - waiting to be scheduled")
+            else:
+                self._send_request(apdu, future)
+
+            if single_flight_key is not None:
+                return self.single_flight.start(single_flight_key, future)
         else:
             raise TypeError("APDU expected")
 
-        # create a task to send it
-        asyncio.create_task(ApplicationServiceElement.request(self, apdu))
-
         return future
 
+    def _send_request(self, apdu: APDU, future: APDUFuture) -> None:
+        """
+        Give the confirmed request an invoke ID and send it.
+        """
+        if _debug:
+            Application._debug("_send_request %r", apdu)
+
+        # get the invoke IDs for this destination, new pools start at
+        # different places so the IDs are spread out like they would
+        # be from a single counter
+        pdu_destination = apdu.pduDestination
+        invoke_id_pool = self._requests.get(pdu_destination, None)
+        if invoke_id_pool is None:
+            invoke_id_pool = InvokeIDPool(self.next_invoke_id)
+            self.next_invoke_id = (self.next_invoke_id + 1) % 256
+            self._requests[pdu_destination] = invoke_id_pool
+
+        # make sure the invoke ID is set and isn't already being used
+        if not invoke_id_pool.allocate(apdu, future):
+            if _debug:
+                Application._debug("    - waiting for an invoke ID")
+            return
+        if _debug:
+            Application._debug("    - invoke ID: %r", apdu.apduInvokeID)
+
+        # send it
+        self._send_apdu(apdu)
+
+    def _send_apdu(self, apdu: APDU) -> None:
+        """
+        Send the request down the stack.  This function is not a coroutine
+        so callers do not wait for it, a task is created to send it.
+        """
+        if _debug:
+            Application._debug("_send_apdu %r", apdu)
+
+        asyncio.create_task(ApplicationServiceElement.request(self, apdu))
+
     def _request_done(self, apdu, future) -> None:
         """
         This function is called when the future that was created for sending
@@ -1115,28 +1937,34 @@ class Application(
         # the apdu is a reference to the original request
         pdu_destination = apdu.pduDestination
 
+        # let the scheduler know, it may have others ready to go
+        next_requests = []
+        if self.request_scheduler:
+            next_requests = self.request_scheduler.release(apdu)
+
         # check to see if there are any requests for this destination
-        if pdu_destination not in self._requests:
+        invoke_id_pool = self._requests.get(pdu_destination, None)
+        if invoke_id_pool is None:
             if _debug:
                 Application._debug("    - not in _requests")
-            return
-
-        # find the apdu in the list
-        requests = self._requests[pdu_destination]
-        for indx, (pdu, fut) in enumerate(requests):
-            if apdu is pdu:
-                del requests[indx]
-                break
         else:
+            # release the invoke ID, maybe to a request that was waiting
+            next_request = invoke_id_pool.release(apdu)
             if _debug:
-                Application._debug("    - not in _requests for source")
-            return
+                Application._debug("    - removed from _requests")
 
-        # see if the list is empty
-        if not requests:
-            del self._requests[pdu_destination]
-        if _debug:
-            Application._debug("    - removed from _requests")
+            # see if the pool is empty
+            if not (invoke_id_pool.requests or invoke_id_pool.pending):
+                del self._requests[pdu_destination]
+
+            if next_request:
+                if _debug:
+                    Application._debug("    - next request: %r", next_request[0])
+                self._send_apdu(next_request[0])
+
+        # send the requests the scheduler released
+        for next_apdu, next_future in next_requests:
+            self._send_request(next_apdu, next_future)
 
     async def indication(self, apdu) -> None:  # type: ignore[override]
         """
@@ -1159,8 +1987,15 @@ class Application(
                     raise UnrecognizedService("no function %s" % (helperName,))
                 return
 
-            # pass the apdu on to the helper function
-            await helperFn(apdu)
+            # pass the apdu on to the helper function, confirmed requests
+            # might have to wait their turn
+            if self.request_executor and isinstance(apdu, ConfirmedRequestPDU):
+                if not await self.request_executor.run(helperFn, apdu):
+                    if _debug:
+                        Application._debug("    - dropped")
+                    return
+            else:
+                await helperFn(apdu)
         except RejectException as err:
             if _debug:
                 Application._debug("    - reject exception: %r", err)
@@ -1169,7 +2004,14 @@ class Application(
         except AbortException as err:
             if _debug:
                 Application._debug("    - abort exception: %r", err)
-            error_pdu = AbortPDU(reason=err.abortReason, context=apdu)
+            error_pdu = AbortPDU(srv=True, reason=err.abortReason, context=apdu)
+
+        except ErrorRejectAbortNack as err:
+            # a complete response, like a WritePropertyMultipleError
+            if _debug:
+                Application._debug("    - error/reject/abort: %r", err)
+            err.set_context(apdu)
+            error_pdu = err
 
         except ExecutionError as err:
             if _debug:
@@ -1225,21 +2067,19 @@ class Application(
         assert apdu.pduSource
 
         # check to see if there are any requests for this address
-        pdu_source = apdu.pduSource
-        if pdu_source not in self._requests:
+        invoke_id_pool = self._requests.get(apdu.pduSource, None)
+        if invoke_id_pool is None:
             if _debug:
                 Application._debug("   - no requests")
             return
 
         # look for a matching invoke ID
-        requests = self._requests[pdu_source]
-        for indx, (request, future) in enumerate(requests):
-            if request.apduInvokeID == apdu.apduInvokeID:
-                break
-        else:
+        match = invoke_id_pool.requests.get(apdu.apduInvokeID, None)
+        if not match:
             if _debug:
                 Application._debug("   - no match")
             return
+        request, future = match
         if _debug:
             Application._debug("   - match: %s %s", str(request), str(future))
 
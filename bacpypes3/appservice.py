@@ -6,16 +6,21 @@ from __future__ import annotations
 
 import asyncio
 
+from collections import OrderedDict
+
 from typing import (
     Callable,
+    Dict,
     List,
     Optional,
     Tuple,
 )
 
+from .settings import settings
 from .debugging import ModuleLogger, DebugContents, bacpypes_debugging
 from .comm import Client, ServiceAccessPoint
 from .errors import CommuncationError
+from .timer import AnyTimerHandle, call_later
 
 from .pdu import Address, PDU
 from .basetypes import Segmentation
@@ -46,6 +51,18 @@ _log = ModuleLogger(globals())
 #   SSM - Segmentation State Machine
 #
 
+# transactions are indexed by the address of the peer and the invoke ID
+TransactionKey = Tuple[int, Optional[int], Optional[bytes], Optional[int]]
+
+
+def transaction_key(address: Address, invoke_id: Optional[int]) -> TransactionKey:
+    """
+    Return the key of a transaction, the routing information of the address
+    is not included so it matches the same way Address.__eq__() does.
+    """
+    return (address.addrType, address.addrNet, address.addrAddr, invoke_id)
+
+
 # transaction states
 IDLE = 0
 SEGMENTED_REQUEST = 1
@@ -56,6 +73,13 @@ SEGMENTED_CONFIRMATION = 5
 COMPLETED = 6
 ABORTED = 7
 
+# the largest window size that can be proposed
+MAX_WINDOW_SIZE = 127
+
+# the number of peers with window sizes that have been adapted that are
+# remembered, the ones that have not been used recently are forgotten
+WINDOW_SIZES_LENGTH = 256
+
 
 @bacpypes_debugging
 class SSM(DebugContents):
@@ -88,15 +112,19 @@ class SSM(DebugContents):
         "lastSequenceNumber",
         "initialSequenceNumber",
         "actualWindowSize",
+        "segmentLoss",
     )
 
     invokeID: Optional[int]
-    _timer_handle: Optional[asyncio.Handle]
+    _timer_handle: Optional[AnyTimerHandle]
 
     segmentState: int
     segmentAPDU: Optional[APDU]
+    segmentData: Optional[memoryview]
+    segmentChunks: List[bytearray]
     segmentSize: Optional[int]
     segmentCount: Optional[int]
+    segmentLoss: bool
 
     retryCount: Optional[int]
     segmentRetryCount: Optional[int]
@@ -122,8 +150,11 @@ class SSM(DebugContents):
 
         self.state = IDLE  # initial state
         self.segmentAPDU = None  # refers to request or response
+        self.segmentData = None  # encoded content being sent
+        self.segmentChunks = []  # content received
         self.segmentSize = None  # how big the pieces are
         self.segmentCount = None
+        self.segmentLoss = False  # segments had to be sent again
 
         self.retryCount = None
         self.segmentRetryCount = None
@@ -165,7 +196,7 @@ class SSM(DebugContents):
 
         # schedule a call to self.timer_expired()
         loop = asyncio.get_event_loop()
-        self._timer_handle = loop.call_later(msecs / 1000.0, self.timer_expired)
+        self._timer_handle = call_later(msecs / 1000.0, self.timer_expired, loop=loop)
         if _debug:
             SSM._debug("    - timer handle: %r", self._timer_handle)
 
@@ -237,6 +268,8 @@ class SSM(DebugContents):
 
         # set the context
         self.segmentAPDU = apdu
+        self.segmentData = None
+        self.segmentChunks = []
 
     def get_segment(self, indx: int) -> APDU:
         """
@@ -307,11 +340,9 @@ class SSM(DebugContents):
 
             # first segment sends proposed window size, rest get actual
             if indx == 0:
+                segAPDU.apduWin = self.window_size()
                 if _debug:
-                    SSM._debug(
-                        "    - proposedWindowSize: %r", self.ssmSAP.proposedWindowSize
-                    )
-                segAPDU.apduWin = self.ssmSAP.proposedWindowSize
+                    SSM._debug("    - proposed window size: %r", segAPDU.apduWin)
             else:
                 if _debug:
                     SSM._debug("    - actualWindowSize: %r", self.actualWindowSize)
@@ -322,19 +353,23 @@ class SSM(DebugContents):
             segAPDU.apduSeg = False
             segAPDU.apduMor = False
 
-        # add the content
+        # add the content, sliced out of one copy of the encoded content
+        # that is shared by all of the segments and their retransmissions
         assert self.segmentSize
+        if self.segmentData is None:
+            self.segmentData = memoryview(bytes(self.segmentAPDU.pduData))
 
         offset = indx * self.segmentSize
-        segAPDU.put_data(self.segmentAPDU.pduData[offset : offset + self.segmentSize])
+        segAPDU.put_data(self.segmentData[offset : offset + self.segmentSize])
 
         # success
         return segAPDU
 
     def append_segment(self, apdu: APDU) -> None:
         """
-        This function appends the apdu content to the end of the current
-        APDU being built.  The segmentAPDU is the context.
+        This function appends the apdu content to the content that has been
+        received so far, it is added to the current APDU being built by
+        join_segments().  The segmentAPDU is the context.
         """
         if _debug:
             SSM._debug("append_segment %r", apdu)
@@ -343,8 +378,58 @@ class SSM(DebugContents):
         if not self.segmentAPDU:
             raise RuntimeError("no segmentation context established")
 
-        # append the data
-        self.segmentAPDU.put_data(apdu.pduData)
+        # save the data
+        self.segmentChunks.append(apdu.pduData)
+
+    def join_segments(self) -> None:
+        """
+        This function is called when the last segment has been received,
+        the content of the segments is added to the end of the current APDU
+        being built all at once.
+        """
+        if _debug:
+            SSM._debug("join_segments")
+
+        # check for no context
+        if not self.segmentAPDU:
+            raise RuntimeError("no segmentation context established")
+
+        self.segmentAPDU.put_data(b"".join(self.segmentChunks))
+        self.segmentChunks = []
+
+    def window_size(self) -> int:
+        """
+        Return the window size to propose to the peer.
+        """
+        return self.ssmSAP.windowSizes.get(
+            self.pdu_address, self.ssmSAP.proposedWindowSize
+        )
+
+    def adapt_window_size(self, max_segments: Optional[int] = None) -> None:
+        """
+        This function is called when a segmented message has been sent, the
+        window size proposed to the peer the next time is doubled if none
+        of the segments had to be sent again and halved if they did.  It is
+        no larger than the number of segments the peer accepts.
+        """
+        window_size = self.window_size()
+        if self.segmentLoss:
+            window_size = max(1, window_size // 2)
+        else:
+            window_size = min(MAX_WINDOW_SIZE, window_size * 2)
+            if max_segments:
+                window_size = max(1, min(window_size, max_segments))
+        if _debug:
+            SSM._debug("adapt_window_size %r: %r", self.segmentLoss, window_size)
+
+        window_sizes = self.ssmSAP.windowSizes
+        if window_size == self.ssmSAP.proposedWindowSize:
+            window_sizes.pop(self.pdu_address, None)
+        else:
+            window_sizes[self.pdu_address] = window_size
+            window_sizes.move_to_end(self.pdu_address)
+            while len(window_sizes) > WINDOW_SIZES_LENGTH:
+                window_sizes.popitem(last=False)
 
     def in_window(self, seqA: int, seqB: int) -> bool:
         if _debug:
@@ -395,6 +480,9 @@ class ClientSSM(SSM):
         # initialize the retry count
         self.retryCount = 0
 
+        # when an unsegmented request was sent to measure the round trip time
+        self.requestTime: Optional[float] = None
+
     def set_state(self, newState: int, timer: int = 0) -> None:
         """This function is called when the client wants to change state."""
         if _debug:
@@ -412,7 +500,9 @@ class ClientSSM(SSM):
         if (newState == COMPLETED) or (newState == ABORTED):
             if _debug:
                 ClientSSM._debug("    - remove from active transactions")
-            self.ssmSAP.clientTransactions.remove(self)
+            key = transaction_key(self.pdu_address, self.invokeID)
+            if self.ssmSAP.clientTransactions.get(key) is self:
+                del self.ssmSAP.clientTransactions[key]
 
     async def request(self, apdu: APDU) -> None:
         """This function is called by client transaction functions when it wants
@@ -447,6 +537,12 @@ class ClientSSM(SSM):
         if _debug:
             ClientSSM._debug("    - device_info: %r", self.device_info)
 
+        # use the timeout that has been adapted to the server
+        if settings.adaptive_timeout and self.device_info:
+            self.apduTimeout = self.device_info.apdu_timeout(self.apduTimeout)
+            if _debug:
+                ClientSSM._debug("    - adaptive timeout: %r", self.apduTimeout)
+
         # if the max apdu length of the server isn't known, assume that it
         # is the same size as our own and will be the segment size
         if (not self.device_info) or (
@@ -538,14 +634,17 @@ class ClientSSM(SSM):
             # unsegmented
             self.sentAllSegments = True
             self.retryCount = 0
+            self.requestTime = asyncio.get_event_loop().time()
             self.set_state(AWAIT_CONFIRMATION, self.apduTimeout)
         else:
             # segmented
+            self.requestTime = None
             self.sentAllSegments = False
             self.retryCount = 0
             self.segmentRetryCount = 0
             self.initialSequenceNumber = 0
             self.actualWindowSize = None  # segment ack will set value
+            self.segmentLoss = False
             self.set_state(SEGMENTED_REQUEST, self.segmentTimeout)
 
         # deliver to the device
@@ -655,6 +754,10 @@ class ClientSSM(SSM):
             # actual window size is provided by server
             self.actualWindowSize = apdu.apduWin
 
+            # server is asking for segments again
+            if apdu.apduNak:
+                self.segmentLoss = True
+
             # duplicate ack received?
             if not self.in_window(apdu.apduSeq, self.initialSequenceNumber):
                 if _debug:
@@ -665,6 +768,9 @@ class ClientSSM(SSM):
             elif self.sentAllSegments:
                 if _debug:
                     ClientSSM._debug("    - all done sending request")
+                self.adapt_window_size(
+                    self.device_info.max_segments_accepted if self.device_info else None
+                )
                 self.set_state(AWAIT_CONFIRMATION, self.apduTimeout)
 
             # more segments to send
@@ -741,6 +847,7 @@ class ClientSSM(SSM):
                 ClientSSM._debug("    - retry segmented request")
 
             self.segmentRetryCount += 1
+            self.segmentLoss = True
             self.start_timer(self.segmentTimeout)
 
             if self.initialSequenceNumber == 0:
@@ -751,6 +858,9 @@ class ClientSSM(SSM):
             if _debug:
                 ClientSSM._debug("    - abort, no response from the device")
 
+            self.segmentLoss = True
+            self.adapt_window_size()
+
             abort = self.abort(AbortReason.noResponse)
             await self.response(abort)
 
@@ -758,6 +868,15 @@ class ClientSSM(SSM):
         if _debug:
             ClientSSM._debug("await_confirmation %r", apdu)
 
+        # measure the round trip time of requests that were not sent again,
+        # the response could be to any one of them
+        if (self.requestTime is not None) and self.device_info:
+            if self.retryCount == 0:
+                self.device_info.rtt_sample(
+                    (asyncio.get_event_loop().time() - self.requestTime) * 1000.0
+                )
+            self.requestTime = None
+
         if apdu.apduType == AbortPDU.pduType:
             if _debug:
                 ClientSSM._debug("    - server aborted")
@@ -842,6 +961,10 @@ class ClientSSM(SSM):
         if _debug:
             ClientSSM._debug("await_confirmation_timeout")
 
+        # wait longer for the next one
+        if settings.adaptive_timeout and self.device_info:
+            self.device_info.rtt_timeout()
+
         if self.retryCount < self.numberOfApduRetries:
             if _debug:
                 ClientSSM._debug(
@@ -920,6 +1043,7 @@ class ClientSSM(SSM):
             )
             await self.request(segack)
 
+            self.join_segments()
             self.set_state(COMPLETED)
             await self.response(self.segmentAPDU)
 
@@ -982,7 +1106,9 @@ class ServerSSM(SSM):
         if (newState == COMPLETED) or (newState == ABORTED):
             if _debug:
                 ServerSSM._debug("    - remove from active transactions")
-            self.ssmSAP.serverTransactions.remove(self)
+            key = transaction_key(self.pdu_address, self.invokeID)
+            if self.ssmSAP.serverTransactions.get(key) is self:
+                del self.ssmSAP.serverTransactions[key]
 
     async def request(self, apdu):
         """This function is called by transaction functions to send
@@ -1149,6 +1275,7 @@ class ServerSSM(SSM):
             self.segmentRetryCount = 0
             self.initialSequenceNumber = 0
             self.actualWindowSize = None
+            self.segmentLoss = False
 
             # send out the first segment (or the whole thing)
             if self.segmentCount == 1:
@@ -1388,6 +1515,7 @@ class ServerSSM(SSM):
             await self.response(segack)
 
             # forward the whole thing to the application
+            self.join_segments()
             self.set_state(AWAIT_RESPONSE, self.ssmSAP.applicationTimeout)
             await self.request(self.segmentAPDU)
 
@@ -1461,6 +1589,10 @@ class ServerSSM(SSM):
             # actual window size is provided by client
             self.actualWindowSize = apdu.apduWin
 
+            # client is asking for segments again
+            if apdu.apduNak:
+                self.segmentLoss = True
+
             # duplicate ack received?
             if not self.in_window(apdu.apduSeq, self.initialSequenceNumber):
                 if _debug:
@@ -1471,6 +1603,7 @@ class ServerSSM(SSM):
             elif self.sentAllSegments:
                 if _debug:
                     ServerSSM._debug("    - all done sending response")
+                self.adapt_window_size(self.maxSegmentsAccepted)
                 self.set_state(COMPLETED)
 
             else:
@@ -1498,10 +1631,13 @@ class ServerSSM(SSM):
         # try again
         if self.segmentRetryCount < self.numberOfApduRetries:
             self.segmentRetryCount += 1
+            self.segmentLoss = True
             self.start_timer(self.segmentTimeout)
             await self.fill_window(self.initialSequenceNumber)
         else:
             # give up
+            self.segmentLoss = True
+            self.adapt_window_size()
             self.set_state(ABORTED)
 
 
@@ -1514,8 +1650,8 @@ class ServerSSM(SSM):
 class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
     _debug: Callable[..., None]
 
-    clientTransactions: List[ClientSSM]
-    serverTransactions: List[ServerSSM]
+    clientTransactions: Dict[TransactionKey, ClientSSM]
+    serverTransactions: Dict[TransactionKey, ServerSSM]
 
     def __init__(
         self, device_object=None, device_info_cache=None, sap=None, cid=None
@@ -1539,8 +1675,8 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         self.device_info_cache = device_info_cache
 
         # running state machines
-        self.clientTransactions = []
-        self.serverTransactions = []
+        self.clientTransactions = {}
+        self.serverTransactions = {}
 
         # confirmed request defaults
         self.numberOfApduRetries = 3
@@ -1553,9 +1689,15 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         self.maxSegmentsAccepted = 2
         self.proposedWindowSize = 2
 
+        # window sizes adapted to the peers, see SSM.adapt_window_size()
+        self.windowSizes: OrderedDict[Address, int] = OrderedDict()
+
         # device communication control
         self.dccEnableDisable = "enable"
 
+        # decode the parameters of unconfirmed requests when they are referenced
+        self.lazyDecoding = settings.lazy_decoding
+
         # how long the state machine is willing to wait for the application
         # layer to form a response and send it
         self.applicationTimeout = 3000
@@ -1624,17 +1766,15 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         # confirmed requests need a ServerSSM
         if isinstance(apdu, ConfirmedRequestPDU):
             # find duplicates of this request
-            for tr in self.serverTransactions:
-                if (apdu.apduInvokeID == tr.invokeID) and (
-                    apdu.pduSource == tr.pdu_address
-                ):
-                    break
-            else:
+            key = transaction_key(apdu.pduSource, apdu.apduInvokeID)
+            tr = self.serverTransactions.get(key, None)
+            if tr is None:
                 # build a server transaction
                 tr = ServerSSM(self, apdu.pduSource)
+                tr.invokeID = apdu.apduInvokeID
 
                 # add it to our transactions to track it
-                self.serverTransactions.append(tr)
+                self.serverTransactions[key] = tr
 
             # let it run with the apdu
             await tr.indication(apdu)
@@ -1642,7 +1782,7 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         elif isinstance(apdu, UnconfirmedRequestPDU):
             # decode this now, the APDU is complete
             try:
-                apdu = APCISequence.decode(apdu)
+                apdu = APCISequence.decode(apdu, lazy=self.lazyDecoding)
                 if _debug:
                     ApplicationServiceAccessPoint._debug("    - apdu: %r", apdu)
             except AttributeError as err:
@@ -1662,12 +1802,10 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
             or isinstance(apdu, RejectPDU)
         ):
             # find the client transaction this is acking
-            for tr in self.clientTransactions:
-                if (apdu.apduInvokeID == tr.invokeID) and (
-                    apdu.pduSource == tr.pdu_address
-                ):
-                    break
-            else:
+            tr = self.clientTransactions.get(
+                transaction_key(apdu.pduSource, apdu.apduInvokeID), None
+            )
+            if tr is None:
                 return
 
             # send the packet on to the transaction
@@ -1676,23 +1814,19 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         elif isinstance(apdu, AbortPDU):
             # find the transaction being aborted
             if apdu.apduSrv:
-                for tr in self.clientTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.clientTransactions.get(
+                    transaction_key(apdu.pduSource, apdu.apduInvokeID), None
+                )
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
                 await tr.confirmation(apdu)
             else:
-                for tr in self.serverTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.serverTransactions.get(
+                    transaction_key(apdu.pduSource, apdu.apduInvokeID), None
+                )
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
@@ -1701,23 +1835,19 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         elif isinstance(apdu, SegmentAckPDU):
             # find the transaction being aborted
             if apdu.apduSrv:
-                for tr in self.clientTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.clientTransactions.get(
+                    transaction_key(apdu.pduSource, apdu.apduInvokeID), None
+                )
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
                 await tr.confirmation(apdu)
             else:
-                for tr in self.serverTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.serverTransactions.get(
+                    transaction_key(apdu.pduSource, apdu.apduInvokeID), None
+                )
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
@@ -1782,13 +1912,16 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
 
             # create a client transaction state machine
             tr = ClientSSM(self, apdu.pduDestination)
+            tr.invokeID = apdu.apduInvokeID
             if _debug:
                 ApplicationServiceAccessPoint._debug(
                     "    - client segmentation state machine: %r", tr
                 )
 
             # add it to our transactions to track it
-            self.clientTransactions.append(tr)
+            self.clientTransactions[
+                transaction_key(apdu.pduDestination, apdu.apduInvokeID)
+            ] = tr
 
             # let it run
             await tr.indication(apdu)
@@ -1861,12 +1994,10 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
                     ApplicationServiceAccessPoint._debug("    - encoded apdu: %r", apdu)
 
             # find the appropriate server transaction
-            for tr in self.serverTransactions:
-                if (apdu.apduInvokeID == tr.invokeID) and (
-                    apdu.pduDestination == tr.pdu_address
-                ):
-                    break
-            else:
+            tr = self.serverTransactions.get(
+                transaction_key(apdu.pduDestination, apdu.apduInvokeID), None
+            )
+            if tr is None:
                 return
 
             # pass control to the transaction
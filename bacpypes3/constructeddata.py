@@ -51,6 +51,64 @@ _list_type_signatures: Dict[FrozenSet[Tuple[str, _Any]], type] = {}
 _list_of_classes: Set[type] = set()
 
 
+# kinds of elements in a sequence encoding/decoding plan
+_CHOICE_ELEMENT = 1
+_LIST_ELEMENT = 2
+_ATOMIC_ELEMENT = 3
+_OTHER_ELEMENT = 4
+
+# an element plan is (attr, element, kind, context, optional, app_tags, plain)
+_ElementPlan = Tuple[str, type, int, Optional[int], bool, FrozenSet[int], bool]
+
+
+def _compile_plan(cls: type) -> Dict[str, _ElementPlan]:
+    """
+    Resolve the elements of a sequence class into what the encode() and
+    decode() functions need to know about each one so that it is not figured
+    out again for every instance.  An element is 'plain' when the
+    get_attribute() and set_attribute() class methods have not been
+    overridden so the value can be referenced directly.
+    """
+    plan: Dict[str, _ElementPlan] = {}
+
+    for attr, element in cls._elements.items():
+
+        app_tags: FrozenSet[int] = frozenset()
+        if issubclass(element, Choice):
+            kind = _CHOICE_ELEMENT
+        elif issubclass(element, ExtendedList):
+            kind = _LIST_ELEMENT
+        elif issubclass(element, Atomic):
+            kind = _ATOMIC_ELEMENT
+            app_tags = frozenset(
+                tag_number
+                for tag_number, app_class in enumerate(Tag._app_tag_class)
+                if app_class and issubclass(element, app_class)
+            )
+        else:
+            kind = _OTHER_ELEMENT
+
+        plain = (
+            getattr(element.get_attribute, "__func__", None)
+            is ElementInterface.get_attribute.__func__
+        ) and (
+            getattr(element.set_attribute, "__func__", None)
+            is ElementInterface.set_attribute.__func__
+        )
+
+        plan[attr] = (
+            attr,
+            element,
+            kind,
+            element._context,
+            bool(element._optional),
+            app_tags,
+            plain,
+        )
+
+    return plan
+
+
 @bacpypes_debugging
 class SequenceMetaclass(ElementMetaclass):
     """
@@ -197,6 +255,23 @@ class SequenceMetaclass(ElementMetaclass):
         setattr(metaclass, "_order", _order)
         setattr(metaclass, "_debug_contents", tuple(_debug_contents))
 
+        # elements that are implemented as properties are not initialized
+        setattr(
+            metaclass,
+            "_property_elements",
+            frozenset(
+                attr
+                for attr in _elements
+                if isinstance(inspect.getattr_static(metaclass, attr, None), property)
+            ),
+        )
+
+        # compile the encoding and decoding plan, choices use all of the
+        # elements and sequences use the ordered ones
+        _element_plans = _compile_plan(metaclass)
+        setattr(metaclass, "_element_plans", _element_plans)
+        setattr(metaclass, "_plan", tuple(_element_plans[attr] for attr in _order))
+
         # save this class as a known structure
         SequenceMetaclass._structures.add(metaclass)
 
@@ -247,6 +322,9 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
     _elements: Dict[str, _Any]
     _inits: Dict[str, _Any]
     _order: Tuple[str, ...]
+    _plan: Tuple[_ElementPlan, ...]
+    _element_plans: Dict[str, _ElementPlan]
+    _property_elements: FrozenSet[str]
 
     def __init__(
         self, arg: Union["Sequence", Dict[str, _Any], None] = None, **kwargs: _Any
@@ -310,14 +388,11 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
 
         # clear out the rest of the elements
         for attr in elements:
-            try:
-                # guard agaist elements defined as a property
-                if isinstance(inspect.getattr_static(self, attr), property):
-                    if _debug:
-                        Sequence._debug(f"    - {attr} is a property")
-                    continue
-            except AttributeError:
-                pass
+            # guard agaist elements defined as a property
+            if attr in self._property_elements:
+                if _debug:
+                    Sequence._debug(f"    - {attr} is a property")
+                continue
 
             super().__setattr__(attr, None)
             if _debug:
@@ -409,18 +484,19 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
         if self._context is not None:
             tag_list.append(OpeningTag(self._context))
 
-        for attr in self._order:
-            element = self._elements[attr]
-
+        for attr, element, _, _, optional, _, plain in self._plan:
             # ask the element to get the value
-            getattr_fn = partial(super().__getattribute__, attr)
-            value = element.get_attribute(getter=getattr_fn)
+            if plain:
+                value = object.__getattribute__(self, attr)
+            else:
+                getattr_fn = partial(super().__getattribute__, attr)
+                value = element.get_attribute(getter=getattr_fn)
             if _debug:
                 Sequence._debug(f"    - {attr}, {element}: {value}")
 
             # check for optional elements
             if value is None:
-                if not element._optional:
+                if not optional:
                     raise AttributeError(
                         f"{attr} is a required element of {self.__class__.__name__}"
                     )
@@ -468,9 +544,11 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
         # result is an instance of a subclass of Sequence
         result = cls()
 
+        # values can be set directly when __setattr__ is not overridden
+        plain_setattr = type(result).__setattr__ is Sequence.__setattr__
+
         # look for the elements in order
-        for attr in cls._order:
-            element = cls._elements[attr]
+        for attr, element, kind, context, optional, app_tags, plain in cls._plan:
             if _debug:
                 Sequence._debug(
                     "    - attr, element, tag: %r, %r, %r", attr, element, tag
@@ -481,22 +559,15 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
             # no tag or closing tag is the end of the encoded elements in
             # this sequence so all of the rest of the elements must be optional
             if (not tag) or (tag.tag_class == TagClass.closing):
-                if not element._optional:
+                if not optional:
                     raise AttributeError(
                         f"{attr} is a required element of {cls.__name__}"
                     )
                 else:
                     continue
 
-            # check for a choice of somethings
-            if issubclass(element, Choice):
-                value = element.decode(tag_list)
-                tag = tag_list.peek()
-                if _debug:
-                    Sequence._debug("    - next tag: %r", tag)
-
-            # check for a sequence of something else
-            elif issubclass(element, ExtendedList):
+            # check for a choice of somethings or a sequence of something else
+            if (kind == _CHOICE_ELEMENT) or (kind == _LIST_ELEMENT):
                 value = element.decode(tag_list)
                 tag = tag_list.peek()
                 if _debug:
@@ -504,41 +575,37 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
 
             # check for a specific context
             elif tag.tag_class == TagClass.context or tag.tag_class == TagClass.opening:
-                if tag.tag_number == element._context:
+                if tag.tag_number == context:
                     value = element.decode(tag_list)
                     tag = tag_list.peek()
                     if _debug:
                         Sequence._debug("    - next tag: %r", tag)
-                elif element._optional and element._context is None:
-                    # the element is optional but is not context encoded
+                elif optional and context is None:
+                    # the element is optional but is not context encoded,
+                    # remember where this started
+                    tag_list_index = tag_list.tell()
                     try:
-                        # make a copy of the tag list
-                        tag_list_copy = TagList(tag_list)
-
                         # decode that which can be decoded
-                        value = element.decode(tag_list_copy)
-
-                        # delete from this list the tags that were consumed
-                        del tag_list.tagList[
-                            : len(tag_list.tagList) - len(tag_list_copy.tagList)
-                        ]
+                        value = element.decode(tag_list)
                     except (AttributeError, InvalidTag):
+                        # put back the tags that were consumed
+                        tag_list.seek(tag_list_index)
                         continue
-                elif not element._optional:
+                elif not optional:
                     raise AttributeError(
-                        f"{attr} is a context tagged {element._context} required element of {cls.__name__}"
+                        f"{attr} is a context tagged {context} required element of {cls.__name__}"
                     )
                 else:
                     continue
 
             # application encoded atomic value
-            elif issubclass(element, Atomic):
-                if issubclass(element, Tag._app_tag_class[tag.tag_number]):
+            elif kind == _ATOMIC_ELEMENT:
+                if tag.tag_number in app_tags:
                     value = element.decode(tag_list)
                     tag = tag_list.peek()
                     if _debug:
                         Sequence._debug("    - next tag: %r", tag)
-                elif not element._optional:
+                elif not optional:
                     raise AttributeError(
                         f"{attr} is an application tagged required element of {cls.__name__}"
                     )
@@ -553,7 +620,7 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
                     if _debug:
                         Sequence._debug("    - next tag: %r", tag)
                 except InvalidTag:
-                    if not element._optional:
+                    if not optional:
                         raise AttributeError(
                             f"{attr} is a required element of {cls.__name__}"
                         )
@@ -562,6 +629,11 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
             if _debug:
                 Sequence._debug(f"    - {attr}, {element} := {value}")
 
+            # the decoded value is already the correct type
+            if plain and plain_setattr and (type(value) is element):
+                object.__setattr__(result, attr, value)
+                continue
+
             # ask the element to set the value
             getattr_fn = partial(result.__getattribute__, attr)
             setattr_fn = partial(result.__setattr__, attr)
@@ -828,7 +900,7 @@ class Choice(Sequence):
         result = cls()
 
         # look for a matching element
-        for attr, element in cls._elements.items():
+        for attr, element, kind, context, _, app_tags, _ in cls._element_plans.values():
             if _debug:
                 Choice._debug("    - attr, element: %r, %r", attr, element)
 
@@ -841,7 +913,7 @@ class Choice(Sequence):
 
             # check for a specific context
             if tag.tag_class == TagClass.context or tag.tag_class == TagClass.opening:
-                if tag.tag_number == element._context:
+                if tag.tag_number == context:
                     value = element.decode(tag_list)
                     tag = tag_list.peek()
                     if _debug:
@@ -850,8 +922,8 @@ class Choice(Sequence):
                     continue
 
             # application encoded atomic value
-            elif issubclass(element, Atomic):
-                if issubclass(element, Tag._app_tag_class[tag.tag_number]):
+            elif kind == _ATOMIC_ELEMENT:
+                if tag.tag_number in app_tags:
                     value = element.decode(tag_list)
                     tag = tag_list.peek()
                     if _debug:
@@ -859,18 +931,14 @@ class Choice(Sequence):
                 else:
                     continue
             else:
+                # remember where this started
+                tag_list_index = tag_list.tell()
                 try:
-                    # make a copy of the tag list
-                    tag_list_copy = TagList(tag_list)
-
                     # decode that which can be decoded
-                    value = element.decode(tag_list_copy)
-
-                    # delete from this list the tags that were consumed
-                    del tag_list.tagList[
-                        : len(tag_list.tagList) - len(tag_list_copy.tagList)
-                    ]
+                    value = element.decode(tag_list)
                 except (AttributeError, InvalidTag):
+                    # put back the tags that were consumed
+                    tag_list.seek(tag_list_index)
                     continue
 
             if _debug:
@@ -1145,20 +1213,16 @@ class ExtendedList(list, ElementInterface, metaclass=ExtendedListMetaclass):  #
             if tag.tag_class == TagClass.closing:
                 break
 
+            # remember where this started
+            tag_list_index = tag_list.tell()
             try:
-                # make a copy of the tag list
-                tag_list_copy = TagList(tag_list)
-
                 # decode that which can be decoded
-                value = cls._subtype.decode(tag_list_copy)  # type: ignore[attr-defined]
+                value = cls._subtype.decode(tag_list)  # type: ignore[attr-defined]
                 if _debug:
                     ExtendedList._debug("    - value: %r", value)
-
-                # delete from this list the tags that were consumed
-                del tag_list.tagList[
-                    : len(tag_list.tagList) - len(tag_list_copy.tagList)
-                ]
             except (AttributeError, InvalidTag):
+                # put back the tags that were consumed
+                tag_list.seek(tag_list_index)
                 break
 
             # append the value, peek at the next tag
@@ -1747,8 +1811,8 @@ class Any(Element):
         # look for the matching closing tag
         i = 1
         lvl = 0
-        while i < len(tag_list.tagList):
-            tag = tag_list.tagList[i]
+        while i < len(tag_list):
+            tag = tag_list[i]
             if tag.tag_class == TagClass.opening:
                 lvl += 1
             elif tag.tag_class == TagClass.closing:
@@ -1764,8 +1828,7 @@ class Any(Element):
             raise InvalidTag("mismatched open/close tags")
 
         # result is the list of tags
-        value = TagList(tag_list.tagList[: i + 1])
-        del tag_list.tagList[: i + 1]
+        value = TagList([tag_list.pop() for _ in range(min(i + 1, len(tag_list)))])
 
         return cls(value)
 
@@ -104,7 +104,7 @@ class LPCI(PCI, DebugContents):
         lpci.bvlciFunction = pdu.get()
         lpci.bvlciLength = pdu.get_short()
 
-        if lpci.bvlciLength != len(pdu.pduData) + 4:
+        if lpci.bvlciLength != pdu.remaining() + 4:
             raise DecodingError("invalid LPCI length")
 
         return lpci
@@ -483,7 +483,7 @@ class WriteBroadcastDistributionTable(LPDU):
 
         lpdu = WriteBroadcastDistributionTable()
         lpdu.bvlciBDT = []
-        while pdu.pduData:
+        while pdu.remaining():
             addr = socket.inet_ntoa(pdu.get_data(4))
             port = pdu.get_short()
             mask = _count_set_bits(pdu.get_long())
@@ -591,7 +591,7 @@ class ReadBroadcastDistributionTableAck(LPDU):
 
         lpdu = ReadBroadcastDistributionTableAck()
         lpdu.bvlciBDT = []
-        while pdu.pduData:
+        while pdu.remaining():
             addr = socket.inet_ntoa(pdu.get_data(4))
             port = pdu.get_short()
             mask = _count_set_bits(pdu.get_long())
@@ -660,7 +660,7 @@ class ForwardedNPDU(LPDU):
             ForwardedNPDU._debug("decode %r", pdu)
 
         addr = IPv4Address(pdu.get_data(6))
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return ForwardedNPDU(addr, data)
 
@@ -828,7 +828,7 @@ class ReadForeignDeviceTableAck(LPDU):
 
         lpdu = ReadForeignDeviceTableAck()
         lpdu.bvlciFDT = []
-        while pdu.pduData:
+        while pdu.remaining():
             fdte = FDTEntry()
             fdte.fdAddress = IPv4Address(pdu.get_data(6))
             fdte.fdTTL = pdu.get_short()
@@ -947,7 +947,7 @@ class DistributeBroadcastToNetwork(LPDU):
         if _debug:
             DistributeBroadcastToNetwork._debug("decode %r", pdu)
 
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return DistributeBroadcastToNetwork(data)
 
@@ -1012,7 +1012,7 @@ class OriginalUnicastNPDU(LPDU):
         if _debug:
             OriginalUnicastNPDU._debug("decode %r", pdu)
 
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return OriginalUnicastNPDU(data)
 
@@ -1077,7 +1077,7 @@ class OriginalBroadcastNPDU(LPDU):
         if _debug:
             OriginalBroadcastNPDU._debug("decode %r", pdu)
 
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return OriginalBroadcastNPDU(data)
 
@@ -6,11 +6,12 @@ from __future__ import annotations
 
 import asyncio
 from asyncio.exceptions import TimeoutError
-from typing import Callable, Dict, List, Optional, cast
+from typing import Callable, Dict, List, Optional, Union, cast
 
 from ..debugging import ModuleLogger, DebugContents, bacpypes_debugging
 from ..comm import Client, Server, ServiceAccessPoint, ApplicationServiceElement
 from ..pdu import Address, LocalBroadcast, IPv4Address, PDU
+from ..timer import AnyTimerHandle, call_later
 
 from .bvll import (
     LPDU,
@@ -853,7 +854,7 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
     bbmdBDT: List[IPv4Address]
     bbmdFDT: List[FDTEntry]
 
-    _fdt_clock_handle: asyncio.Handle
+    _fdt_clock_handle: Union[asyncio.Handle, AnyTimerHandle]
 
     def __init__(self, addr: IPv4Address, **kwargs):
         if _debug:
@@ -1210,7 +1211,7 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
                 del self.bbmdFDT[i]
 
         # again, again!
-        self._fdt_clock_handle = asyncio.get_event_loop().call_later(1, self.fdt_clock)
+        self._fdt_clock_handle = call_later(1, self.fdt_clock)
 
     def add_peer(self, addr: IPv4Address) -> None:
         if _debug:
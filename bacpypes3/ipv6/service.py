@@ -12,6 +12,7 @@ from ..debugging import ModuleLogger, DebugContents, bacpypes_debugging
 
 from ..comm import Client, Server, ServiceAccessPoint, ApplicationServiceElement
 from ..pdu import Address, LocalBroadcast, IPv6Address, VirtualAddress, PDU
+from ..timer import AnyTimerHandle, call_later
 
 from .bvll import (
     LPDU,
@@ -953,7 +954,7 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
     bbmdBDT: List[IPv6Address]
     bbmdFDT: List[FDTEntry]
 
-    _fdt_clock_handle: asyncio.TimerHandle
+    _fdt_clock_handle: Union[asyncio.Handle, AnyTimerHandle]
 
     def __init__(self, bbmd_address: IPv6Address, **kwargs):
         if _debug:
@@ -1505,7 +1506,7 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
                 del self.bbmdFDT[i]
 
         # again, again!
-        self._fdt_clock_handle = asyncio.get_event_loop().call_later(1, self.fdt_clock)
+        self._fdt_clock_handle = call_later(1, self.fdt_clock)
 
     def add_peer(self, addr: IPv6Address) -> None:
         if _debug:
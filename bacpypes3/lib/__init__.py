@@ -3,3 +3,5 @@
 #
 
 from . import batchread
+from . import columns
+from . import batchwrite
@@ -22,7 +22,7 @@ from ..basetypes import (
     ServicesSupported,
 )
 from ..apdu import ErrorRejectAbortNack
-from ..app import Application
+from ..app import PRIORITY_BULK, Application, request_priority
 
 
 # some debugging
@@ -353,7 +353,8 @@ class BatchRead:
     """
     Given a list of references to the properties of objects in some devices,
     read the values of the properties and pass the results to a callback
-    function.
+    function.  The store() function of a ResultColumns object from
+    bacpypes3.lib.columns can be the callback to collect them in columns.
     """
 
     _debug: Callable[..., None]
@@ -401,16 +402,23 @@ class BatchRead:
         self._stop = asyncio.Event()
         self.fini = asyncio.Event()
 
-        # create a set of network workers
+        # create a set of network workers, the tasks get a copy of the
+        # context so their requests are bulk requests
         network_task_set = set()
-        for network, address_group in self.network_group.items():
-            network_worker = NetworkGroupWorker(network, address_group)
-            network_worker_task = asyncio.create_task(
-                network_worker.run(self), name=f"Network {network}"
-            )
-            if _debug:
-                BatchRead._debug("    - network_worker_task: %r", network_worker_task)
-            network_task_set.add(network_worker_task)
+        priority_token = request_priority.set(PRIORITY_BULK)
+        try:
+            for network, address_group in self.network_group.items():
+                network_worker = NetworkGroupWorker(network, address_group)
+                network_worker_task = asyncio.create_task(
+                    network_worker.run(self), name=f"Network {network}"
+                )
+                if _debug:
+                    BatchRead._debug(
+                        "    - network_worker_task: %r", network_worker_task
+                    )
+                network_task_set.add(network_worker_task)
+        finally:
+            request_priority.reset(priority_token)
 
         # wait for them all to complete
         done, pending = await asyncio.wait(network_task_set)
@@ -0,0 +1,362 @@
+"""
+Batch Write
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from dataclasses import dataclass
+
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..debugging import bacpypes_debugging, ModuleLogger
+
+from ..pdu import Address, PDUData
+from ..primitivedata import ObjectIdentifier
+from ..basetypes import PropertyReference, PropertyValue, ServicesSupported
+from ..apdu import (
+    ErrorRejectAbortNack,
+    RejectPDU,
+    RejectReason,
+    WritePropertyMultipleError,
+)
+from ..app import Application
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+# the size of the largest request assumed for devices that are not in the
+# device information cache, the size of the confirmed request header, and
+# the size of the object identifier and the tags around the list of
+# property values for each object in a request
+MAX_APDU_LENGTH = 480
+REQUEST_HEADER_SIZE = 4
+OBJECT_SIZE = 7
+
+
+@dataclass(frozen=True, eq=False)
+class DeviceAddressObjectPropertyValue:
+    """
+    Instances of this class are a request to write a value to a property of
+    an object associated with a "key".  When the writes are done, the
+    callback function is given the key and the result of the write.
+    """
+
+    key: Any
+    deviceAddress: Address
+    objectIdentifier: ObjectIdentifier
+    propertyReference: PropertyReference
+    value: Any
+    priority: Optional[int]
+
+    def __init__(
+        self,
+        key: Any,
+        device_address: Any,
+        object_identifier: Any,
+        property_reference: Any,
+        value: Any,
+        priority: Optional[int] = None,
+    ) -> None:
+        object.__setattr__(
+            self,
+            "key",
+            key,
+        )
+        object.__setattr__(
+            self,
+            "deviceAddress",
+            (
+                device_address
+                if isinstance(device_address, Address)
+                else Address(device_address)
+            ),
+        )
+        object.__setattr__(
+            self,
+            "objectIdentifier",
+            (
+                object_identifier
+                if isinstance(object_identifier, ObjectIdentifier)
+                else ObjectIdentifier(object_identifier)
+            ),
+        )
+        object.__setattr__(
+            self,
+            "propertyReference",
+            (
+                property_reference
+                if isinstance(property_reference, PropertyReference)
+                else PropertyReference(property_reference)
+            ),
+        )
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "priority", priority)
+
+    def __repr__(self) -> str:
+        s = (
+            "<"
+            f"DeviceAddressObjectPropertyValue {self.key}: "
+            f"{self.deviceAddress}/{self.objectIdentifier}/{self.propertyReference}"
+            f" = {self.value!r}"
+            + ("" if self.priority is None else f" @ {self.priority}")
+            + ">"
+        )
+        return s
+
+
+DeviceAddressObjectPropertyValueList = List[DeviceAddressObjectPropertyValue]
+
+# a write along with its property value and encoded size
+PendingWrite = Tuple[DeviceAddressObjectPropertyValue, PropertyValue, int]
+
+CallbackFn = Callable[[Any, Any], None]
+
+
+@bacpypes_debugging
+class BatchWrite:
+    """
+    Given a list of writes to the properties of objects in some devices,
+    group them by device and pack them into as few Write Property Multiple
+    requests as will fit in the largest request the device accepts, or write
+    them one at a time if the device does not support Write Property
+    Multiple.  The devices are written to at the same time, the writes to a
+    device are made in the order they are given.
+
+    The result of each write is passed to the callback function with its
+    key, and they are all returned by run().  The result is None if the
+    write succeeded, otherwise it is the error, reject, or abort, the
+    ErrorType from a WritePropertyMultipleError for the write that failed,
+    or the RuntimeError for a response that was not expected.
+    """
+
+    _debug: Callable[..., None]
+
+    app: Optional[Application]
+    callback: Optional[CallbackFn]
+    results: Dict[Any, Any]
+
+    def __init__(self, daopv_list: DeviceAddressObjectPropertyValueList) -> None:
+        if _debug:
+            BatchWrite._debug("__init__ ...")
+
+        # group the writes by device address, keeping them in order
+        self.address_group: Dict[Address, DeviceAddressObjectPropertyValueList] = {}
+        for daopv in daopv_list:
+            self.address_group.setdefault(daopv.deviceAddress, []).append(daopv)
+
+        # devices that do not support Write Property Multiple
+        self.single_write: Set[Address] = set()
+
+        # no application until we run
+        self.app = None
+        self.callback = None
+        self.results = {}
+
+    async def run(
+        self, app: Application, callback: Optional[CallbackFn] = None
+    ) -> Dict[Any, Any]:
+        """
+        Make the writes and return the results.
+        """
+        if _debug:
+            BatchWrite._debug("run %r", app)
+
+        # save a reference to the application and callback
+        self.app = app
+        self.callback = callback
+        self.results = {}
+
+        await asyncio.gather(
+            *(
+                self.write_device(address, daopv_list)
+                for address, daopv_list in self.address_group.items()
+            )
+        )
+
+        return self.results
+
+    def report(self, daopv: DeviceAddressObjectPropertyValue, result: Any) -> None:
+        if _debug:
+            BatchWrite._debug("report %r %r", daopv.key, result)
+
+        self.results[daopv.key] = result
+        if self.callback:
+            self.callback(daopv.key, result)
+
+    async def write_device(
+        self, address: Address, daopv_list: DeviceAddressObjectPropertyValueList
+    ) -> None:
+        """
+        Make the writes to one device.
+        """
+        if _debug:
+            BatchWrite._debug("write_device %r", address)
+        assert self.app
+
+        # check the device information for the services it supports and
+        # the size of the requests it accepts
+        device_info = await self.app.device_info_cache.get_device_info(address)
+        if _debug:
+            BatchWrite._debug("    - device_info: %r", device_info)
+
+        max_apdu_length = MAX_APDU_LENGTH
+        if device_info:
+            if device_info.max_apdu_length_accepted:
+                max_apdu_length = device_info.max_apdu_length_accepted
+
+            if (
+                device_info.service_supported(ServicesSupported.writePropertyMultiple)
+                is False
+            ):
+                self.single_write.add(address)
+
+        vendor_info = await self.app.get_vendor_info(device_address=address)
+
+        # build the property values and find out how big they are
+        pending: List[PendingWrite] = []
+        for daopv in daopv_list:
+            try:
+                property_value = await self.app.build_property_value(
+                    daopv.objectIdentifier,
+                    daopv.propertyReference.propertyIdentifier,
+                    daopv.value,
+                    daopv.priority,
+                    daopv.propertyReference.propertyArrayIndex,
+                    vendor_info=vendor_info,
+                )
+            except Exception as err:
+                if _debug:
+                    BatchWrite._debug("    - value error: %r", err)
+                self.report(daopv, err)
+                continue
+
+            pdu_data = PDUData()
+            property_value.encode().encode(pdu_data)
+            pending.append((daopv, property_value, len(pdu_data.pduData)))
+
+        while pending:
+            if address in self.single_write:
+                await self.write_property(pending)
+                break
+
+            # take as many as will fit
+            batch_size = REQUEST_HEADER_SIZE
+            object_identifier = None
+            for i, (daopv, property_value, size) in enumerate(pending):
+                if daopv.objectIdentifier != object_identifier:
+                    object_identifier = daopv.objectIdentifier
+                    size += OBJECT_SIZE
+                if i and (batch_size + size > max_apdu_length):
+                    break
+                batch_size += size
+            else:
+                i = len(pending)
+            batch, pending = pending[:i], pending[i:]
+
+            pending = await self.write_property_multiple(address, batch) + pending
+
+    async def write_property_multiple(
+        self, address: Address, batch: List[PendingWrite]
+    ) -> List[PendingWrite]:
+        """
+        Send one Write Property Multiple request and report the results, and
+        return the writes that were not attempted when one of them failed.
+        """
+        if _debug:
+            BatchWrite._debug("write_property_multiple %r %d", address, len(batch))
+        assert self.app
+
+        # consecutive writes to the same object share a specification
+        parameter_list: List[Any] = []
+        object_identifier = None
+        for daopv, property_value, _ in batch:
+            if daopv.objectIdentifier != object_identifier:
+                object_identifier = daopv.objectIdentifier
+                property_value_list: List[PropertyValue] = []
+                parameter_list.extend([object_identifier, property_value_list])
+            property_value_list.append(property_value)
+
+        try:
+            await self.app.write_property_multiple(address, parameter_list)
+        except WritePropertyMultipleError as err:
+            if _debug:
+                BatchWrite._debug("    - write property multiple error: %r", err)
+
+            # find the write that failed
+            failed = err.firstFailedWriteAttempt
+            for i, (daopv, property_value, _) in enumerate(batch):
+                if (
+                    failed is not None
+                    and daopv.objectIdentifier == failed.objectIdentifier
+                    and property_value.propertyIdentifier == failed.propertyIdentifier
+                    and property_value.propertyArrayIndex == failed.propertyArrayIndex
+                ):
+                    break
+            else:
+                # some devices only identify the object
+                for i, (daopv, property_value, _) in enumerate(batch):
+                    if (
+                        failed is not None
+                        and daopv.objectIdentifier == failed.objectIdentifier
+                    ):
+                        break
+                else:
+                    for daopv, _, _ in batch:
+                        self.report(daopv, err)
+                    return []
+
+            # the ones before it were written, the rest were not attempted
+            for daopv, _, _ in batch[:i]:
+                self.report(daopv, None)
+            self.report(batch[i][0], err.errorType)
+            return batch[i + 1 :]
+
+        except RejectPDU as err:
+            if err.apduAbortRejectReason != RejectReason.unrecognizedService:
+                for daopv, _, _ in batch:
+                    self.report(daopv, err)
+                return []
+
+            # write them one at a time
+            if _debug:
+                BatchWrite._debug("    - write property multiple not supported")
+            self.single_write.add(address)
+            return batch
+
+        except (ErrorRejectAbortNack, RuntimeError) as err:
+            if _debug:
+                BatchWrite._debug("    - error/reject/abort: %r", err)
+            for daopv, _, _ in batch:
+                self.report(daopv, err)
+            return []
+
+        for daopv, _, _ in batch:
+            self.report(daopv, None)
+        return []
+
+    async def write_property(self, pending: List[PendingWrite]) -> None:
+        """
+        Write the values one at a time.
+        """
+        if _debug:
+            BatchWrite._debug("write_property %d", len(pending))
+        assert self.app
+
+        for daopv, property_value, _ in pending:
+            try:
+                await self.app.write_property(
+                    daopv.deviceAddress,
+                    daopv.objectIdentifier,
+                    property_value.propertyIdentifier,
+                    daopv.value,
+                    property_value.propertyArrayIndex,
+                    daopv.priority,
+                )
+                self.report(daopv, None)
+            except ErrorRejectAbortNack as err:
+                if _debug:
+                    BatchWrite._debug("    - error/reject/abort: %r", err)
+                self.report(daopv, err)
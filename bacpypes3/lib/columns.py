@@ -0,0 +1,292 @@
+"""
+Columnar Results
+
+Rather than building a list of tuples with a value object for each property
+that is read, the results of bulk reads can be stored in columns that are
+allocated once, one row for each point.  The columns are NumPy arrays when
+NumPy is installed, otherwise they are array.array buffers.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+import struct
+import time
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from ..debugging import bacpypes_debugging, ModuleLogger, DebugContents
+
+from ..pdu import Address
+from ..primitivedata import TagClass, TagNumber
+from ..basetypes import ErrorType, PropertyIdentifier, StatusFlags
+
+try:
+    import numpy  # type: ignore[import]
+except ImportError:
+    numpy = None
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+# error code column values when there is no error, or when the read failed
+# without an error code like a reject, abort or no response
+NO_ERROR = -1
+FAILED = -2
+
+# the status flags column is a bit mask using the bit numbers of StatusFlags
+STATUS_IN_ALARM = 1 << StatusFlags.inAlarm
+STATUS_FAULT = 1 << StatusFlags.fault
+STATUS_OVERRIDDEN = 1 << StatusFlags.overridden
+STATUS_OUT_OF_SERVICE = 1 << StatusFlags.outOfService
+
+# the first four bits of an encoded bit string as a status flags bit mask
+_status_flags_mask = [
+    sum(1 << bit for bit in range(4) if nibble & (0x8 >> bit)) for nibble in range(16)
+]
+
+_unpack_real = struct.Struct(">f").unpack
+_unpack_double = struct.Struct(">d").unpack
+
+
+@bacpypes_debugging
+class ResultColumns(DebugContents):
+    """
+    Columns of values, status flags, error codes and timestamps for a list
+    of points.  The point keys are given when the columns are created, the
+    row of a point is its position in the list and does not change.
+
+    The values column is a float64 column of numeric values, NaN when there
+    is no value.  The status flags column is a uint8 bit mask of the
+    STATUS_* constants.  The error code column is the error code of the last
+    failed read of the value, NO_ERROR or FAILED.  The timestamps column is
+    the time.time() the value or error was stored.
+    """
+
+    _debug_contents = (
+        "size",
+        "value_property",
+        "stored",
+        "errors",
+        "unsupported",
+        "unknown",
+    )
+    _debug: Callable[..., None]
+
+    keys: List[Hashable]
+    index: Dict[Hashable, int]
+    value_property: PropertyIdentifier
+    values: Any
+    status_flags: Any
+    error_codes: Any
+    timestamps: Any
+
+    def __init__(
+        self,
+        keys: Iterable[Hashable],
+        value_property: Any = PropertyIdentifier.presentValue,
+        use_numpy: Optional[bool] = None,
+    ) -> None:
+        """
+        Create columns for the points with these keys.  When the results of a
+        Read Property Multiple request are stored the keys are the object
+        identifiers, or (address, object identifier) tuples when the results
+        are stored with an address, and the value_property results go in the
+        values column.  By default NumPy is used if it is installed.
+        """
+        self.keys = list(keys)
+        self.index = {key: row for row, key in enumerate(self.keys)}
+        self.size = size = len(self.keys)
+        if _debug:
+            ResultColumns._debug("__init__ size=%r", size)
+        if len(self.index) != size:
+            raise ValueError("duplicate keys")
+
+        self.value_property = PropertyIdentifier(value_property)
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and (numpy is None):
+            raise RuntimeError("NumPy is not installed")
+        self.use_numpy = use_numpy
+
+        if use_numpy:
+            self.values = numpy.full(size, math.nan, dtype=numpy.float64)
+            self.status_flags = numpy.zeros(size, dtype=numpy.uint8)
+            self.error_codes = numpy.full(size, NO_ERROR, dtype=numpy.int32)
+            self.timestamps = numpy.full(size, math.nan, dtype=numpy.float64)
+        else:
+            self.values = array.array("d", [math.nan]) * size
+            self.status_flags = array.array("B", bytes(size))
+            self.error_codes = array.array("i", [NO_ERROR]) * size
+            self.timestamps = array.array("d", [math.nan]) * size
+
+        # counters
+        self.stored = 0
+        self.errors = 0
+        self.unsupported = 0
+        self.unknown = 0
+
+    def clear(self) -> None:
+        """
+        Clear the columns for the next round of reads.
+        """
+        for row in range(self.size):
+            self.values[row] = math.nan
+            self.status_flags[row] = 0
+            self.error_codes[row] = NO_ERROR
+            self.timestamps[row] = math.nan
+
+    def store(
+        self, key: Hashable, value: Any, timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Store a value that was read for a point, the status flags go in their
+        column and errors in theirs.  This has the same signature as the
+        callback function of BatchRead.run().
+        """
+        row = self.index.get(key, None)
+        if row is None:
+            self.unknown += 1
+            return
+        if timestamp is None:
+            timestamp = time.time()
+
+        if isinstance(value, StatusFlags):
+            self.status_flags[row] = sum(
+                1 << bit for bit, flag in enumerate(value[:4]) if flag
+            )
+        elif isinstance(value, (bool, int, float)):
+            self.values[row] = value
+            self.error_codes[row] = NO_ERROR
+            self.stored += 1
+        elif isinstance(value, (ErrorType, BaseException)) or (value is None):
+            # property access errors and ErrorPDU have an error code
+            error_code = getattr(value, "errorCode", None)
+            self.values[row] = math.nan
+            self.error_codes[row] = FAILED if error_code is None else error_code
+            self.errors += 1
+        else:
+            self.unsupported += 1
+            return
+
+        self.timestamps[row] = timestamp
+
+    def store_results(
+        self,
+        result_list: Iterable[Any],
+        address: Optional[Address] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Store the list of (object identifier, property identifier, array
+        index, value) results from read_property_multiple().
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        for object_identifier, property_identifier, _, property_value in result_list:
+            key = object_identifier if address is None else (address, object_identifier)
+            if property_identifier == self.value_property:
+                if property_value is None:
+                    self.unsupported += 1
+                else:
+                    self.store(key, property_value, timestamp)
+            elif property_identifier == PropertyIdentifier.statusFlags:
+                if isinstance(property_value, StatusFlags):
+                    self.store(key, property_value, timestamp)
+
+    def store_read_access_results(
+        self,
+        list_of_read_access_results: Iterable[Any],
+        address: Optional[Address] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Store the results in a Read Property Multiple acknowledgement.  The
+        values are decoded from their tags rather than creating an object for
+        each one and then converting it.
+        """
+        if _debug:
+            ResultColumns._debug("store_read_access_results")
+        if timestamp is None:
+            timestamp = time.time()
+
+        index = self.index
+        values = self.values
+        error_codes = self.error_codes
+        timestamps = self.timestamps
+        value_property = self.value_property
+        status_flags_property = PropertyIdentifier.statusFlags
+
+        for read_access_result in list_of_read_access_results:
+            object_identifier = read_access_result.objectIdentifier
+            row = index.get(
+                object_identifier if address is None else (address, object_identifier),
+                None,
+            )
+            if row is None:
+                self.unknown += 1
+                continue
+
+            for read_access_result_element in read_access_result.listOfResults:
+                property_identifier = read_access_result_element.propertyIdentifier
+                if property_identifier == value_property:
+                    pass
+                elif property_identifier == status_flags_property:
+                    pass
+                else:
+                    continue
+                read_result = read_access_result_element.readResult
+
+                # errors only matter for the value
+                property_access_error = read_result.propertyAccessError
+                if property_access_error:
+                    if property_identifier == value_property:
+                        values[row] = math.nan
+                        error_codes[row] = property_access_error.errorCode
+                        timestamps[row] = timestamp
+                        self.errors += 1
+                    continue
+
+                # the tag list is the opening tag, the value, the closing tag
+                tag_list = read_result.propertyValue.tagList
+                if len(tag_list) != 3:
+                    self.unsupported += 1
+                    continue
+                tag = tag_list[1]
+                if tag.tag_class != TagClass.application:
+                    self.unsupported += 1
+                    continue
+                tag_number = tag.tag_number
+                tag_data = tag.tag_data
+
+                if property_identifier == status_flags_property:
+                    if (tag_number == TagNumber.bitString) and (len(tag_data) > 1):
+                        self.status_flags[row] = _status_flags_mask[tag_data[1] >> 4]
+                    else:
+                        self.unsupported += 1
+                    continue
+
+                if tag_number == TagNumber.real:
+                    value = _unpack_real(tag_data)[0]
+                elif tag_number == TagNumber.double:
+                    value = _unpack_double(tag_data)[0]
+                elif (tag_number == TagNumber.unsigned) or (
+                    tag_number == TagNumber.enumerated
+                ):
+                    value = int.from_bytes(tag_data, "big")
+                elif tag_number == TagNumber.integer:
+                    value = int.from_bytes(tag_data, "big", signed=True)
+                elif tag_number == TagNumber.boolean:
+                    value = tag.tag_lvt
+                else:
+                    self.unsupported += 1
+                    continue
+
+                values[row] = value
+                error_codes[row] = NO_ERROR
+                timestamps[row] = timestamp
+                self.stored += 1
@@ -138,7 +138,7 @@ class Commandable:
                 "write_property %r %r %r %r", attr, value, index, priority
             )
         if isinstance(attr, int):
-            attr = self._property_identifier_class(attr).attr
+            attr = self._property_identifier_class.attr_of(attr)
         if attr not in self._elements:
             raise AttributeError(f"not a property: {attr!r}")
 
@@ -14,6 +14,7 @@ from typing import cast, Any as _Any, Callable, Dict, List, Optional, Tuple, Uni
 
 from ..debugging import bacpypes_debugging, ModuleLogger
 from ..errors import PropertyError
+from ..settings import settings
 from ..primitivedata import CharacterString, ObjectIdentifier
 from ..basetypes import EventState, PropertyIdentifier, Reliability, StatusFlags
 from ..constructeddata import ArrayOf
@@ -389,6 +390,9 @@ class Object(_Object):
     _fault_algorithm: Optional[Algorithm] = None
     _notification_class_object: Optional[NotificationClassObject] = None
 
+    # these change through their setters which go through __setattr__
+    _cached_properties = ("objectIdentifier", "objectName", "propertyList")
+
     def __init__(self, **kwargs) -> None:
         if _debug:
             Object._debug("__init__ %r", kwargs)
@@ -396,6 +400,8 @@ class Object(_Object):
         self.__objectName = None
         self.__objectIdentifier = None
         self._property_monitors = defaultdict(list)
+        if settings.property_cache:
+            self._property_cache = {}
 
         super().__init__(**kwargs)
 
@@ -540,6 +546,9 @@ class Object(_Object):
                 value=value,
             )
 
+        # forget the encoded value
+        self._invalidate_property(attr)
+
         # tell the monitors
         for fn in self._property_monitors[attr]:
             fn(current_value, value)
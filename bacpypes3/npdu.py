@@ -171,7 +171,7 @@ class NPCI(PCI, DebugContents):
         PCI.update(npci, pdu)
 
         # check the length
-        if len(pdu.pduData) < 2:
+        if pdu.remaining() < 2:
             raise DecodingError("invalid length")
 
         # only version 1 messages supported
@@ -476,7 +476,7 @@ class WhoIsRouterToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         npdu = WhoIsRouterToNetwork()
-        if pdu.pduData:
+        if pdu.remaining():
             npdu.wirtnNetwork = pdu.get_short()
         else:
             npdu.wirtnNetwork = None
@@ -526,7 +526,7 @@ class IAmRouterToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         network_list = []
-        while pdu.pduData:
+        while pdu.remaining():
             network_list.append(pdu.get_short())
         return IAmRouterToNetwork(network_list)
 
@@ -674,7 +674,7 @@ class RouterBusyToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         network_list = []
-        while pdu.pduData:
+        while pdu.remaining():
             network_list.append(pdu.get_short())
         return RouterBusyToNetwork(network_list)
 
@@ -722,7 +722,7 @@ class RouterAvailableToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         network_list = []
-        while pdu.pduData:
+        while pdu.remaining():
             network_list.append(pdu.get_short())
         return RouterAvailableToNetwork(network_list)
 
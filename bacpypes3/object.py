@@ -340,6 +340,11 @@ class Object(Sequence, metaclass=ObjectMetaclass):
     _app: _Any  # used when added to an application
     _required = ("objectIdentifier", "objectName", "objectType", "propertyList")
 
+    # encoded property values, enabled by subclasses that can tell when their
+    # property values change, and the @property elements that can be cached
+    _property_cache: Optional[Dict[str, Tuple[_Any, ...]]] = None
+    _cached_properties: Tuple[str, ...] = ()
+
     objectIdentifier: ObjectIdentifier
     objectName: CharacterString(_min_length=1)
     objectType: ObjectType
@@ -364,7 +369,7 @@ class Object(Sequence, metaclass=ObjectMetaclass):
         # check the initialization dictionary values
         if init_dict:
             for attr, value in init_dict.items():
-                attr = self._property_identifier_class(attr).attr
+                attr = self._property_identifier_class.attr_of(attr)
                 if attr not in self._elements:
                     raise AttributeError(f"not a property: {attr!r}")
                 if attr in kwargs:
@@ -395,15 +400,15 @@ class Object(Sequence, metaclass=ObjectMetaclass):
         if _debug:
             Object._debug("get_property_type %r %r", cls, attr)
 
-        # convert the string, which could be 'presentValue' or 'present-value'
-        # to a property identifier so it can be normalized to the attribute
-        # form in the next step
+        # normalize the value or string, which could be 'presentValue' or
+        # 'present-value', to the "attribute" form of the property identifier,
+        # e.g., 'presentValue', to look up the element
         if isinstance(attr, (int, str)):
-            attr = cls._property_identifier_class(attr)
+            attr = cls._property_identifier_class.attr_of(attr)
+        else:
+            attr = attr.attr
 
-        # use the "attribute" form of the property identifier, e.g.,
-        # 'presentValue', to look up the element
-        return cls._elements.get(attr.attr, None)
+        return cls._elements.get(attr, None)
 
     async def read_property(  # type: ignore[override]
         self,
@@ -414,7 +419,7 @@ class Object(Sequence, metaclass=ObjectMetaclass):
             Object._debug("read_property %r %r", attr, index)
 
         if isinstance(attr, int):
-            attr = self._property_identifier_class(attr).attr
+            attr = self._property_identifier_class.attr_of(attr)
         if attr not in self._elements:
             raise AttributeError(f"not a property: {attr!r}")
 
@@ -451,7 +456,7 @@ class Object(Sequence, metaclass=ObjectMetaclass):
         if _debug:
             Object._debug("write_property %r %r %r %r", attr, value, index, priority)
         if isinstance(attr, int):
-            attr = self._property_identifier_class(attr).attr
+            attr = self._property_identifier_class.attr_of(attr)
         if attr not in self._elements:
             raise AttributeError(f"not a property: {attr!r}")
 
@@ -481,6 +486,20 @@ class Object(Sequence, metaclass=ObjectMetaclass):
             priority=priority,
         )
 
+        # the setter may have gone around __setattr__
+        self._invalidate_property(attr)
+
+    def _invalidate_property(self, attr: str) -> None:
+        """Forget the encoded value of a property that has changed."""
+        property_cache = self._property_cache
+        if property_cache:
+            if _debug:
+                Object._debug("_invalidate_property %r", attr)
+            property_cache.pop(attr, None)
+
+            # the property list depends on which properties have values
+            property_cache.pop("propertyList", None)
+
 
 #
 #   Objects
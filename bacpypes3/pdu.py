@@ -10,7 +10,8 @@ import socket
 import struct
 import ipaddress
 
-from copy import copy as _copy
+from collections import OrderedDict
+
 from typing import Union, Any, List, TextIO, Tuple, Dict, Optional, Callable, cast
 
 from .settings import settings
@@ -30,6 +31,10 @@ except ImportError:
 # pack/unpack constants
 _short_mask = 0xFFFF
 _long_mask = 0xFFFFFFFF
+_pack_short = struct.Struct(">H").pack
+_pack_long = struct.Struct(">L").pack
+_unpack_short = struct.Struct(">H").unpack_from
+_unpack_long = struct.Struct(">L").unpack_from
 
 # some debugging
 _debug = 0
@@ -103,6 +108,10 @@ host_port_re = re.compile(r"^(?:([\w.]+))(?::(\d+))?$")
 
 network_types: Dict[str, type]
 
+# shared instances of addresses built from a str, bytes, or tuple, the size
+# is limited by settings.address_cache
+_address_cache: OrderedDict[Tuple[type, Any], Address] = OrderedDict()
+
 
 @bacpypes_debugging
 class AddressMetaclass(type):
@@ -131,6 +140,49 @@ class AddressMetaclass(type):
         if _debug:
             AddressMetaclass._debug("__call__ %r %r %r", cls, args, kwargs)
 
+        # addresses from strings, bytes, and (host, port) tuples are interned
+        if (len(args) != 1) or kwargs:
+            return cls._new_address(*args, **kwargs)
+
+        addr = args[0]
+        addr_type = type(addr)
+        if addr_type is bytearray:
+            addr = bytes(addr)
+        elif addr_type is str:
+            # interface and host names are resolved every time
+            if interface_port_re.match(addr):
+                return cls._new_address(addr)
+        elif (addr_type is not tuple) and (addr_type is not bytes):
+            return cls._new_address(addr)
+
+        key = (cls, addr)
+        try:
+            address = _address_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable tuple contents
+            return cls._new_address(addr)
+        else:
+            _address_cache.move_to_end(key)
+            return address
+
+        address = cls._new_address(addr)
+
+        address_cache_size = settings.address_cache
+        if address_cache_size > 0:
+            if _debug:
+                AddressMetaclass._debug("    - intern: %r", address)
+            _address_cache[key] = address
+            while len(_address_cache) > address_cache_size:
+                _address_cache.popitem(last=False)
+
+        return address
+
+    def _new_address(cls, *args: Any, **kwargs: Any) -> "Address":
+        if _debug:
+            AddressMetaclass._debug("_new_address %r %r %r", cls, args, kwargs)
+
         # already subclassed, nothing to see here
         if cls is not Address:
             return cast(Address, type.__call__(cls, *args, **kwargs))
@@ -403,6 +455,9 @@ class AddressMetaclass(type):
 class Address(metaclass=AddressMetaclass):
     """
     Amazing documentation here.
+
+    Addresses built from a single string, bytes, or tuple argument are
+    shared, so treat them as immutable.
     """
 
     _debug: Callable[..., None]
@@ -1933,12 +1988,16 @@ class PCI(DebugContents):
 @bacpypes_debugging
 class PDUData:
     """
-    Amazing documentation here.
+    The octets are kept in a single buffer with a read cursor, the get()
+    functions advance the cursor rather than removing octets from the front
+    of the buffer, so decoding is linear in the length of the packet.  The
+    pduData attribute is the data that has not been decoded yet.
     """
 
     _debug: Callable[..., None]
 
-    pduData: bytearray
+    _pduData: bytearray
+    _pduOffset: int
 
     def __init__(self, data: Union[bytes, bytearray, "PDUData", None] = None):
         if _debug:
@@ -1950,60 +2009,92 @@ class PDUData:
 
         # function acts like a copy constructor
         if data is None:
-            self.pduData = bytearray()
-        elif isinstance(data, (bytes, bytearray)):
-            self.pduData = bytearray(data)
+            self._pduData = bytearray()
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            self._pduData = bytearray(data)
         elif isinstance(data, PDUData):
-            self.pduData = _copy(data.pduData)
+            self._pduData = data._pduData[data._pduOffset :]
         else:
             raise TypeError("bytes or bytearray expected")
+        self._pduOffset = 0
+
+    @property
+    def pduData(self) -> bytearray:
+        """The data that has not been decoded yet."""
+        if self._pduOffset:
+            # trimming from the front of a bytearray does not move the rest
+            del self._pduData[: self._pduOffset]
+            self._pduOffset = 0
+        return self._pduData
+
+    @pduData.setter
+    def pduData(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        if isinstance(data, bytearray):
+            self._pduData = data
+        else:
+            self._pduData = bytearray(data)
+        self._pduOffset = 0
+
+    def remaining(self) -> int:
+        """Return the number of octets that have not been decoded yet."""
+        return len(self._pduData) - self._pduOffset
 
     def get(self) -> int:
-        if len(self.pduData) == 0:
+        offset = self._pduOffset
+        if offset >= len(self._pduData):
             raise DecodingError("no more packet data")
 
-        octet = self.pduData[0]
-        del self.pduData[0]
-
-        return octet
+        self._pduOffset = offset + 1
+        return self._pduData[offset]
 
     def get_data(self, dlen: int) -> bytearray:
-        if len(self.pduData) < dlen:
+        offset = self._pduOffset
+        if len(self._pduData) - offset < dlen:
             raise DecodingError("no more packet data")
 
-        data = self.pduData[:dlen]
-        del self.pduData[:dlen]
-
-        return data
+        self._pduOffset = offset + dlen
+        return self._pduData[offset : offset + dlen]
 
     def get_short(self) -> int:
-        return struct.unpack(">H", self.get_data(2))[0]  # type: ignore[no-any-return]
+        offset = self._pduOffset
+        if len(self._pduData) - offset < 2:
+            raise DecodingError("no more packet data")
+
+        self._pduOffset = offset + 2
+        return _unpack_short(self._pduData, offset)[0]  # type: ignore[no-any-return]
 
     def get_long(self) -> int:
-        return struct.unpack(">L", self.get_data(4))[0]  # type: ignore[no-any-return]
+        offset = self._pduOffset
+        if len(self._pduData) - offset < 4:
+            raise DecodingError("no more packet data")
+
+        self._pduOffset = offset + 4
+        return _unpack_long(self._pduData, offset)[0]  # type: ignore[no-any-return]
 
     def put(self, n: int) -> None:
         # pduData is a bytearray
-        self.pduData += bytes([n])
+        self._pduData.append(n)
 
-    def put_data(self, data: Union[bytes, bytearray, List[int]]) -> None:
+    def put_data(self, data: Union[bytes, bytearray, memoryview, List[int]]) -> None:
         if isinstance(data, bytes):
             pass
         elif isinstance(data, bytearray):
             pass
+        elif isinstance(data, memoryview):
+            pass
         elif isinstance(data, list):
             data = bytes(data)
         else:
             raise TypeError("data must be bytes, bytearray, or a list")
 
         # regular append works
-        self.pduData += data
+        self._pduData += data
 
     def put_short(self, n: int) -> None:
-        self.pduData += struct.pack(">H", n & _short_mask)
+        self._pduData += _pack_short(n & _short_mask)
 
     def put_long(self, n: int) -> None:
-        self.pduData += struct.pack(">L", n & _long_mask)
+        self._pduData += _pack_long(n & _long_mask)
 
     def debug_contents(
         self,
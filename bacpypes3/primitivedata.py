@@ -6,11 +6,13 @@ from __future__ import annotations
 
 import sys
 import inspect
+import itertools
 import struct
 import datetime
 import time
 import re
 
+from collections import OrderedDict
 from enum import IntEnum
 
 from typing import (
@@ -29,6 +31,7 @@ from typing import (
     Union,
 )
 
+from .settings import settings
 from .debugging import ModuleLogger, bacpypes_debugging, btox
 from .errors import DecodingError, InvalidTag, PropertyError
 from .pdu import PDUData
@@ -97,6 +100,8 @@ class Tag:
     Amazing documentation here.
     """
 
+    __slots__ = ("tag_class", "tag_number", "tag_lvt", "tag_data")
+
     tag_class: TagClass
     tag_number: Union[TagNumber, int]
     tag_lvt: int
@@ -161,9 +166,10 @@ class Tag:
         self.tag_lvt = len(tdata)
         self.tag_data = tdata
 
-    def encode(self) -> PDUData:
-        """Encode a tag on the end of the PDU."""
-        pdu_data = PDUData()
+    def encode(self, pdu_data: Optional[PDUData] = None) -> PDUData:
+        """Encode a tag on the end of the PDU, a new one if none is provided."""
+        if pdu_data is None:
+            pdu_data = PDUData()
 
         # check for special encoding
         if self.tag_class == TagClass.context:
@@ -204,7 +210,8 @@ class Tag:
                 pdu_data.put_long(self.tag_lvt)
 
         # now put the data
-        pdu_data.put_data(self.tag_data)
+        if self.tag_data:
+            pdu_data.put_data(self.tag_data)
 
         return pdu_data
 
@@ -401,6 +408,8 @@ class ApplicationTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args: _Any) -> None:
         if len(args) == 1 and isinstance(args[0], PDUData):
             Tag.__init__(self, args[0])
@@ -418,6 +427,8 @@ class ContextTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, context: int, data: Union[bytes, bytearray]) -> None:
         Tag.__init__(self, TagClass.context, context, len(data), data)
 
@@ -427,6 +438,8 @@ class OpeningTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, context: int) -> None:
         Tag.__init__(self, TagClass.opening, context)
 
@@ -436,41 +449,82 @@ class ClosingTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, context: int) -> None:
         Tag.__init__(self, TagClass.closing, context)
 
 
 class TagList(Iterable):
     """
-    Amazing documentation here.
+    A list of tags with a cursor.  Decoding pops tags off the front of the
+    list by advancing the cursor rather than removing them, the tags that
+    have been consumed stay in the list until the tagList attribute is
+    referenced.  Indexing, length and iteration are relative to the cursor.
     """
 
-    tagList: _List[Tag]
+    __slots__ = ("_tags", "_index")
+
+    _tags: _List[Tag]
+    _index: int
 
     def __init__(self, arg: Union[_List[Tag], TagList, PDUData, None] = None) -> None:
-        self.tagList = []
+        self._tags = []
+        self._index = 0
 
         if isinstance(arg, list):
-            self.tagList = arg
+            self._tags = arg
         elif isinstance(arg, TagList):
-            self.tagList = arg.tagList[:]
+            self._tags = arg._tags[arg._index :]
         elif isinstance(arg, PDUData):
             self.decode(arg)
 
+    @property
+    def tagList(self) -> _List[Tag]:
+        """The tags that have not been consumed."""
+        if self._index:
+            del self._tags[: self._index]
+            self._index = 0
+        return self._tags
+
+    @tagList.setter
+    def tagList(self, tags: _List[Tag]) -> None:
+        self._tags = tags
+        self._index = 0
+
+    def tell(self) -> int:
+        """Return the position of the cursor."""
+        return self._index
+
+    def seek(self, index: int) -> None:
+        """Move the cursor back to a position returned by tell(), used to
+        back out of a trial decoding.  The tagList attribute must not have
+        been referenced in the meantime."""
+        if (index < 0) or (index > len(self._tags)):
+            raise IndexError("tag list index out of range")
+        self._index = index
+
     def append(self, tag: Tag) -> None:
-        self.tagList.append(tag)
+        self._tags.append(tag)
 
     def extend(self, taglist: Iterable[Tag]) -> None:
-        self.tagList.extend(taglist)
+        self._tags.extend(taglist)
 
-    def __getitem__(self, item: int) -> Tag:
-        return self.tagList[item]
+    def __getitem__(self, item: _Any) -> _Any:
+        if isinstance(item, int) and (item >= 0):
+            item += self._index
+            if item >= len(self._tags):
+                raise IndexError("tag list index out of range")
+            return self._tags[item]
+        return self._tags[self._index :][item]
 
     def __len__(self) -> int:
-        return len(self.tagList)
+        return len(self._tags) - self._index
 
     def __iter__(self) -> Iterator[Tag]:
-        return iter(self.tagList)
+        if self._index:
+            return itertools.islice(self._tags, self._index, None)
+        return iter(self._tags)
 
     def __eq__(self, other: object) -> bool:
         """Tag lists are equal if all the tags are equal."""
@@ -478,7 +532,7 @@ class TagList(Iterable):
             return NotImplemented
         if len(self) != len(other):
             return False
-        return all(x == y for x, y in zip(self.tagList, other.tagList))
+        return all(x == y for x, y in zip(self, other))
 
     def __ne__(self, arg: _Any) -> bool:
         """Inverse of __eq__."""
@@ -486,20 +540,24 @@ class TagList(Iterable):
 
     def peek(self) -> Union[Tag, None]:
         """Return the tag at the front of the list."""
-        if self.tagList:
-            return self.tagList[0]
+        if self._index < len(self._tags):
+            return self._tags[self._index]
         else:
             return None
 
     def push(self, tag: Tag) -> None:
         """Return a tag back to the front of the list."""
-        self.tagList = [tag] + self.tagList
+        if self._index:
+            self._index -= 1
+            self._tags[self._index] = tag
+        else:
+            self._tags.insert(0, tag)
 
     def pop(self) -> Union[Tag, None]:
         """Remove the tag from the front of the list and return it."""
-        if self.tagList:
-            tag = self.tagList[0]
-            del self.tagList[0]
+        if self._index < len(self._tags):
+            tag = self._tags[self._index]
+            self._index += 1
             return tag
         else:
             return None
@@ -525,10 +583,11 @@ class TagList(Iterable):
             return TagList([])
 
         # forward pass
-        i = 0
+        tags = self._tags
+        i = self._index
         lvl = 0
-        while i < len(self.tagList):
-            tag = self.tagList[i]
+        while i < len(tags):
+            tag = tags[i]
             if tag.tag_class == TagClass.opening:
                 lvl += 1
             elif tag.tag_class == TagClass.closing:
@@ -542,16 +601,18 @@ class TagList(Iterable):
             raise InvalidTag("mismatched open/close tags")
 
         # result is the list of tags
-        tag_list = TagList(self.tagList[: i + 1])
-        del self.tagList[: i + 1]
+        tag_list = TagList(tags[self._index : i + 1])
+        self._index = i + 1
 
         return tag_list
 
-    def encode(self) -> PDUData:
-        """Encode the tag list."""
-        pdu_data = PDUData()
-        for tag in self.tagList:
-            pdu_data.put_data(tag.encode().pduData)
+    def encode(self, pdu_data: Optional[PDUData] = None) -> PDUData:
+        """Encode the tag list on the end of the PDU, a new one if none is
+        provided."""
+        if pdu_data is None:
+            pdu_data = PDUData()
+        for tag in self:
+            tag.encode(pdu_data)
         return pdu_data
 
     @classmethod
@@ -560,7 +621,7 @@ class TagList(Iterable):
         assert isinstance(pdu_data, PDUData)
 
         tag_list = TagList()
-        while pdu_data.pduData:
+        while pdu_data.remaining():
             tag_list.append(Tag.decode(pdu_data))
 
         return tag_list
@@ -571,10 +632,80 @@ class TagList(Iterable):
         file: TextIO = sys.stderr,
         _ids: Optional[_List[_Any]] = None,
     ) -> None:
-        for i, tag in enumerate(self.tagList):
+        for i, tag in enumerate(self):
             file.write("%s[%d] %r'\n" % ("    " * indent, i, tag))
 
 
+#
+#   EncodeCache
+#
+
+
+@bacpypes_debugging
+class EncodeCache:
+    """
+    A bounded LRU cache of the tags of encoded atomic values.  The values are
+    immutable so the key is the class, which includes the context, and the
+    value itself.  The cache is only used when settings.encode_cache is the
+    maximum number of tags to keep.
+    """
+
+    _debug: Callable[..., None]
+
+    tags: OrderedDict[Tuple[type, _Any], Tag]
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self.tags = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[type, _Any]) -> Optional[Tag]:
+        """Return the tag for the key, None if it has not been encoded."""
+        tag = self.tags.get(key, None)
+        if tag is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.tags.move_to_end(key)
+
+        return tag
+
+    def put(self, key: Tuple[type, _Any], tag: Tag, size: int) -> None:
+        """Save the tag for the key, evicting the least recently used."""
+        if _debug:
+            EncodeCache._debug("put %r %r %r", key, tag, size)
+
+        tags = self.tags
+        tags[key] = tag
+        while len(tags) > size:
+            tags.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove the tags and reset the statistics."""
+        self.tags.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, _Any]:
+        """Return the size and hit rate of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.tags),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+# shared by the atomic types with immutable encodings
+encode_cache = EncodeCache()
+
+# unsigned values larger than this are not saved
+_encode_cache_unsigned = 0xFFFF
+
+
 @bacpypes_debugging
 class ElementMetaclass(type):
     """
@@ -926,6 +1057,14 @@ class Boolean(Atomic, int):
         if _debug:
             Boolean._debug("Boolean.encode")
 
+        # check for a previously encoded value
+        cache_size = settings.encode_cache
+        if cache_size:
+            cache_key = (self.__class__, int(self))
+            cached_tag = encode_cache.get(cache_key)
+            if cached_tag is not None:
+                return TagList([cached_tag])
+
         tag: Tag
         if self._context is None:
             tag = Tag(TagClass.application, TagNumber.boolean, int(self), b"")
@@ -934,6 +1073,9 @@ class Boolean(Atomic, int):
         if _debug:
             Boolean._debug(f"    - tag: {tag}")
 
+        if cache_size:
+            encode_cache.put(cache_key, tag, cache_size)
+
         return TagList([tag])
 
     @classmethod
@@ -1008,6 +1150,14 @@ class Unsigned(Atomic, int):
         if _debug:
             Unsigned._debug("Unsigned.encode")
 
+        # check for a previously encoded value, only small ones are saved
+        cache_size = settings.encode_cache if self <= _encode_cache_unsigned else 0
+        if cache_size:
+            cache_key = (self.__class__, int(self))
+            cached_tag = encode_cache.get(cache_key)
+            if cached_tag is not None:
+                return TagList([cached_tag])
+
         # rip apart the number
         data = bytearray(struct.pack(">L", self))
         if _debug:
@@ -1025,6 +1175,9 @@ class Unsigned(Atomic, int):
         if _debug:
             Unsigned._debug(f"    - tag: {tag}")
 
+        if cache_size:
+            encode_cache.put(cache_key, tag, cache_size)
+
         return TagList([tag])
 
     @classmethod
@@ -1825,6 +1978,7 @@ class EnumeratedMetaclass(ElementMetaclass):
         _enum_map: Dict[str, int] = {}
         _attr_map: Dict[int, str] = {}
         _asn1_map: Dict[int, str] = {}
+        _attr_lookup: Dict[Union[int, str], str] = {}
 
         # include the maps we've already built
         for supercls in reversed(superclasses):
@@ -1834,6 +1988,8 @@ class EnumeratedMetaclass(ElementMetaclass):
                 _attr_map.update(supercls._attr_map)  # type: ignore[attr-defined]
             if hasattr(supercls, "_asn1_map"):
                 _asn1_map.update(supercls._asn1_map)  # type: ignore[attr-defined]
+            if hasattr(supercls, "_attr_lookup"):
+                _attr_lookup.update(supercls._attr_lookup)  # type: ignore[attr-defined]
 
         # look for integer properties
         for attr, value in attributedict.items():
@@ -1843,11 +1999,15 @@ class EnumeratedMetaclass(ElementMetaclass):
                 _enum_map[attr] = value
                 _attr_map[value] = attr
                 _asn1_map[value] = split_attr
+                _attr_lookup[value] = attr
+                _attr_lookup[split_attr] = attr
+                _attr_lookup[attr] = attr
 
         # add this special attribute to the class
         attributedict["_enum_map"] = _enum_map
         attributedict["_attr_map"] = _attr_map
         attributedict["_asn1_map"] = _asn1_map
+        attributedict["_attr_lookup"] = _attr_lookup
         if _debug:
             EnumeratedMetaclass._debug("    - _enum_map: %r", _enum_map)
 
@@ -1868,8 +2028,9 @@ class EnumeratedMetaclass(ElementMetaclass):
 
         # look up the string or interpret it as an int
         if args and isinstance(args[0], str):
-            if args[0] in cls._enum_map:  # type: ignore[attr-defined]
-                args = (cls._enum_map[args[0]],)  # type: ignore[attr-defined]
+            value = cls._enum_map.get(args[0], None)  # type: ignore[attr-defined]
+            if value is not None:
+                args = (value,)
             else:
                 try:
                     args = (int(args[0], base=0),)
@@ -1892,6 +2053,7 @@ class Enumerated(Atomic, int, metaclass=EnumeratedMetaclass):
     _enum_map: Dict[str, int] = {}
     _attr_map: Dict[int, str]
     _asn1_map: Dict[int, str]
+    _attr_lookup: Dict[Union[int, str], str]
     _low_limit: int = 0
     _high_limit: Optional[int] = None
 
@@ -1903,15 +2065,17 @@ class Enumerated(Atomic, int, metaclass=EnumeratedMetaclass):
         assert issubclass(cls, Enumerated)
 
         if isinstance(arg, str):
-            if arg in cls._enum_map:
-                arg = cls._enum_map[arg]
-            else:
-                try:
-                    arg = int(arg, base=0)
-                except ValueError:
-                    raise ValueError(arg)
+            value = cls._enum_map.get(arg, None)
+            if value is not None:
+                # named values are always in range
+                return value
+            try:
+                arg = int(arg, base=0)
+            except ValueError:
+                raise ValueError(arg)
         elif isinstance(arg, int):
-            pass
+            if arg in cls._attr_map:
+                return arg
         else:
             raise TypeError()
         if _debug:
@@ -1929,11 +2093,28 @@ class Enumerated(Atomic, int, metaclass=EnumeratedMetaclass):
 
     @property
     def attr(self) -> str:
-        return self._attr_map.get(self, str(self._value))
+        attr = self._attr_map.get(self, None)
+        if attr is None:
+            attr = str(self._value)
+        return attr
 
     @property
     def asn1(self) -> str:
-        return self._asn1_map.get(self, str(self._value))
+        asn1 = self._asn1_map.get(self, None)
+        if asn1 is None:
+            asn1 = str(self._value)
+        return asn1
+
+    @classmethod
+    def attr_of(cls, arg: Union[int, str]) -> str:
+        """
+        Return the attribute form of a value, name or hyphenated ASN.1 name,
+        like Enumerated(arg).attr without building an instance.
+        """
+        attr = cls._attr_lookup.get(arg, None)  # type: ignore[attr-defined]
+        if attr is None:
+            attr = cls(arg).attr  # type: ignore[operator]
+        return attr
 
     def __str__(self) -> str:
         return self.asn1
@@ -1946,6 +2127,14 @@ class Enumerated(Atomic, int, metaclass=EnumeratedMetaclass):
         if _debug:
             Enumerated._debug("Enumerated.encode")
 
+        # check for a previously encoded value
+        cache_size = settings.encode_cache
+        if cache_size:
+            cache_key = (self.__class__, int(self))
+            cached_tag = encode_cache.get(cache_key)
+            if cached_tag is not None:
+                return TagList([cached_tag])
+
         # pack the number
         data = bytearray(struct.pack(">L", self))
         if _debug:
@@ -1963,6 +2152,9 @@ class Enumerated(Atomic, int, metaclass=EnumeratedMetaclass):
         if _debug:
             Enumerated._debug(f"    - tag: {tag}")
 
+        if cache_size:
+            encode_cache.put(cache_key, tag, cache_size)
+
         return TagList([tag])
 
     @classmethod
@@ -3140,6 +3332,14 @@ class ObjectIdentifier(Atomic, tuple):
         if _debug:
             ObjectIdentifier._debug("ObjectIdentifier.encode")
 
+        # check for a previously encoded value
+        cache_size = settings.encode_cache
+        if cache_size:
+            cache_key = (self.__class__, int(self))
+            cached_tag = encode_cache.get(cache_key)
+            if cached_tag is not None:
+                return TagList([cached_tag])
+
         # pack the value
         data = struct.pack(">L", int(self))
         if _debug:
@@ -3153,6 +3353,9 @@ class ObjectIdentifier(Atomic, tuple):
         if _debug:
             ObjectIdentifier._debug(f"    - tag: {tag}")
 
+        if cache_size:
+            encode_cache.put(cache_key, tag, cache_size)
+
         return TagList([tag])
 
     @classmethod
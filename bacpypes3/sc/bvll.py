@@ -685,10 +685,10 @@ class Result(LPDU):
             error_class = ErrorClass(pdu.get_short())
             error_code = ErrorCode(pdu.get_short())
 
-            if not pdu.pduData:
+            if not pdu.remaining():
                 error_details = ""
             else:
-                error_details = pdu.get_data(len(pdu.pduData)).decode("utf-8")
+                error_details = pdu.get_data(pdu.remaining()).decode("utf-8")
 
             return Result(
                 result_function=result_function,
@@ -748,7 +748,7 @@ class EncapsulatedNPDU(LPDU):
             EncapsulatedNPDU._debug("decode %r", pdu)
 
         lpdu = EncapsulatedNPDU()
-        lpdu.put_data(pdu.get_data(len(pdu.pduData)))
+        lpdu.put_data(pdu.get_data(pdu.remaining()))
 
         return lpdu
 
@@ -823,10 +823,10 @@ class AddressResolutionACK(LPDU):
 
         lpdu = AddressResolutionACK()
 
-        if not pdu.pduData:
+        if not pdu.remaining():
             lpdu.websocket_uris = ""
         else:
-            lpdu.websocket_uris = pdu.get_data(len(pdu.pduData)).decode("utf-8")
+            lpdu.websocket_uris = pdu.get_data(pdu.remaining()).decode("utf-8")
 
         return lpdu
 
@@ -1252,7 +1252,7 @@ class ProprietaryMessage(LPDU):
 
         vendor_identifier = pdu.get_short()
         proprietary_function = pdu.get()
-        proprietary_data = pdu.get_data(len(pdu.pduData))
+        proprietary_data = pdu.get_data(pdu.remaining())
 
         return ProprietaryMessage(
             vendor_identifier,
@@ -34,6 +34,7 @@ from ..apdu import (
     UnconfirmedCOVNotificationRequest,
 )
 from ..vendor import get_vendor_info
+from ..timer import AnyTimerHandle, call_later
 
 # some debugging
 _debug = 0
@@ -178,8 +179,8 @@ class SubscriptionContextManager:
             SubscriptionContextManager._debug("    - loop time: %r", loop.time())
 
         # refresh time before it expires
-        self.refresh_subscription_handle = loop.call_later(
-            max(1.0, self.lifetime - 2.0), self.create_refresh_task
+        self.refresh_subscription_handle = call_later(
+            max(1.0, self.lifetime - 2.0), self.create_refresh_task, loop=loop
         )
         if _debug:
             SubscriptionContextManager._debug(
@@ -191,7 +192,7 @@ class SubscriptionContextManager:
 
     def create_refresh_task(self):
         """
-        Create a refresh task.  The `loop.call_later()` function does
+        Create a refresh task.  The `call_later()` function does
         not take a coroutine so this function creates a task wrapping
         the `refresh_subscription()` coroutine.
         """
@@ -312,7 +313,7 @@ class Subscription(DebugContents):
         "lifetime",
     )
 
-    cancel_handle: Optional[asyncio.TimerHandle]
+    cancel_handle: Optional[AnyTimerHandle]
 
     def __init__(
         self, obj_ref, client_addr, proc_id, obj_id, confirmed, lifetime, cov_inc
@@ -342,8 +343,8 @@ class Subscription(DebugContents):
         # if lifetime is zero this is a permanent subscription
         if lifetime > 0:
             loop = asyncio.get_running_loop()
-            self.cancel_handle = loop.call_later(
-                lifetime, self.obj_ref._app.cancel_subscription, self
+            self.cancel_handle = call_later(
+                lifetime, self.obj_ref._app.cancel_subscription, self, loop=loop
             )
         else:
             self.cancel_handle = None
@@ -375,8 +376,8 @@ class Subscription(DebugContents):
         # reschedule a cancel if it's not infinite
         if lifetime > 0:
             loop = asyncio.get_running_loop()
-            self.cancel_handle = loop.call_later(
-                lifetime, self.obj_ref._app.cancel_subscription, self
+            self.cancel_handle = call_later(
+                lifetime, self.obj_ref._app.cancel_subscription, self, loop=loop
             )
 
 
@@ -36,6 +36,7 @@ from ..apdu import (
     DeviceCommunicationControlRequest,
     SimpleAckPDU,
 )
+from ..timer import call_later
 
 # some debugging
 _debug = 0
@@ -99,7 +100,9 @@ class WhoIsFuture:
             WhoIsFuture._debug("    - loop time: %r", loop.time())
 
         # schedule a call
-        self.who_is_timeout_handle = loop.call_later(self.timeout, self.who_is_timeout)
+        self.who_is_timeout_handle = call_later(
+            self.timeout, self.who_is_timeout, loop=loop
+        )
         if _debug:
             WhoIsFuture._debug(
                 "    - who_is_timeout_handle: %r", self.who_is_timeout_handle
@@ -369,8 +372,8 @@ class WhoHasFuture:
             WhoHasFuture._debug("    - loop time: %r", loop.time())
 
         # schedule a call
-        self.who_has_timeout_handle = loop.call_later(
-            self.timeout, self.who_has_timeout
+        self.who_has_timeout_handle = call_later(
+            self.timeout, self.who_has_timeout, loop=loop
         )
         if _debug:
             WhoHasFuture._debug(
@@ -4,11 +4,16 @@ Application Module
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 from typing import Any as _Any
-from typing import Callable, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Set, Tuple, Union
 
 from ..apdu import (
+    AbortPDU,
+    AbortReason,
+    ConfirmedRequestPDU,
+    Error,
     ErrorRejectAbortNack,
     ReadPropertyACK,
     ReadPropertyMultipleACK,
@@ -16,9 +21,12 @@ from ..apdu import (
     ReadPropertyRequest,
     ReadRangeACK,
     ReadRangeRequest,
+    RejectPDU,
+    RejectReason,
     SimpleAckPDU,
     WritePropertyRequest,
     WritePropertyMultipleError,
+    WritePropertyMultipleRequest,
 )
 from ..basetypes import (
     DateTime,
@@ -34,23 +42,409 @@ from ..basetypes import (
     ReadAccessResultElementChoice,
     ReadAccessSpecification,
     ObjectPropertyReference,
+    PropertyValue,
+    Segmentation,
+    ServicesSupported,
+    WriteAccessSpecification,
 )
 from ..constructeddata import Any, Array, List, SequenceOf
-from ..debugging import ModuleLogger, bacpypes_debugging
+from ..debugging import DebugContents, ModuleLogger, bacpypes_debugging
 from ..errors import (
     ExecutionError,
     ObjectError,
     PropertyError,
 )
-from ..object import DeviceObject
+from ..object import DeviceObject, Object
 from ..pdu import Address
-from ..primitivedata import Atomic, Date, Null, ObjectIdentifier, Time, Unsigned
+from ..primitivedata import (
+    Atomic,
+    Date,
+    Null,
+    ObjectIdentifier,
+    TagList,
+    Time,
+    Unsigned,
+)
+from ..timer import AnyTimerHandle, call_later
 from ..vendor import VendorInfo, get_vendor_info
 
 # some debugging
 _debug = 0
 _log = ModuleLogger(globals())
 
+# the size of the largest request assumed for devices that are not in the
+# device information cache, and the approximate number of octets a read
+# takes in a response so the response to a batch of reads is not segmented
+COALESCE_MAX_APDU_LENGTH = 480
+COALESCE_READ_SIZE = 24
+
+# the device aborts a request when the response is too big, the reads are
+# split up and sent again
+COALESCE_SPLIT_REASONS = (
+    AbortReason.segmentationNotSupported,
+    AbortReason.bufferOverflow,
+    AbortReason.apduTooLong,
+)
+
+# read property requests are matched with their results by this
+ReadKey = Tuple[ObjectIdentifier, PropertyIdentifier, Optional[int]]
+
+
+def read_key(apdu: ReadPropertyRequest) -> ReadKey:
+    return (
+        apdu.objectIdentifier,
+        apdu.propertyIdentifier,
+        apdu.propertyArrayIndex,
+    )
+
+
+#
+#   ReadPropertyCoalescer
+#
+
+
+@bacpypes_debugging
+class ReadPropertyCoalescer(DebugContents):
+    """
+    Gather the Read Property requests to a device that are made within a
+    short window of time and send them together as a Read Property Multiple
+    request, then split the results back out to the individual requests.
+    Devices that do not support Read Property Multiple get the requests one
+    at a time, and when the response to a batch is too big for the device
+    to send, the batch is split up.
+    """
+
+    _debug_contents = (
+        "window",
+        "pending",
+        "single_read",
+        "read_limits",
+        "reads",
+        "batches",
+    )
+    _debug: Callable[..., None]
+
+    window: float
+    pending: Dict[Address, List[Tuple[ReadPropertyRequest, asyncio.Future]]]
+    pending_handles: Dict[Address, AnyTimerHandle]
+    single_read: Set[Address]
+    read_limits: Dict[Address, int]
+
+    def __init__(self, app: _Any, window: float = 0.01) -> None:
+        if _debug:
+            ReadPropertyCoalescer._debug("__init__ window=%r", window)
+
+        self.app = app
+        self.window = window
+
+        # reads waiting for the window to close
+        self.pending = {}
+        self.pending_handles = {}
+
+        # devices that do not support Read Property Multiple
+        self.single_read = set()
+
+        # the number of reads that the responses of devices have fit
+        self.read_limits = {}
+
+        # counters
+        self.reads = 0
+        self.batches = 0
+
+    def max_reads(self, address: Address) -> int:
+        """
+        Return the number of reads that will fit in a request to the device.
+        The response has to fit in one APDU unless the device can send it in
+        segments and this application can receive them, and it is no more
+        than the device has been able to answer.
+        """
+        device_info = self.app.device_info_cache.address_cache.get(address, None)
+        if device_info and device_info.max_apdu_length_accepted:
+            max_apdu_length = device_info.max_apdu_length_accepted
+        else:
+            max_apdu_length = COALESCE_MAX_APDU_LENGTH
+        max_reads = max(1, max_apdu_length // COALESCE_READ_SIZE)
+
+        if device_info and device_info.segmentation_supported in (
+            Segmentation.segmentedTransmit,
+            Segmentation.segmentedBoth,
+        ):
+            asap = self.app.asap
+            segmentation_supported = getattr(
+                asap.device_object, "segmentationSupported", asap.segmentationSupported
+            )
+            if segmentation_supported in (
+                Segmentation.segmentedReceive,
+                Segmentation.segmentedBoth,
+            ):
+                max_segments = getattr(
+                    asap.device_object, "maxSegmentsAccepted", asap.maxSegmentsAccepted
+                )
+                max_reads *= max_segments or 1
+
+        return min(max_reads, self.read_limits.get(address, max_reads))
+
+    def supports_read_multiple(self, address: Address) -> bool:
+        """
+        Return true unless the device is known not to support Read Property
+        Multiple.
+        """
+        if address in self.single_read:
+            return False
+
+        device_info = self.app.device_info_cache.address_cache.get(address, None)
+        if device_info and (
+            device_info.service_supported(ServicesSupported.readPropertyMultiple)
+            is False
+        ):
+            return False
+
+        return True
+
+    def request(self, apdu: ReadPropertyRequest) -> asyncio.Future:
+        """
+        Return a future for the response to the request, which is sent with
+        the others to the same device when the window closes or there are
+        enough of them.
+        """
+        if _debug:
+            ReadPropertyCoalescer._debug("request %r", apdu)
+
+        address = apdu.pduDestination
+        self.reads += 1
+
+        # broadcasts and devices that can only do one at a time
+        if (
+            address.addrType
+            not in (Address.localStationAddr, Address.remoteStationAddr)
+        ) or (not self.supports_read_multiple(address)):
+            return self.app.request(apdu)
+
+        future = asyncio.get_running_loop().create_future()
+
+        reads = self.pending.get(address, None)
+        if reads is None:
+            reads = self.pending[address] = []
+            self.pending_handles[address] = call_later(
+                self.window, self.flush, address
+            )
+        reads.append((apdu, future))
+
+        # no need to wait for more
+        if len(reads) >= self.max_reads(address):
+            self.flush(address)
+
+        return future
+
+    def flush(self, address: Address) -> None:
+        """
+        The window has closed, send the reads that have been gathered.
+        """
+        if _debug:
+            ReadPropertyCoalescer._debug("flush %r", address)
+
+        self.pending_handles.pop(address).cancel()
+        reads = self.pending.pop(address)
+
+        if len(reads) == 1:
+            self.read_single(*reads[0])
+        else:
+            asyncio.create_task(self.read_multiple(address, reads))
+
+    def read_single(self, apdu: ReadPropertyRequest, future: asyncio.Future) -> None:
+        """
+        Send the request by itself and pass the response along.
+        """
+        if future.done():
+            return
+
+        request_future = self.app.request(apdu)
+
+        def request_done(request_future: asyncio.Future) -> None:
+            if future.done():
+                pass
+            elif request_future.cancelled():
+                future.cancel()
+            elif request_future.exception():
+                future.set_exception(request_future.exception())
+            else:
+                future.set_result(request_future.result())
+
+        request_future.add_done_callback(request_done)
+        future.add_done_callback(
+            lambda future: future.cancelled() and request_future.cancel()
+        )
+
+    async def read_multiple(
+        self,
+        address: Address,
+        reads: List[Tuple[ReadPropertyRequest, asyncio.Future]],
+    ) -> None:
+        """
+        Send the reads as a Read Property Multiple request, reads of the same
+        object share an access specification and reads of the same property
+        share a reference.
+        """
+        if _debug:
+            ReadPropertyCoalescer._debug("read_multiple %r %r", address, len(reads))
+
+        try:
+            read_futures: Dict[ReadKey, List[asyncio.Future]] = {}
+            read_access_specs: Dict[ObjectIdentifier, List[PropertyReference]] = {}
+            for apdu, future in reads:
+                key = read_key(apdu)
+                if key not in read_futures:
+                    read_futures[key] = []
+                    read_access_specs.setdefault(key[0], []).append(
+                        PropertyReference(
+                            propertyIdentifier=key[1], propertyArrayIndex=key[2]
+                        )
+                    )
+                read_futures[key].append(future)
+
+            read_property_multiple_request = ReadPropertyMultipleRequest(
+                listOfReadAccessSpecs=SequenceOf(ReadAccessSpecification)(
+                    [
+                        ReadAccessSpecification(
+                            objectIdentifier=object_identifier,
+                            listOfPropertyReferences=property_references,
+                        )
+                        for object_identifier, property_references in (
+                            read_access_specs.items()
+                        )
+                    ]
+                ),
+                destination=address,
+            )
+            self.batches += 1
+
+            try:
+                response = await self.app.request(read_property_multiple_request)
+            except ErrorRejectAbortNack as err:
+                if _debug:
+                    ReadPropertyCoalescer._debug("    - error/reject/abort: %r", err)
+
+                # the device does not know this service, read them one at a
+                # time, when the response is too big split them up, otherwise
+                # every read gets the same error
+                if (
+                    isinstance(err, RejectPDU)
+                    and err.apduAbortRejectReason == RejectReason.unrecognizedService
+                ):
+                    self.single_read.add(address)
+                    response = None
+                elif (
+                    isinstance(err, AbortPDU)
+                    and err.apduAbortRejectReason in COALESCE_SPLIT_REASONS
+                ):
+                    await self.split_reads(address, reads)
+                    return
+                else:
+                    for apdu, future in reads:
+                        if not future.done():
+                            future.set_exception(err)
+                    return
+
+            if isinstance(response, ReadPropertyMultipleACK):
+                for read_access_result in response.listOfReadAccessResults:
+                    object_identifier = read_access_result.objectIdentifier
+                    for read_access_result_element in read_access_result.listOfResults:
+                        key = (
+                            object_identifier,
+                            read_access_result_element.propertyIdentifier,
+                            read_access_result_element.propertyArrayIndex,
+                        )
+                        futures = read_futures.pop(key, [])
+
+                        # build what would have come back from a read property
+                        read_result = read_access_result_element.readResult
+                        if read_result.propertyAccessError:
+                            error = Error(
+                                service_choice=ReadPropertyRequest.service_choice,
+                                errorClass=read_result.propertyAccessError.errorClass,
+                                errorCode=read_result.propertyAccessError.errorCode,
+                                source=address,
+                            )
+                            for future in futures:
+                                if not future.done():
+                                    future.set_exception(error)
+                            continue
+
+                        # the value is context encoded for the read access result,
+                        # strip off the opening and closing tags
+                        read_property_ack = ReadPropertyACK(
+                            objectIdentifier=key[0],
+                            propertyIdentifier=key[1],
+                            propertyArrayIndex=key[2],
+                            propertyValue=Any(
+                                TagList(read_result.propertyValue.tagList[1:-1])
+                            ),
+                            source=address,
+                        )
+                        for future in futures:
+                            if not future.done():
+                                future.set_result(read_property_ack)
+
+            # anything left over goes by itself
+            for apdu, future in reads:
+                if read_key(apdu) in read_futures:
+                    self.read_single(apdu, future)
+
+        except BaseException as err:
+            if _debug:
+                ReadPropertyCoalescer._debug("    - exception: %r", err)
+
+            # the callers are not left waiting
+            for apdu, future in reads:
+                if future.done():
+                    continue
+                if isinstance(err, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(err)
+            if isinstance(err, asyncio.CancelledError):
+                raise
+
+    async def split_reads(
+        self,
+        address: Address,
+        reads: List[Tuple[ReadPropertyRequest, asyncio.Future]],
+    ) -> None:
+        """
+        The response to the reads was too big for the device to send, send
+        them again in two halves and remember to send fewer at a time.
+        """
+        if _debug:
+            ReadPropertyCoalescer._debug("split_reads %r %r", address, len(reads))
+
+        half = len(reads) // 2
+        self.read_limits[address] = max(
+            1, min(half, self.read_limits.get(address, half))
+        )
+
+        for batch in (reads[:half], reads[half:]):
+            if len(batch) == 1:
+                self.read_single(*batch[0])
+            elif batch:
+                await self.read_multiple(address, batch)
+
+    def close(self) -> None:
+        """
+        Cancel the reads that have not been sent.
+        """
+        if _debug:
+            ReadPropertyCoalescer._debug("close")
+
+        for handle in self.pending_handles.values():
+            handle.cancel()
+        for reads in self.pending.values():
+            for apdu, future in reads:
+                future.cancel()
+
+        self.pending_handles = {}
+        self.pending = {}
+
+
 #
 #   ReadProperty and WriteProperty Services
 #
@@ -62,6 +456,7 @@ class ReadWritePropertyServices:
 
     device_object: Optional[DeviceObject]
     device_info_cache: "DeviceInfoCache"  # noqa: F821
+    read_property_coalescer: Optional[ReadPropertyCoalescer] = None
 
     async def read_property(
         self,
@@ -122,8 +517,11 @@ class ReadWritePropertyServices:
                 "    - read_property_request: %r", read_property_request
             )
 
-        # send the request, wait for the response
-        response = await self.request(read_property_request)
+        # send the request, maybe with others, wait for the response
+        if self.read_property_coalescer:
+            response = await self.read_property_coalescer.request(read_property_request)
+        else:
+            response = await self.request(read_property_request)
         if _debug:
             ReadWritePropertyServices._debug("    - response: %r", response)
         if isinstance(response, ErrorRejectAbortNack):
@@ -314,20 +712,12 @@ class ReadWritePropertyServices:
         if _debug:
             ReadWritePropertyServices._debug("    - object: %r", obj)
 
-        # get the value
-        try:
-            value = await obj.read_property(
-                apdu.propertyIdentifier, apdu.propertyArrayIndex
-            )
-            if _debug:
-                ReadWritePropertyServices._debug("    - value: %r", value)
-
-            # if it is None then the property is defined but isn't there
-            if value is None:
-                raise PropertyError(errorCode="unknownProperty")
-        except AttributeError:
-            # exception if this is not a defined property
-            raise PropertyError(errorCode="unknownProperty")
+        # get the value, which might have already been encoded
+        value = await read_property_to_any(
+            obj, apdu.propertyIdentifier, apdu.propertyArrayIndex
+        )
+        if _debug:
+            ReadWritePropertyServices._debug("    - value: %r", value)
 
         # build a response
         resp = ReadPropertyACK(
@@ -404,6 +794,40 @@ class ReadWritePropertyServices:
 #
 
 
+def property_cache_attr(obj, propertyIdentifier, propertyArrayIndex=None):
+    """Return the attribute name of the property if the encoded value of the
+    property can be saved in the property cache of the object, otherwise None."""
+    if obj._property_cache is None:
+        return None
+
+    # the entire value, read in the usual way
+    if propertyArrayIndex is not None:
+        return None
+    if type(obj).read_property is not Object.read_property:
+        return None
+
+    if isinstance(propertyIdentifier, int):
+        propertyIdentifier = obj._property_identifier_class.attr_of(propertyIdentifier)
+    if propertyIdentifier not in obj._elements:
+        return None
+
+    return propertyIdentifier
+
+
+def property_cache_value(obj, attr, value) -> bool:
+    """Return true if the value of the property can be saved in the property
+    cache of the object, it must not change without the object knowing."""
+    if attr in obj._cached_properties:
+        return True
+
+    # @property values could be calculated each time they are read
+    if isinstance(inspect.getattr_static(obj, attr, None), property):
+        return False
+
+    # immutable atomic values only, bit strings are lists
+    return isinstance(value, Atomic) and not isinstance(value, list)
+
+
 @bacpypes_debugging
 async def read_property_to_any(obj, propertyIdentifier, propertyArrayIndex=None):
     """Read the specified property of the object, with the optional array index,
@@ -413,6 +837,15 @@ async def read_property_to_any(obj, propertyIdentifier, propertyArrayIndex=None)
             "read_property_to_any %s %r %r", obj, propertyIdentifier, propertyArrayIndex
         )
 
+    # check for a previously encoded value
+    cache_attr = property_cache_attr(obj, propertyIdentifier, propertyArrayIndex)
+    if cache_attr is not None:
+        cached_tags = obj._property_cache.get(cache_attr, None)
+        if cached_tags is not None:
+            if _debug:
+                read_property_to_any._debug("    - cached: %r", cached_tags)
+            return Any(TagList(list(cached_tags)))
+
     try:
         # get the value
         value = await obj.read_property(propertyIdentifier, propertyArrayIndex)
@@ -437,6 +870,10 @@ async def read_property_to_any(obj, propertyIdentifier, propertyArrayIndex=None)
     if _debug:
         read_property_to_any._debug("    - result: %r", result)
 
+    # save the tags for the next time
+    if (cache_attr is not None) and property_cache_value(obj, cache_attr, value):
+        obj._property_cache[cache_attr] = tuple(result.tagList)
+
     # return the object
     return result
 
@@ -491,6 +928,224 @@ async def read_property_to_result_element(
     return read_access_result_element
 
 
+def property_datatype(
+    object_class: _Any,
+    property_identifier: PropertyIdentifier,
+    property_array_index: Optional[int],
+) -> Optional[type]:
+    """
+    Return the datatype of a property value or one of its array elements, or
+    None if the object class or property is not known.
+    """
+    if object_class is None:
+        return None
+
+    property_type = object_class.get_property_type(property_identifier)
+    if property_type is None:
+        return None
+
+    if issubclass(property_type, Array):
+        if property_array_index is None:
+            pass
+        elif property_array_index == 0:
+            property_type = Unsigned
+        else:
+            property_type = property_type._subtype
+
+    return property_type
+
+
+# the results of reading these can be for any of the properties of the object
+COMPILE_SPECIAL_PROPERTIES = (
+    PropertyIdentifier.all,
+    PropertyIdentifier.required,
+    PropertyIdentifier.optional,
+)
+
+
+@bacpypes_debugging
+class CompiledReadPropertyMultiple(DebugContents):
+    """
+    A Read Property Multiple request that has already been parsed and
+    encoded, along with the datatypes of the results, returned by
+    compile_rpm().  Calling read() sends it and returns the results in the
+    same form as read_property_multiple().
+    """
+
+    _debug_contents = (
+        "address",
+        "object_identifiers",
+        "service_data",
+        "datatypes",
+        "reads",
+    )
+    _debug: Callable[..., None]
+    _warning: Callable[..., None]
+
+    address: Address
+    object_identifiers: List[ObjectIdentifier]
+    service_data: bytes
+    datatypes: Dict[ReadKey, Optional[type]]
+    vendor_info: VendorInfo
+
+    def __init__(
+        self,
+        app: _Any,
+        address: Address,
+        object_identifiers: List[ObjectIdentifier],
+        service_data: bytes,
+        datatypes: Dict[ReadKey, Optional[type]],
+        vendor_info: VendorInfo,
+    ) -> None:
+        if _debug:
+            CompiledReadPropertyMultiple._debug("__init__ %r", address)
+
+        self.app = app
+        self.address = address
+        self.object_identifiers = object_identifiers
+        self.service_data = service_data
+        self.datatypes = datatypes
+        self.vendor_info = vendor_info
+
+        # counter
+        self.reads = 0
+
+    def request(self) -> ConfirmedRequestPDU:
+        """
+        Return a new request, each one gets its own invoke ID.
+        """
+        return ConfirmedRequestPDU(
+            ReadPropertyMultipleRequest.service_choice,
+            None,
+            self.service_data,
+            destination=self.address,
+        )
+
+    def datatype(
+        self,
+        object_identifier: ObjectIdentifier,
+        property_identifier: PropertyIdentifier,
+        property_array_index: Optional[int],
+    ) -> Optional[type]:
+        """
+        Return the datatype of a result, those that were not resolved when
+        it was compiled, like the results of reading all of the properties,
+        are resolved the first time they are seen.
+        """
+        key = (object_identifier, property_identifier, property_array_index)
+        try:
+            return self.datatypes[key]
+        except KeyError:
+            pass
+
+        property_type = property_datatype(
+            self.vendor_info.get_object_class(object_identifier[0]),
+            property_identifier,
+            property_array_index,
+        )
+        self.datatypes[key] = property_type
+        return property_type
+
+    async def read(
+        self,
+    ) -> Union[
+        List[Tuple[ObjectIdentifier, PropertyIdentifier, Union[int, None], _Any]],
+        ErrorRejectAbortNack,
+        None,
+    ]:
+        if _debug:
+            CompiledReadPropertyMultiple._debug("read")
+        self.reads += 1
+
+        # send the request, wait for the response
+        response = await self.app.request(self.request())
+        if isinstance(response, ErrorRejectAbortNack):
+            if _debug:
+                CompiledReadPropertyMultiple._debug(
+                    "    - error/reject/abort: %r", response
+                )
+            return response
+        if not isinstance(response, ReadPropertyMultipleACK):
+            if _debug:
+                CompiledReadPropertyMultiple._debug(
+                    "    - invalid response: %r", response
+                )
+            return None
+
+        # build up a list of results
+        result_list = []
+        for read_access_result in response.listOfReadAccessResults:
+            object_identifier = read_access_result.objectIdentifier
+            for read_access_result_element in read_access_result.listOfResults:
+                property_identifier = read_access_result_element.propertyIdentifier
+                property_array_index = read_access_result_element.propertyArrayIndex
+                read_result = read_access_result_element.readResult
+
+                if read_result.propertyAccessError:
+                    property_value = read_result.propertyAccessError
+                else:
+                    property_type = self.datatype(
+                        object_identifier, property_identifier, property_array_index
+                    )
+                    if property_type is None:
+                        CompiledReadPropertyMultiple._warning(
+                            "%r not supported", property_identifier
+                        )
+                        property_value = None
+                    else:
+                        property_value = read_result.propertyValue.cast_out(
+                            property_type
+                        )
+
+                result_list.append(
+                    (
+                        object_identifier,
+                        property_identifier,
+                        property_array_index,
+                        property_value,
+                    )
+                )
+
+        # return the list of results
+        return result_list
+
+    async def read_columns(
+        self, columns: _Any, with_address: bool = False
+    ) -> Union[ErrorRejectAbortNack, None]:
+        """
+        Send the request and store the results in a ResultColumns object from
+        bacpypes3.lib.columns rather than returning them, the rows are found
+        by object identifier, or by (address, object identifier) when
+        with_address is set.  If the request fails the error is stored for
+        each of the objects and returned.
+        """
+        if _debug:
+            CompiledReadPropertyMultiple._debug("read_columns")
+        self.reads += 1
+
+        address = self.address if with_address else None
+
+        # send the request, wait for the response
+        try:
+            response = await self.app.request(self.request())
+        except ErrorRejectAbortNack as err:
+            response = err
+        if isinstance(response, ReadPropertyMultipleACK):
+            columns.store_read_access_results(
+                response.listOfReadAccessResults, address=address
+            )
+            return None
+        if _debug:
+            CompiledReadPropertyMultiple._debug("    - failed: %r", response)
+
+        for object_identifier in self.object_identifiers:
+            columns.store(
+                object_identifier if address is None else (address, object_identifier),
+                response,
+            )
+        return response if isinstance(response, ErrorRejectAbortNack) else None
+
+
 @bacpypes_debugging
 class ReadWritePropertyMultipleServices:
     _debug: Callable[..., None]
@@ -530,57 +1185,9 @@ class ReadWritePropertyMultipleServices:
                     "    - vendor_info: %r", vendor_info
                 )
 
-        list_of_read_access_specs = []
-        while parameter_list:
-            read_access_spec = ReadAccessSpecification()
-            list_of_read_access_specs.append(read_access_spec)
-
-            object_identifier, property_reference_list, *parameter_list = parameter_list
-
-            # parse the object identifier if needed
-            if isinstance(object_identifier, str):
-                object_identifier = await self.parse_object_identifier(
-                    object_identifier, vendor_info=vendor_info
-                )
-            elif not isinstance(object_identifier, ObjectIdentifier):
-                raise TypeError("objid")
-            if _debug:
-                ReadWritePropertyMultipleServices._debug(
-                    "    - object_identifier: %r", object_identifier
-                )
-            read_access_spec.objectIdentifier = object_identifier
-
-            list_of_property_references = []
-            for property_reference in property_reference_list:
-                if _debug:
-                    ReadWritePropertyMultipleServices._debug(
-                        "    - property_reference: %r", property_reference
-                    )
-
-                # parse the property reference if needed
-                if isinstance(property_reference, PropertyReference):
-                    property_reference = property_reference
-                elif isinstance(property_reference, PropertyIdentifier):
-                    property_reference = PropertyReference(
-                        propertyIdentifier=property_reference
-                    )
-                elif isinstance(property_reference, str):
-                    property_reference = await self.parse_property_reference(
-                        property_reference, vendor_info=vendor_info
-                    )
-                else:
-                    raise TypeError("property_reference")
-                if _debug:
-                    ReadWritePropertyMultipleServices._debug(
-                        "    - property_reference: %r", property_reference
-                    )
-                list_of_property_references.append(property_reference)
-
-            read_access_spec.listOfPropertyReferences = list_of_property_references
-
-        if len(list_of_read_access_specs) == 0:
-            raise TypeError("read access specification expected")
-
+        list_of_read_access_specs = await self._read_access_specs(
+            parameter_list, vendor_info
+        )
         read_property_multiple_request = ReadPropertyMultipleRequest(
             listOfReadAccessSpecs=SequenceOf(ReadAccessSpecification)(
                 list_of_read_access_specs
@@ -645,7 +1252,9 @@ class ReadWritePropertyMultipleServices:
                     continue
 
                 # get the datatype
-                property_type = object_class.get_property_type(property_identifier)
+                property_type = property_datatype(
+                    object_class, property_identifier, property_array_index
+                )
                 if _debug:
                     ReadWritePropertyMultipleServices._debug(
                         "    - property_type: %r", property_type
@@ -664,18 +1273,6 @@ class ReadWritePropertyMultipleServices:
                     )
                     continue
 
-                if issubclass(property_type, Array):
-                    if property_array_index is None:
-                        pass
-                    elif property_array_index == 0:
-                        property_type = Unsigned
-                    else:
-                        property_type = property_type._subtype
-                    if _debug:
-                        ReadWritePropertyMultipleServices._debug(
-                            "    - other property_type: %r", property_type
-                        )
-
                 property_value = read_result.propertyValue.cast_out(property_type)
                 if _debug:
                     ReadWritePropertyMultipleServices._debug(
@@ -696,6 +1293,310 @@ class ReadWritePropertyMultipleServices:
         # return the list of results
         return result_list
 
+    async def compile_rpm(
+        self,
+        address: Address,
+        parameter_list: List[
+            Tuple[
+                Union[ObjectIdentifier, str],
+                List[Union[PropertyReference, PropertyIdentifier, str]],
+            ],
+        ],
+        vendor_info: Optional[VendorInfo] = None,
+    ) -> CompiledReadPropertyMultiple:
+        """
+        Parse the parameters of a Read Property Multiple request the same way
+        read_property_multiple() does, but rather than sending it return an
+        object that has the request already encoded and the datatypes of the
+        results already resolved.  Reading it again and again, like polling
+        a list of points, skips all of that work.
+        """
+        if _debug:
+            ReadWritePropertyMultipleServices._debug(
+                "compile_rpm %r %r", address, parameter_list
+            )
+
+        # parse the address if needed
+        if isinstance(address, str):
+            address = Address(address)
+        elif not isinstance(address, Address):
+            raise TypeError("address")
+
+        # look up the vendor information if it was not provided
+        if not vendor_info:
+            vendor_info = await self.get_vendor_info(device_address=address)
+            if _debug:
+                ReadWritePropertyMultipleServices._debug(
+                    "    - vendor_info: %r", vendor_info
+                )
+
+        list_of_read_access_specs = await self._read_access_specs(
+            parameter_list, vendor_info
+        )
+        service_data = bytes(
+            ReadPropertyMultipleRequest(
+                listOfReadAccessSpecs=SequenceOf(ReadAccessSpecification)(
+                    list_of_read_access_specs
+                ),
+            )
+            .encode()
+            .pduData
+        )
+
+        # resolve the datatypes of the results, the special property
+        # identifiers are resolved when the results come back
+        datatypes: Dict[ReadKey, Optional[type]] = {}
+        for read_access_spec in list_of_read_access_specs:
+            object_identifier = read_access_spec.objectIdentifier
+            object_class = vendor_info.get_object_class(object_identifier[0])
+            for property_reference in read_access_spec.listOfPropertyReferences:
+                property_identifier = property_reference.propertyIdentifier
+                if property_identifier in COMPILE_SPECIAL_PROPERTIES:
+                    continue
+                property_array_index = property_reference.propertyArrayIndex
+                datatypes[
+                    (object_identifier, property_identifier, property_array_index)
+                ] = property_datatype(
+                    object_class, property_identifier, property_array_index
+                )
+        if _debug:
+            ReadWritePropertyMultipleServices._debug("    - datatypes: %r", datatypes)
+
+        return CompiledReadPropertyMultiple(
+            self,
+            address,
+            [
+                read_access_spec.objectIdentifier
+                for read_access_spec in list_of_read_access_specs
+            ],
+            service_data,
+            datatypes,
+            vendor_info,
+        )
+
+    async def _read_access_specs(
+        self,
+        parameter_list: List[
+            Tuple[
+                Union[ObjectIdentifier, str],
+                List[Union[PropertyReference, PropertyIdentifier, str]],
+            ],
+        ],
+        vendor_info: VendorInfo,
+    ) -> List[ReadAccessSpecification]:
+        """
+        Parse the objects and property references of a Read Property Multiple
+        request into a list of read access specifications.
+        """
+        list_of_read_access_specs = []
+        while parameter_list:
+            read_access_spec = ReadAccessSpecification()
+            list_of_read_access_specs.append(read_access_spec)
+
+            object_identifier, property_reference_list, *parameter_list = parameter_list
+
+            # parse the object identifier if needed
+            if isinstance(object_identifier, str):
+                object_identifier = await self.parse_object_identifier(
+                    object_identifier, vendor_info=vendor_info
+                )
+            elif not isinstance(object_identifier, ObjectIdentifier):
+                raise TypeError("objid")
+            if _debug:
+                ReadWritePropertyMultipleServices._debug(
+                    "    - object_identifier: %r", object_identifier
+                )
+            read_access_spec.objectIdentifier = object_identifier
+
+            list_of_property_references = []
+            for property_reference in property_reference_list:
+                if _debug:
+                    ReadWritePropertyMultipleServices._debug(
+                        "    - property_reference: %r", property_reference
+                    )
+
+                # parse the property reference if needed
+                if isinstance(property_reference, PropertyReference):
+                    property_reference = property_reference
+                elif isinstance(property_reference, PropertyIdentifier):
+                    property_reference = PropertyReference(
+                        propertyIdentifier=property_reference
+                    )
+                elif isinstance(property_reference, str):
+                    property_reference = await self.parse_property_reference(
+                        property_reference, vendor_info=vendor_info
+                    )
+                else:
+                    raise TypeError("property_reference")
+                if _debug:
+                    ReadWritePropertyMultipleServices._debug(
+                        "    - property_reference: %r", property_reference
+                    )
+                list_of_property_references.append(property_reference)
+
+            read_access_spec.listOfPropertyReferences = list_of_property_references
+
+        if len(list_of_read_access_specs) == 0:
+            raise TypeError("read access specification expected")
+
+        return list_of_read_access_specs
+
+    async def write_property_multiple(
+        self,
+        address: Union[Address, str],
+        parameter_list: List[
+            Tuple[
+                Union[ObjectIdentifier, str],
+                List[Union[PropertyValue, Tuple[_Any, ...]]],
+            ],
+        ],
+        vendor_info: Optional[VendorInfo] = None,
+    ) -> None:
+        """
+        Send a Write Property Multiple Request to an address and expect a
+        simple acknowledgement.  The parameter list is like the one for
+        read_property_multiple(), an object identifier followed by a list of
+        property values that are PropertyValue instances or (property,
+        value) or (property, value, priority) tuples, for example:
+
+            ["analog-value,1", [("present-value", 75.0, 8)], ...]
+
+        The values are cast to the datatype of the property if necessary.
+        If the device is not able to make all of the writes the error, which
+        is a WritePropertyMultipleError with the first failed write attempt
+        when the device provides it, or the reject or abort is raised.  Any
+        other response than a simple acknowledgement raises a RuntimeError.
+        """
+        if _debug:
+            ReadWritePropertyMultipleServices._debug(
+                "write_property_multiple %r %r", address, parameter_list
+            )
+
+        # parse the address if needed
+        if isinstance(address, str):
+            address = Address(address)
+        elif not isinstance(address, Address):
+            raise TypeError("address")
+
+        # get the vendor information to have a context for parsing
+        if not vendor_info:
+            vendor_info = await self.get_vendor_info(device_address=address)
+
+        list_of_write_access_specs = []
+        while parameter_list:
+            object_identifier, property_value_list, *parameter_list = parameter_list
+
+            # parse the object identifier if needed
+            if isinstance(object_identifier, str):
+                object_identifier = await self.parse_object_identifier(
+                    object_identifier, vendor_info=vendor_info
+                )
+            elif not isinstance(object_identifier, ObjectIdentifier):
+                raise TypeError("objid")
+
+            list_of_properties = []
+            for property_value in property_value_list:
+                if not isinstance(property_value, PropertyValue):
+                    property_value = await self.build_property_value(
+                        object_identifier, *property_value, vendor_info=vendor_info
+                    )
+                list_of_properties.append(property_value)
+
+            list_of_write_access_specs.append(
+                WriteAccessSpecification(
+                    objectIdentifier=object_identifier,
+                    listOfProperties=list_of_properties,
+                )
+            )
+
+        if len(list_of_write_access_specs) == 0:
+            raise TypeError("write access specification expected")
+
+        write_property_multiple_request = WritePropertyMultipleRequest(
+            listOfWriteAccessSpecs=SequenceOf(WriteAccessSpecification)(
+                list_of_write_access_specs
+            ),
+            destination=address,
+        )
+        if _debug:
+            ReadWritePropertyMultipleServices._debug(
+                "    - write_property_multiple_request: %r",
+                write_property_multiple_request,
+            )
+
+        # send the request and wait for the response
+        response = await self.request(write_property_multiple_request)
+        if _debug:
+            ReadWritePropertyMultipleServices._debug("    - response: %r", response)
+        if not isinstance(response, SimpleAckPDU):
+            if _debug:
+                ReadWritePropertyMultipleServices._debug(
+                    "    - invalid response: %r", response
+                )
+            raise RuntimeError(f"invalid response: {response!r}")
+
+        return None
+
+    async def build_property_value(
+        self,
+        object_identifier: ObjectIdentifier,
+        prop: Union[PropertyIdentifier, str],
+        value: _Any,
+        priority: Optional[int] = None,
+        array_index: Optional[int] = None,
+        vendor_info: Optional[VendorInfo] = None,
+    ) -> PropertyValue:
+        """
+        Return a PropertyValue for writing a value to a property of an object,
+        the property can include an array index like "priority-array[8]" and
+        the value is cast to the datatype of the property if necessary.
+        """
+        if _debug:
+            ReadWritePropertyMultipleServices._debug(
+                "build_property_value %r %r %r %r %r",
+                object_identifier,
+                prop,
+                value,
+                priority,
+                array_index,
+            )
+        if not vendor_info:
+            vendor_info = get_vendor_info(0)
+
+        # parse the property reference if needed
+        if isinstance(prop, str):
+            property_reference = await self.parse_property_reference(
+                prop, vendor_info=vendor_info
+            )
+            prop = property_reference.propertyIdentifier
+            if property_reference.propertyArrayIndex is not None:
+                if array_index is not None:
+                    raise ValueError("array index conflict")
+                array_index = property_reference.propertyArrayIndex
+        elif not isinstance(prop, PropertyIdentifier):
+            raise TypeError("prop")
+
+        # using the vendor information, look up the datatype
+        property_type = property_datatype(
+            vendor_info.get_object_class(object_identifier[0]), prop, array_index
+        )
+        if not property_type:
+            raise ValueError(f"no property type: {object_identifier} {prop}")
+
+        # cast it as the appropriate type if necessary
+        if (priority is not None) and isinstance(value, Null):
+            pass
+        elif not isinstance(value, property_type):
+            value = property_type(value)
+
+        property_value = PropertyValue(propertyIdentifier=prop, value=value)
+        if array_index is not None:
+            property_value.propertyArrayIndex = array_index
+        if priority is not None:
+            property_value.priority = priority
+
+        return property_value
+
     async def do_ReadPropertyMultipleRequest(
         self, apdu: ReadPropertyMultipleRequest
     ) -> None:
@@ -928,9 +1829,13 @@ class ReadWritePropertyMultipleServices:
             obj = self.get_object_id(object_identifier)
             if not obj:
                 error_type = ErrorType(errorClass="object", errorCode="unknownObject")
+                prop_value = write_access_spec.listOfProperties[0]
                 obj_prop_ref = ObjectPropertyReference(
-                    objectIdentifier=object_identifier
+                    objectIdentifier=object_identifier,
+                    propertyIdentifier=prop_value.propertyIdentifier,
                 )
+                if prop_value.propertyArrayIndex is not None:
+                    obj_prop_ref.propertyArrayIndex = prop_value.propertyArrayIndex
                 raise WritePropertyMultipleError(
                     errorType=error_type,
                     firstFailedWriteAttempt=obj_prop_ref,
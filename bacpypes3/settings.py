@@ -32,6 +32,24 @@ settings = Settings(
     backup_count=5,
     route_aware=False,
     cov_lifetime=60,
+    address_cache=1024,
+    lazy_decoding=False,
+    encode_cache=0,
+    property_cache=False,
+    request_scheduler=False,
+    request_limit=0,
+    device_request_limit=0,
+    network_request_limit=0,
+    timer_wheel=False,
+    adaptive_timeout=False,
+    adaptive_timeout_min=500,
+    adaptive_timeout_max=10000,
+    read_coalescing=False,
+    read_coalescing_window=10,
+    single_flight=False,
+    server_workers=0,
+    server_queue=16,
+    server_overload="abort",
 )
 
 
@@ -47,6 +65,24 @@ def os_settings() -> None:
         ("backup_count", "BACPYPES_BACKUP_COUNT"),
         ("route_aware", "BACPYPES_ROUTE_AWARE"),
         ("cov_lifetime", "BACPYPES_COV_LIFETIME"),
+        ("address_cache", "BACPYPES_ADDRESS_CACHE"),
+        ("lazy_decoding", "BACPYPES_LAZY_DECODING"),
+        ("encode_cache", "BACPYPES_ENCODE_CACHE"),
+        ("property_cache", "BACPYPES_PROPERTY_CACHE"),
+        ("request_scheduler", "BACPYPES_REQUEST_SCHEDULER"),
+        ("request_limit", "BACPYPES_REQUEST_LIMIT"),
+        ("device_request_limit", "BACPYPES_DEVICE_REQUEST_LIMIT"),
+        ("network_request_limit", "BACPYPES_NETWORK_REQUEST_LIMIT"),
+        ("timer_wheel", "BACPYPES_TIMER_WHEEL"),
+        ("adaptive_timeout", "BACPYPES_ADAPTIVE_TIMEOUT"),
+        ("adaptive_timeout_min", "BACPYPES_ADAPTIVE_TIMEOUT_MIN"),
+        ("adaptive_timeout_max", "BACPYPES_ADAPTIVE_TIMEOUT_MAX"),
+        ("read_coalescing", "BACPYPES_READ_COALESCING"),
+        ("read_coalescing_window", "BACPYPES_READ_COALESCING_WINDOW"),
+        ("single_flight", "BACPYPES_SINGLE_FLIGHT"),
+        ("server_workers", "BACPYPES_SERVER_WORKERS"),
+        ("server_queue", "BACPYPES_SERVER_QUEUE"),
+        ("server_overload", "BACPYPES_SERVER_OVERLOAD"),
     ):
         env_value = os.getenv(env_name, None)
         if env_value is not None:
@@ -0,0 +1,362 @@
+"""
+Timer Wheel
+
+A hierarchical timer wheel shared by the state machines, subscriptions and
+link layers that have lots of timers running at the same time.  Starting
+and canceling a timer is a constant time operation, and the event loop only
+has one timer of its own for the next wheel slot that has something in it
+rather than one for each timer.
+
+The timers are put in the wheel when the timer_wheel setting is set,
+otherwise call_later() uses the event loop timers.  The wheel is faster to
+cancel timers but slower to start them, and timers run at the resolution of
+the wheel, so it is for applications that have more timers canceled than
+expire, like lots of transactions that get answers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .settings import settings
+from .debugging import ModuleLogger, bacpypes_debugging
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+# the number of slots at each level as a power of two, the first level has
+# a slot for each tick and each one after that has a slot for a full turn of
+# the one before it
+LEVEL_BITS = (8, 6, 6, 6)
+
+# seconds per tick
+RESOLUTION = 0.01
+
+# the wheel for an event loop is an attribute of the loop, so they are
+# freed together
+TIMER_WHEEL_ATTR = "_bacpypes_timer_wheel"
+
+
+#
+#   TimerHandle
+#
+
+
+class TimerHandle:
+    """
+    Instances of this class are returned by TimerWheel.call_later() and
+    TimerWheel.call_at(), like asyncio.TimerHandle they can be canceled.
+    """
+
+    __slots__ = (
+        "_wheel",
+        "_when",
+        "_callback",
+        "_args",
+        "_expires",
+        "_slot",
+        "_cancelled",
+    )
+
+    _wheel: TimerWheel
+    _when: float
+    _callback: Callable[..., Any]
+    _args: Tuple[Any, ...]
+    _expires: int
+    _slot: Optional[Dict[TimerHandle, None]]
+    _cancelled: bool
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        when: float,
+        callback: Callable[..., Any],
+        args: Tuple[Any, ...],
+    ) -> None:
+        self._wheel = wheel
+        self._when = when
+        self._callback = callback
+        self._args = args
+        self._expires = 0
+        self._slot = None
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} when={self._when} {self._callback!r}>"
+
+    def when(self) -> float:
+        """Return the loop time the timer is scheduled for."""
+        return self._when
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer, it is removed from its slot in the wheel."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+
+        slot = self._slot
+        if slot is not None:
+            del slot[self]
+            self._slot = None
+            self._wheel._count -= 1
+
+
+#
+#   TimerWheel
+#
+
+
+@bacpypes_debugging
+class TimerWheel:
+    """
+    A hierarchy of wheels of slots where each slot has the timers that
+    expire during the slot.  As time moves forward the timers in the next
+    slot of a higher level wheel cascade down into the lower levels and the
+    timers in the current slot of the lowest level are called.
+    """
+
+    _debug: Callable[..., None]
+    _exception: Callable[..., None]
+
+    loop: asyncio.AbstractEventLoop
+    resolution: float
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        resolution: float = RESOLUTION,
+    ) -> None:
+        if _debug:
+            TimerWheel._debug("__init__ resolution=%r", resolution)
+
+        self.loop = loop or asyncio.get_event_loop()
+        self.resolution = resolution
+
+        # the levels of slots and the tick where each one starts
+        self._levels: List[List[Dict[TimerHandle, None]]] = [
+            [{} for _ in range(1 << bits)] for bits in LEVEL_BITS
+        ]
+        self._shifts: List[int] = []
+        shift = 0
+        for bits in LEVEL_BITS:
+            self._shifts.append(shift)
+            shift += bits
+        self._horizon = 1 << shift
+
+        # the last tick that has been run and the number of timers
+        self._current = math.floor(self.loop.time() / resolution)
+        self._count = 0
+
+        # the event loop timer for the next tick to run
+        self._wakeup_tick: Optional[int] = None
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        """Return the number of timers that are scheduled."""
+        return self._count
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerHandle:
+        """
+        Arrange for the callback to be called after the delay in seconds,
+        like loop.call_later().
+        """
+        return self.call_at(self.loop.time() + delay, callback, *args)
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerHandle:
+        """
+        Arrange for the callback to be called at the loop time, like
+        loop.call_at().
+        """
+        if not self._count:
+            # nothing is scheduled, catch up with the clock
+            self._current = max(
+                self._current, math.floor(self.loop.time() / self.resolution)
+            )
+
+        handle = TimerHandle(self, when, callback, args)
+        handle._expires = max(
+            self._current + 1, math.ceil(when / self.resolution - 1e-9)
+        )
+        self._insert(handle)
+        self._count += 1
+
+        # wake up sooner if this is before the next tick to run
+        if (self._wakeup_tick is None) or (handle._expires < self._wakeup_tick):
+            self._schedule(handle._expires)
+
+        return handle
+
+    def _insert(self, handle: TimerHandle) -> None:
+        """
+        Put the handle in the slot of the lowest level that covers when it
+        expires, those that are past the horizon go in the last slot of the
+        highest level and are inserted again when they cascade down.
+        """
+        expires = handle._expires
+        delta = expires - self._current
+        if delta >= self._horizon:
+            expires = self._current + self._horizon - 1
+            delta = self._horizon - 1
+
+        for level, bits in enumerate(LEVEL_BITS):
+            if delta < (1 << (self._shifts[level] + bits)):
+                break
+        slot = self._levels[level][(expires >> self._shifts[level]) & ((1 << bits) - 1)]
+        slot[handle] = None
+        handle._slot = slot
+
+    def _cascade(self, level: int) -> None:
+        """
+        Move the timers in the current slot of the level down to the lower
+        levels.
+        """
+        index = (self._current >> self._shifts[level]) & ((1 << LEVEL_BITS[level]) - 1)
+        slot = self._levels[level][index]
+        if not slot:
+            return
+        if _debug:
+            TimerWheel._debug("    - cascade %r[%r]: %r", level, index, len(slot))
+
+        self._levels[level][index] = {}
+        for handle in slot:
+            self._insert(handle)
+
+    def _schedule(self, tick: int) -> None:
+        """
+        Schedule the event loop to run the wheel at the tick.
+        """
+        if self._wakeup_handle:
+            self._wakeup_handle.cancel()
+
+        self._wakeup_tick = tick
+        self._wakeup_handle = self.loop.call_at(tick * self.resolution, self._run)
+
+    def _next_tick(self) -> Optional[int]:
+        """
+        Return the next tick that has timers in the lowest level or a slot
+        in a higher level to cascade, whichever comes first.
+        """
+        if not self._count:
+            return None
+
+        next_tick: Optional[int] = None
+        for level, bits in enumerate(LEVEL_BITS):
+            shift = self._shifts[level]
+            base = self._current >> shift
+
+            # nothing in this level can be sooner
+            if (next_tick is not None) and (next_tick <= ((base + 1) << shift)):
+                break
+
+            slots = self._levels[level]
+            mask = len(slots) - 1
+            for offset in range(1, len(slots) + 1):
+                if slots[(base + offset) & mask]:
+                    tick = (base + offset) << shift
+                    if (next_tick is None) or (tick < next_tick):
+                        next_tick = tick
+                    break
+
+        return next_tick
+
+    def _run(self) -> None:
+        """
+        Run the ticks up to now that have something to do, cascading the
+        timers in the higher levels and calling the ones that have expired.
+        """
+        if _debug:
+            TimerWheel._debug("_run")
+
+        # the loop may wake up a little bit early
+        now = max(math.floor(self.loop.time() / self.resolution), self._wakeup_tick)
+        self._wakeup_tick = self._wakeup_handle = None
+
+        slots = self._levels[0]
+        mask = len(slots) - 1
+        while True:
+            tick = self._next_tick()
+            if (tick is None) or (tick > now):
+                break
+            self._current = tick
+
+            # the start of a turn of a level cascades the next slot of the
+            # level above, which might be the start of a turn of that level
+            for level in range(1, len(LEVEL_BITS)):
+                if tick & ((1 << self._shifts[level]) - 1):
+                    break
+                self._cascade(level)
+
+            slot = slots[tick & mask]
+            if not slot:
+                continue
+            slots[tick & mask] = {}
+
+            for handle in list(slot):
+                # an earlier callback might have canceled it
+                if handle._slot is not slot:
+                    continue
+                handle._slot = None
+                self._count -= 1
+                try:
+                    handle._callback(*handle._args)
+                except Exception as err:
+                    TimerWheel._exception("exception in %r: %r", handle, err)
+
+        # nothing else to do until later
+        self._current = max(self._current, now)
+
+        # schedule the next one
+        next_tick = self._next_tick()
+        if (next_tick is not None) and (
+            (self._wakeup_tick is None) or (next_tick < self._wakeup_tick)
+        ):
+            self._schedule(next_tick)
+
+
+def get_timer_wheel(loop: Optional[asyncio.AbstractEventLoop] = None) -> TimerWheel:
+    """
+    Return the timer wheel for the event loop, creating it if necessary.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    timer_wheel = getattr(loop, TIMER_WHEEL_ATTR, None)
+    if timer_wheel is None:
+        timer_wheel = TimerWheel(loop)
+        setattr(loop, TIMER_WHEEL_ATTR, timer_wheel)
+
+    return timer_wheel
+
+
+# the handles returned by call_later()
+AnyTimerHandle = Union[asyncio.TimerHandle, TimerHandle]
+
+
+def call_later(
+    delay: float,
+    callback: Callable[..., Any],
+    *args: Any,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> AnyTimerHandle:
+    """
+    Arrange for the callback to be called after the delay in seconds using
+    the timer wheel of the event loop when the timer_wheel setting is set,
+    otherwise the event loop timers.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    if settings.timer_wheel:
+        return get_timer_wheel(loop).call_later(delay, callback, *args)
+
+    return loop.call_later(delay, callback, *args)
@@ -0,0 +1,552 @@
+"""
+Encode and decode each of the primitive data types, a representative set of
+constructed data types, every APDU request, ack and error, the network layer
+messages and the IPv4, IPv6 and BACnet/SC link layer messages.  Report the
+time per operation and the memory still allocated per result, and optionally
+save the results as JSON so runs can be compared over time.
+
+Requests, acks and errors are built with a sample value for each of their
+required elements.  A message that cannot be built or does not make the
+round trip is listed as skipped along with the reason.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+import uuid
+
+from typing import Any as _Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import bacpypes3
+from bacpypes3.pdu import PDU, PDUData, IPv4Address, IPv6Address, VirtualAddress
+from bacpypes3.primitivedata import (
+    BitString,
+    Boolean,
+    CharacterString,
+    Date,
+    Double,
+    Enumerated,
+    Integer,
+    Null,
+    ObjectIdentifier,
+    ObjectType,
+    OctetString,
+    Real,
+    TagList,
+    Time,
+    Unsigned,
+    Unsigned8,
+    Unsigned16,
+)
+from bacpypes3.constructeddata import (
+    Any,
+    AnyAtomic,
+    ArrayOf,
+    Choice,
+    ExtendedList,
+    ListOf,
+    Sequence,
+)
+from bacpypes3.basetypes import (
+    DateTime,
+    EngineeringUnits,
+    PriorityValue,
+    PropertyIdentifier,
+    PropertyReference,
+    PropertyValue,
+    ReadAccessResultElementChoice,
+    ReadAccessSpecification,
+    StatusFlags,
+)
+from bacpypes3.apdu import (
+    APDU,
+    APCISequence,
+    AbortPDU,
+    RejectPDU,
+    SegmentAckPDU,
+    SimpleAckPDU,
+    complex_ack_types,
+    confirmed_request_types,
+    error_types,
+    unconfirmed_request_types,
+)
+from bacpypes3 import npdu
+from bacpypes3.ipv4 import bvll as ipv4_bvll
+from bacpypes3.ipv6 import bvll as ipv6_bvll
+
+# BACnet/SC needs the optional websockets package
+try:
+    from bacpypes3.sc import bvll as sc_bvll
+except ImportError:
+    sc_bvll = None
+
+# (group, name, value, encode, decode), encode returns the octets and decode
+# returns a value that encodes back into the same octets, the value is the
+# exception raised when a sample could not be built
+Case = Tuple[str, str, _Any, Callable[[_Any], _Any], Callable[[bytes], _Any]]
+
+# a ReadProperty request routed from another network
+NPDU_DATA = bytes.fromhex("0108000501030005010c0c000000011955")
+
+
+#
+#   Encoders and Decoders
+#
+
+
+def tags_encode(value: _Any) -> bytes:
+    return value.encode().encode().pduData
+
+
+def tags_decoder(cls: type) -> Callable[[bytes], _Any]:
+    def decode(data: bytes) -> _Any:
+        return cls.decode(TagList.decode(PDUData(data)))
+
+    return decode
+
+
+def apci_sequence_decode(data: bytes) -> APCISequence:
+    return APCISequence.decode(APDU.decode(PDU(data)))
+
+
+def pdu_encode(value: _Any) -> bytes:
+    return value.encode().pduData
+
+
+def apdu_decode(data: bytes) -> APDU:
+    return APDU.decode(PDU(data))
+
+
+def npdu_decode(data: bytes) -> npdu.NPDU:
+    """Decode the network layer message the same way as the NetworkCodec."""
+    npdu_ = npdu.NPDU.decode(PDU(data))
+    if npdu_.npduNetMessage is not None:
+        npdu_ = npdu.npdu_types[npdu_.npduNetMessage].decode(npdu_)
+    return npdu_
+
+
+def bvll_decoder(module: _Any, function: str) -> Callable[[bytes], _Any]:
+    """Decode the link layer message the same way as the BVLLCodec."""
+
+    def decode(data: bytes) -> _Any:
+        pdu = PDU(data)
+        lpci = module.LPCI.decode(pdu)
+        lpdu = module.pdu_types[getattr(lpci, function)].decode(pdu)
+        module.LPCI.update(lpdu, lpci)
+        return lpdu
+
+    return decode
+
+
+#
+#   Sample Values
+#
+
+
+def sample(element: type, depth: int = 0) -> _Any:
+    """Return a value for an element with all of the required elements."""
+    if depth > 8:
+        raise RecursionError("nested too deep")
+
+    if issubclass(element, AnyAtomic):
+        return AnyAtomic(Real(1.5))
+    if issubclass(element, Any):
+        return Any(Real(1.5))
+    if issubclass(element, Null):
+        return ()
+    if issubclass(element, Boolean):
+        return True
+    if issubclass(element, Enumerated):
+        return min(element._attr_map) if element._attr_map else 0
+    if issubclass(element, Unsigned):
+        return 1
+    if issubclass(element, Integer):
+        return -1
+    if issubclass(element, (Real, Double)):
+        return 1.5
+    if issubclass(element, OctetString):
+        return b"\x01\x02"
+    if issubclass(element, CharacterString):
+        return "abc"
+    if issubclass(element, BitString):
+        return [0] * (element._bitstring_length or 4)
+    if issubclass(element, Date):
+        return Date("2024-01-02")
+    if issubclass(element, Time):
+        return Time("12:34:56.78")
+    if issubclass(element, ObjectIdentifier):
+        return ("analog-value", 1)
+    if issubclass(element, ExtendedList):
+        length = getattr(element, "_length", None) or 1
+        return [sample(element._subtype, depth + 1) for _ in range(length)]
+    if issubclass(element, Choice):
+        attr, choice = next(iter(element._elements.items()))
+        return element(**{attr: sample(choice, depth + 1)})
+    if issubclass(element, Sequence):
+        return element(
+            **{
+                attr: sample(child, depth + 1)
+                for attr, child in element._elements.items()
+                if not child._optional
+            }
+        )
+
+    raise TypeError(f"no sample for {element.__name__}")
+
+
+#
+#   Cases
+#
+
+
+def primitive_cases() -> Iterator[Case]:
+    for value in (
+        Null(()),
+        Boolean(True),
+        Unsigned8(12),
+        Unsigned16(1234),
+        Unsigned(123456),
+        Integer(-123456),
+        Real(72.5),
+        Double(72.5),
+        OctetString(b"\x01\x02\x03\x04"),
+        CharacterString("Zone Temperature"),
+        BitString([0, 1, 0, 1, 1]),
+        Enumerated(3),
+        Date("2024-01-02"),
+        Time("12:34:56.78"),
+        ObjectIdentifier("analog-value,1"),
+        ObjectType("analog-value"),
+        PropertyIdentifier("present-value"),
+        EngineeringUnits("degrees-fahrenheit"),
+        StatusFlags([0, 1, 0, 0]),
+    ):
+        cls = value.__class__
+        yield ("primitive", cls.__name__, value, tags_encode, tags_decoder(cls))
+
+
+def constructed_cases() -> Iterator[Case]:
+    ArrayOfObjectIdentifier = ArrayOf(ObjectIdentifier)
+    ListOfPropertyValue = ListOf(PropertyValue)
+
+    for name, value in (
+        ("DateTime", DateTime(date="2024-01-02", time="12:34:56.78")),
+        (
+            "PropertyValue",
+            PropertyValue(propertyIdentifier="present-value", value=Any(Real(1.0))),
+        ),
+        (
+            "ReadAccessSpecification",
+            ReadAccessSpecification(
+                objectIdentifier="analog-value,1",
+                listOfPropertyReferences=[
+                    PropertyReference(propertyIdentifier=prop)
+                    for prop in ("present-value", "status-flags", "object-name")
+                ],
+            ),
+        ),
+        ("PriorityValue", PriorityValue(real=72.5)),
+        (
+            "ReadAccessResultElementChoice",
+            ReadAccessResultElementChoice(propertyValue=Any(Real(72.5))),
+        ),
+        (
+            "ArrayOf(ObjectIdentifier)",
+            ArrayOfObjectIdentifier(
+                [ObjectIdentifier(("analog-value", i)) for i in range(100)]
+            ),
+        ),
+        (
+            "ListOf(PropertyValue)",
+            ListOfPropertyValue(
+                [
+                    PropertyValue(propertyIdentifier="present-value", value=Real(i))
+                    for i in range(10)
+                ]
+            ),
+        ),
+        ("AnyAtomic", AnyAtomic(Real(72.5))),
+    ):
+        yield ("constructed", name, value, tags_encode, tags_decoder(value.__class__))
+
+
+def apdu_cases() -> Iterator[Case]:
+    for group, types in (
+        ("confirmed-request", confirmed_request_types),
+        ("complex-ack", complex_ack_types),
+        ("unconfirmed-request", unconfirmed_request_types),
+        ("error", error_types),
+    ):
+        seen = set()
+        for service_choice, cls in types.items():
+            if cls in seen:
+                continue
+            seen.add(cls)
+
+            # a failure is passed along to be reported as skipped
+            try:
+                apci_sequence = sample(cls)
+
+                # header fields normally filled in by the state machines
+                apci_sequence.apduInvokeID = 1
+                apci_sequence.apduSeg = apci_sequence.apduMor = False
+                apci_sequence.apduSA = True
+                apci_sequence.apduMaxSegs = 0
+                apci_sequence.apduMaxResp = 5
+            except Exception as err:
+                apci_sequence = err
+
+            yield (
+                group,
+                cls.__name__,
+                apci_sequence,
+                tags_encode,
+                apci_sequence_decode,
+            )
+
+    for value in (
+        SimpleAckPDU(service_choice=15, invoke_id=1),
+        SegmentAckPDU(0, 0, 1, 3, 4),
+        RejectPDU(invoke_id=1, reason=4),
+        AbortPDU(invoke_id=1, reason=4),
+    ):
+        yield ("apdu", value.__class__.__name__, value, pdu_encode, apdu_decode)
+
+
+def npdu_cases() -> Iterator[Case]:
+    routing_table = [npdu.RoutingTableEntry(1, 2, b"")]
+    for value in (
+        npdu.NPDU.decode(PDU(NPDU_DATA)),
+        npdu.WhoIsRouterToNetwork(1),
+        npdu.IAmRouterToNetwork([1, 2, 3]),
+        npdu.ICouldBeRouterToNetwork(1, 10),
+        npdu.RejectMessageToNetwork(1, 2),
+        npdu.RouterBusyToNetwork([1, 2]),
+        npdu.RouterAvailableToNetwork([1, 2]),
+        npdu.InitializeRoutingTable(routing_table),
+        npdu.InitializeRoutingTableAck(routing_table),
+        npdu.EstablishConnectionToNetwork(1, 30),
+        npdu.DisconnectConnectionToNetwork(1),
+        npdu.WhatIsNetworkNumber(),
+        npdu.NetworkNumberIs(1, 1),
+    ):
+        yield ("npdu", value.__class__.__name__, value, pdu_encode, npdu_decode)
+
+
+def ipv4_cases() -> Iterator[Case]:
+    bvll = ipv4_bvll
+    address = IPv4Address("192.168.0.2")
+    bdt = [IPv4Address("192.168.0.1/24"), IPv4Address("192.168.1.1/24")]
+
+    fdt_entry = bvll.FDTEntry()
+    fdt_entry.fdAddress = address
+    fdt_entry.fdTTL = 30
+    fdt_entry.fdRemain = 35
+
+    decode = bvll_decoder(bvll, "bvlciFunction")
+    for value in (
+        bvll.Result(0),
+        bvll.WriteBroadcastDistributionTable(bdt),
+        bvll.ReadBroadcastDistributionTable(),
+        bvll.ReadBroadcastDistributionTableAck(bdt),
+        bvll.ForwardedNPDU(address, NPDU_DATA),
+        bvll.RegisterForeignDevice(30),
+        bvll.ReadForeignDeviceTable(),
+        bvll.ReadForeignDeviceTableAck([fdt_entry]),
+        bvll.DeleteForeignDeviceTableEntry(address),
+        bvll.DistributeBroadcastToNetwork(NPDU_DATA),
+        bvll.OriginalUnicastNPDU(NPDU_DATA),
+        bvll.OriginalBroadcastNPDU(NPDU_DATA),
+    ):
+        yield ("ipv4", value.__class__.__name__, value, pdu_encode, decode)
+
+
+def ipv6_cases() -> Iterator[Case]:
+    bvll = ipv6_bvll
+    source = VirtualAddress(b"\x01\x02\x03")
+    destination = VirtualAddress(b"\x04\x05\x06")
+    address = IPv6Address("[fe80::1]:47808")
+
+    decode = bvll_decoder(bvll, "bvlciFunction")
+    for value in (
+        bvll.Result(source, 0),
+        bvll.OriginalUnicastNPDU(source, destination, NPDU_DATA),
+        bvll.OriginalBroadcastNPDU(source, NPDU_DATA),
+        bvll.AddressResolution(source, destination),
+        bvll.ForwardedAddressResolution(source, destination, address),
+        bvll.AddressResolutionACK(source, destination),
+        bvll.VirtualAddressResolution(source),
+        bvll.VirtualAddressResolutionACK(source, destination),
+        bvll.ForwardedNPDU(source, address, NPDU_DATA),
+        bvll.RegisterForeignDevice(source, 30),
+        bvll.DeleteForeignDeviceTableEntry(source, address),
+        bvll.DistributeBroadcastToNetwork(source, NPDU_DATA),
+    ):
+        yield ("ipv6", value.__class__.__name__, value, pdu_encode, decode)
+
+
+def sc_cases() -> Iterator[Case]:
+    bvll = sc_bvll
+    vmac = VirtualAddress(b"\x01\x02\x03\x04\x05\x06")
+    device_uuid = uuid.UUID(int=1)
+
+    decode = bvll_decoder(bvll, "bvlcFunction")
+    for value in (
+        bvll.Result(bvll.LPCI.connectRequest, 0),
+        bvll.EncapsulatedNPDU(NPDU_DATA),
+        bvll.AddressResolution(),
+        bvll.AddressResolutionACK("wss://hub.example.com"),
+        bvll.Advertisement(1, 1, 1600, 1497),
+        bvll.AdvertisementSolicitation(),
+        bvll.ConnectRequest(vmac, device_uuid, 1600, 1497),
+        bvll.ConnectAccept(vmac, device_uuid, 1600, 1497),
+        bvll.DisconnectRequest(),
+        bvll.DisconnectACK(),
+        bvll.HeartbeatRequest(),
+        bvll.HeartbeatACK(),
+        bvll.ProprietaryMessage(555, 1, NPDU_DATA),
+    ):
+        value.bvlcMessageID = 1
+        yield ("sc", value.__class__.__name__, value, pdu_encode, decode)
+
+
+#
+#   Measurements
+#
+
+
+def allocated(fn: Callable[[], _Any], count: int) -> float:
+    """Return the average number of octets still allocated per result."""
+    results = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        results.append(fn())
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # the list of references is not part of the result
+    return (after - before) / count - 8
+
+
+def best_time(fn: Callable[[], _Any], number: int, repeat: int) -> float:
+    """Return the best time per call in microseconds."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def measure(
+    case: Case, number: int, repeat: int, count: int
+) -> Tuple[Optional[Dict[str, _Any]], Optional[str]]:
+    """Return the results of a case, or the reason it was skipped."""
+    group, name, value, encode, decode = case
+    if isinstance(value, Exception):
+        return None, f"{value.__class__.__name__}: {value}"
+    try:
+        data = bytes(encode(value))
+        if bytes(encode(decode(data))) != data:
+            return None, "round trip mismatch"
+    except Exception as err:
+        return None, f"{err.__class__.__name__}: {err}"
+
+    return {
+        "group": group,
+        "name": name,
+        "octets": len(data),
+        "encode_us": best_time(lambda: encode(value), number, repeat),
+        "decode_us": best_time(lambda: decode(data), number, repeat),
+        "encode_alloc": allocated(lambda: encode(value), count),
+        "decode_alloc": allocated(lambda: decode(data), count),
+    }, None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--number", type=int, default=1000, help="iterations in each measurement"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements")
+    parser.add_argument(
+        "--count", type=int, default=100, help="results in an allocation measurement"
+    )
+    parser.add_argument(
+        "--filter", type=str, default="", help="only the groups or names with this"
+    )
+    parser.add_argument("--json", type=str, help="save the results in this file")
+    parser.add_argument(
+        "--compare", type=str, help="compare the timing with a previous JSON file"
+    )
+    args = parser.parse_args()
+
+    previous: Dict[Tuple[str, str], Dict[str, _Any]] = {}
+    if args.compare:
+        with open(args.compare) as compare_file:
+            for result in json.load(compare_file)["results"]:
+                previous[(result["group"], result["name"])] = result
+
+    case_groups: List[Callable[[], Iterator[Case]]] = [
+        primitive_cases,
+        constructed_cases,
+        apdu_cases,
+        npdu_cases,
+        ipv4_cases,
+        ipv6_cases,
+    ]
+    skipped: List[Dict[str, str]] = []
+    if sc_bvll is not None:
+        case_groups.append(sc_cases)
+    elif (not args.filter) or args.filter.startswith("sc"):
+        skipped.append({"group": "sc", "name": "*", "reason": "websockets missing"})
+
+    results: List[Dict[str, _Any]] = []
+    for case_group in case_groups:
+        for case in case_group():
+            group, name = case[:2]
+            if args.filter and (args.filter not in group + "." + name):
+                continue
+
+            result, reason = measure(case, args.number, args.repeat, args.count)
+            if result is None:
+                skipped.append({"group": group, "name": name, "reason": reason})
+                continue
+            results.append(result)
+
+            line = (
+                f"{group + '.' + name:>56s} {result['octets']:5d} octets:"
+                f" encode {result['encode_us']:8.2f} us {result['encode_alloc']:7.0f} B,"
+                f" decode {result['decode_us']:8.2f} us {result['decode_alloc']:7.0f} B"
+            )
+            before = previous.get((group, name), None)
+            if before:
+                line += (
+                    f" ({result['encode_us'] / before['encode_us']:5.2f}x,"
+                    f" {result['decode_us'] / before['decode_us']:5.2f}x)"
+                )
+            print(line)
+
+    for skip in skipped:
+        print(f"{skip['group'] + '.' + skip['name']:>56s} skipped: {skip['reason']}")
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(
+                {
+                    "bacpypes3": bacpypes3.__version__,
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "number": args.number,
+                    "repeat": args.repeat,
+                    "results": results,
+                    "skipped": skipped,
+                },
+                json_file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Decode a large array of object identifiers, the same shape as the objectList
+of a device with many objects, and report the time it takes to decode the
+tag list and the array.
+"""
+
+import argparse
+import timeit
+
+from bacpypes3.pdu import PDUData
+from bacpypes3.primitivedata import ObjectIdentifier, TagList
+from bacpypes3.constructeddata import ArrayOf
+
+ArrayOfObjectIdentifier = ArrayOf(ObjectIdentifier)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", type=int, default=10000, help="number of array elements"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of times to decode"
+    )
+    args = parser.parse_args()
+
+    # build the array and encode it
+    value = ArrayOfObjectIdentifier(
+        [ObjectIdentifier(("analog-value", i)) for i in range(args.count)]
+    )
+    data = bytes(value.encode().encode().pduData)
+    print(f"{args.count} elements, {len(data)} octets")
+
+    def decode_tags() -> TagList:
+        return TagList.decode(PDUData(data))
+
+    tag_list = decode_tags()
+    assert len(tag_list) == args.count
+
+    def decode_array() -> ArrayOfObjectIdentifier:
+        return ArrayOfObjectIdentifier.decode(TagList(tag_list))
+
+    assert decode_array() == value
+
+    for label, fn in (("tag list", decode_tags), ("array", decode_array)):
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"{label:>10s}: {best * 1000.0:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
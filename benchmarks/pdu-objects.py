@@ -0,0 +1,74 @@
+"""
+Report the memory used by, and the time it takes to construct, the objects
+that are created for every packet: tags, PCI headers and the PDU, NPDU and
+APDU objects.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from typing import Any, Callable
+
+from bacpypes3.pdu import PDU, PCI
+from bacpypes3.npdu import NPCI, NPDU
+from bacpypes3.apdu import APCI, APDU, ConfirmedRequestPDU
+from bacpypes3.primitivedata import ContextTag, Tag
+
+# a ReadProperty request routed from another network
+NPDU_DATA = bytes.fromhex("0108000501030005010c0c000000011955")
+
+
+def allocated(fn: Callable[[], Any], count: int) -> float:
+    """Return the average number of octets still allocated per object."""
+    objects = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        objects.append(fn())
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # the list of references is not part of the object
+    return (after - before) / count - 8
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", type=int, default=10000, help="objects in each measurement"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timing measurements"
+    )
+    args = parser.parse_args()
+
+    def apdu_decode() -> APDU:
+        pdu = PDU(NPDU_DATA)
+        npdu = NPDU.decode(pdu)
+        return APDU.decode(npdu)
+
+    def has_dict(obj: Any) -> str:
+        return "yes" if hasattr(obj, "__dict__") else "no"
+
+    for label, fn in (
+        ("Tag", lambda: Tag()),
+        ("ContextTag", lambda: ContextTag(1, b"\x55")),
+        ("PCI", lambda: PCI()),
+        ("PDU", lambda: PDU(NPDU_DATA)),
+        ("NPCI", lambda: NPCI()),
+        ("NPDU", lambda: NPDU.decode(PDU(NPDU_DATA))),
+        ("APCI", lambda: APCI()),
+        ("ConfirmedRequestPDU", lambda: ConfirmedRequestPDU()),
+        ("PDU > NPDU > APDU", apdu_decode),
+    ):
+        size = allocated(fn, args.count)
+        best = min(timeit.repeat(fn, number=args.count, repeat=args.repeat))
+        print(
+            f"{label:>20s}: {size:8.1f} octets, {best / args.count * 1e6:7.2f} us,"
+            f" __dict__ {has_dict(fn())}"
+        )
+
+
+if __name__ == "__main__":
+    main()
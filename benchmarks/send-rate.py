@@ -0,0 +1,117 @@
+"""
+Measure how fast small requests can be sent.  The unconfirmed requests are
+Who-Is requests that the server receives but does not answer, the confirmed
+requests are ReadProperty requests that are answered, sent a batch at a time.
+
+Everything runs in this process over a virtual network, the CPU time is
+measured along with the elapsed time.
+"""
+
+import argparse
+import asyncio
+import time
+
+from collections import defaultdict
+from typing import Dict, List
+
+from bacpypes3.pdu import Address
+from bacpypes3.apdu import ReadPropertyRequest, WhoIsRequest
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+
+from vlan_objects import device_json, network_port_json
+
+
+async def unconfirmed(
+    client: Application, server: Application, address: Address, count: int
+) -> None:
+    """
+    Send Who-Is requests for a device that is not there and wait for the
+    server to see all of them.
+    """
+    received = 0
+    done = asyncio.Event()
+
+    async def do_WhoIsRequest(apdu: WhoIsRequest) -> None:
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    server.do_WhoIsRequest = do_WhoIsRequest  # type: ignore[assignment]
+    for _ in range(count):
+        client.request(
+            WhoIsRequest(
+                deviceInstanceRangeLowLimit=5,
+                deviceInstanceRangeHighLimit=5,
+                destination=address,
+            )
+        )
+    await done.wait()
+
+
+async def confirmed(
+    client: Application, server: Application, address: Address, count: int
+) -> None:
+    """
+    Read the device object name a batch at a time.
+    """
+    batch = 50
+    for i in range(0, count, batch):
+        await asyncio.gather(
+            *(
+                client.request(
+                    ReadPropertyRequest(
+                        objectIdentifier="device,2",
+                        propertyIdentifier="object-name",
+                        destination=address,
+                    )
+                )
+                for _ in range(min(batch, count - i))
+            )
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", type=int, default=5000, help="number of requests in a round"
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="number of rounds")
+    args = parser.parse_args()
+
+    network_name = "send-rate"
+    VirtualNetwork(network_name)
+    client = Application.from_json(
+        [device_json(1, 1476), network_port_json(1, network_name, 1)]
+    )
+    server = Application.from_json(
+        [device_json(2, 1476), network_port_json(1, network_name, 2)]
+    )
+    address = Address("0x02")
+
+    # the best round of each is reported
+    elapsed: Dict[str, List[float]] = defaultdict(list)
+    cpu: Dict[str, List[float]] = defaultdict(list)
+    try:
+        for _ in range(args.rounds):
+            for name, fn in (("unconfirmed", unconfirmed), ("confirmed", confirmed)):
+                start = time.perf_counter()
+                cpu_start = time.process_time()
+                await fn(client, server, address, args.count)
+                elapsed[name].append(time.perf_counter() - start)
+                cpu[name].append(time.process_time() - cpu_start)
+    finally:
+        client.close()
+        server.close()
+
+    for name in ("unconfirmed", "confirmed"):
+        print(
+            f"{name:>11s}:"
+            f" {args.count / min(elapsed[name]):9.0f} requests/s,"
+            f" {min(cpu[name]) * 1e6 / args.count:7.2f} us cpu/request"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+Encode and decode some of the common confirmed services, ReadProperty,
+ReadPropertyMultiple and COV notifications, and report the time per
+round trip through the APCISequence and APDU layers.
+"""
+
+import argparse
+import timeit
+
+from bacpypes3.pdu import PDU
+from bacpypes3.primitivedata import CharacterString, Real
+from bacpypes3.constructeddata import Any
+from bacpypes3.basetypes import (
+    PropertyReference,
+    PropertyValue,
+    ReadAccessResult,
+    ReadAccessResultElement,
+    ReadAccessResultElementChoice,
+    ReadAccessSpecification,
+    StatusFlags,
+)
+from bacpypes3.apdu import (
+    APDU,
+    APCISequence,
+    ConfirmedCOVNotificationRequest,
+    ReadPropertyACK,
+    ReadPropertyMultipleACK,
+    ReadPropertyMultipleRequest,
+    ReadPropertyRequest,
+)
+
+PROPERTIES = ("present-value", "status-flags", "object-name", "description")
+
+
+def read_property_request() -> APCISequence:
+    return ReadPropertyRequest(
+        objectIdentifier="analog-input,1",
+        propertyIdentifier="present-value",
+    )
+
+
+def read_property_ack() -> APCISequence:
+    return ReadPropertyACK(
+        objectIdentifier="analog-input,1",
+        propertyIdentifier="present-value",
+        propertyValue=Any(Real(72.5)),
+    )
+
+
+def read_property_multiple_request(count: int) -> APCISequence:
+    return ReadPropertyMultipleRequest(
+        listOfReadAccessSpecs=[
+            ReadAccessSpecification(
+                objectIdentifier=("analog-input", i),
+                listOfPropertyReferences=[
+                    PropertyReference(propertyIdentifier=prop) for prop in PROPERTIES
+                ],
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def read_property_multiple_ack(count: int) -> APCISequence:
+    return ReadPropertyMultipleACK(
+        listOfReadAccessResults=[
+            ReadAccessResult(
+                objectIdentifier=("analog-input", i),
+                listOfResults=[
+                    ReadAccessResultElement(
+                        propertyIdentifier="present-value",
+                        readResult=ReadAccessResultElementChoice(
+                            propertyValue=Any(Real(i))
+                        ),
+                    ),
+                    ReadAccessResultElement(
+                        propertyIdentifier="status-flags",
+                        readResult=ReadAccessResultElementChoice(
+                            propertyValue=Any(StatusFlags([0, 0, 0, 0]))
+                        ),
+                    ),
+                    ReadAccessResultElement(
+                        propertyIdentifier="object-name",
+                        readResult=ReadAccessResultElementChoice(
+                            propertyValue=Any(CharacterString(f"AI-{i}"))
+                        ),
+                    ),
+                ],
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def cov_notification() -> APCISequence:
+    return ConfirmedCOVNotificationRequest(
+        subscriberProcessIdentifier=1,
+        initiatingDeviceIdentifier=("device", 999),
+        monitoredObjectIdentifier=("analog-value", 1),
+        timeRemaining=60,
+        listOfValues=[
+            PropertyValue(propertyIdentifier="present-value", value=Any(Real(1.0))),
+            PropertyValue(
+                propertyIdentifier="status-flags",
+                value=Any(StatusFlags([0, 0, 0, 0])),
+            ),
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", type=int, default=20, help="objects in the RPM request and ack"
+    )
+    parser.add_argument(
+        "--number", type=int, default=1000, help="iterations in each measurement"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements")
+    args = parser.parse_args()
+
+    for label, apci_sequence in (
+        ("ReadPropertyRequest", read_property_request()),
+        ("ReadPropertyACK", read_property_ack()),
+        ("ReadPropertyMultipleRequest", read_property_multiple_request(args.count)),
+        ("ReadPropertyMultipleACK", read_property_multiple_ack(args.count)),
+        ("ConfirmedCOVNotificationRequest", cov_notification()),
+    ):
+        # header fields normally filled in by the segmentation state machine
+        apci_sequence.apduInvokeID = 1
+        apci_sequence.apduSeg = apci_sequence.apduMor = False
+        apci_sequence.apduSA = True
+        apci_sequence.apduMaxSegs = 0
+        apci_sequence.apduMaxResp = 5
+        data = bytes(apci_sequence.encode().encode().pduData)
+
+        def encode() -> PDU:
+            return apci_sequence.encode().encode()
+
+        def decode() -> APCISequence:
+            return APCISequence.decode(APDU.decode(PDU(data)))
+
+        assert decode() == apci_sequence
+
+        number = max(1, args.number // max(1, len(data) // 16))
+        results = []
+        for fn in (encode, decode):
+            best = min(timeit.repeat(fn, number=number, repeat=args.repeat))
+            results.append(best / number * 1e6)
+
+        print(
+            f"{label:>32s} {len(data):5d} octets:"
+            f" encode {results[0]:9.1f} us, decode {results[1]:9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
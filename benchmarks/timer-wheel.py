@@ -0,0 +1,111 @@
+"""
+Compare the event loop timers (a heap) with the timer wheel for lots of
+timers at the same time, the way the segmentation state machines use them
+when there are many transactions in progress.  Each timer is started and
+then either canceled, like a request that gets an answer, or allowed to
+expire.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from typing import Any, Callable, Dict, List
+
+from bacpypes3.timer import TimerWheel
+
+
+async def run(
+    label: str,
+    call_later: Callable[..., Any],
+    delays: List[float],
+    cancel_fraction: float,
+) -> Dict[str, float]:
+    """
+    Start a timer for each of the delays, cancel some of them, then wait for
+    the rest to fire.
+    """
+    loop = asyncio.get_running_loop()
+    fired = 0
+    late = 0.0
+    done = asyncio.Event()
+    expected = len(delays) - int(len(delays) * cancel_fraction)
+
+    def callback(when: float) -> None:
+        nonlocal fired, late
+        fired += 1
+        late = max(late, loop.time() - when)
+        if fired == expected:
+            done.set()
+
+    # start them
+    start = time.perf_counter()
+    now = loop.time()
+    handles = [call_later(delay, callback, now + delay) for delay in delays]
+    insert_time = time.perf_counter() - start
+
+    # cancel some of them
+    start = time.perf_counter()
+    for handle in handles[: len(delays) - expected]:
+        handle.cancel()
+    cancel_time = time.perf_counter() - start
+    del handles
+
+    # wait for the rest
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    if expected:
+        await done.wait()
+    fire_time = time.perf_counter() - start
+    fire_cpu = time.process_time() - cpu_start
+
+    count = len(delays)
+    print(
+        f"{label:>6s}: insert {insert_time * 1e6 / count:6.2f} us/timer,"
+        f" cancel {cancel_time * 1e6 / max(1, count - expected):6.2f} us/timer,"
+        f" fire {fire_time:6.3f} s ({fire_cpu:6.3f} s cpu),"
+        f" late {late * 1000.0:6.2f} ms"
+    )
+    return {
+        "insert": insert_time,
+        "cancel": cancel_time,
+        "fire": fire_time,
+        "fire_cpu": fire_cpu,
+        "late": late,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50000, help="number of timers")
+    parser.add_argument(
+        "--spread",
+        type=float,
+        default=2.0,
+        help="timers expire between zero and this many seconds",
+    )
+    parser.add_argument(
+        "--cancel",
+        type=float,
+        default=0.9,
+        help="fraction of the timers that are canceled",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random number seed")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    delays = [random.uniform(0.0, args.spread) for _ in range(args.count)]
+    random.shuffle(delays)
+
+    loop = asyncio.get_running_loop()
+    heap = await run("heap", loop.call_later, delays, args.cancel)
+    wheel = await run("wheel", TimerWheel(loop).call_later, delays, args.cancel)
+
+    for key in ("insert", "cancel", "fire_cpu"):
+        ratio = heap[key] / wheel[key] if wheel[key] else float("inf")
+        print(f"{key:>8s}: {ratio:5.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
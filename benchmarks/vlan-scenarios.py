@@ -0,0 +1,373 @@
+"""
+Run a client against a set of servers over virtual networks, either all on
+the same network or through a router to remote networks, and measure the
+ReadProperty, ReadPropertyMultiple, WriteProperty, change of value and
+segmented response round trips.  Report the requests per second, the
+p50/p95/p99 latency and the CPU time per request, and optionally save the
+results as JSON so runs can be compared over time.
+
+Everything runs in this process with no sockets, so the CPU time per request
+covers the client, the router and the servers together.  The requests are
+chosen with a seeded random number generator so runs are repeatable.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from typing import Any as _Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import bacpypes3
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier
+from bacpypes3.basetypes import PropertyIdentifier
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+
+from vlan_objects import device_json, network_port_json
+
+# an operation is given the request number and returns when it is complete,
+# the latency is measured from this point if it returns a start time
+Operation = Callable[[int], Awaitable[Optional[float]]]
+
+# properties read in each ReadPropertyMultiple request
+RPM_PROPERTIES = ["present-value", "status-flags", "out-of-service", "units"]
+
+
+def analog_value_json(instance: int) -> Dict[str, _Any]:
+    return {
+        "object-identifier": f"analog-value,{instance}",
+        "object-name": f"AV-{instance}",
+        "object-type": "analog-value",
+        "cov-increment": 0.5,
+        "out-of-service": False,
+        "present-value": 0.0,
+        "units": "no-units",
+    }
+
+
+class Topology:
+    """
+    A client and a list of servers, along with the addresses the client
+    uses to reach them.
+    """
+
+    name: str
+    client: Application
+    servers: List[Application]
+    addresses: List[Address]
+    applications: List[Application]
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.servers = []
+        self.addresses = []
+        self.applications = []
+
+    def application(self, objects: List[Dict[str, _Any]]) -> Application:
+        app = Application.from_json(objects)
+        self.applications.append(app)
+        return app
+
+    def add_server(
+        self, instance: int, network_name: str, address: Address, objects: int
+    ) -> None:
+        self.servers.append(
+            self.application(
+                [
+                    device_json(instance, 1476),
+                    network_port_json(1, network_name, address.addrAddr[0]),
+                ]
+                + [analog_value_json(i) for i in range(1, objects + 1)]
+            )
+        )
+        self.addresses.append(address)
+
+    async def discover(self) -> None:
+        """
+        Read from each server in turn so the routes to the remote networks
+        are known before the requests are measured.
+        """
+        for i, address in enumerate(self.addresses):
+            await self.client.read_property(
+                address, f"device,{1000 + i}", "object-name"
+            )
+
+    def close(self) -> None:
+        for app in self.applications:
+            app.close()
+
+
+def direct_topology(args: argparse.Namespace) -> Topology:
+    """
+    The client and all of the servers are on the same network.
+    """
+    topology = Topology("direct")
+    network_name = "direct"
+    VirtualNetwork(network_name)
+
+    # small enough that reading the object list is segmented
+    topology.client = topology.application(
+        [device_json(1, 206), network_port_json(1, network_name, 1)]
+    )
+    for i in range(args.servers):
+        topology.add_server(
+            1000 + i, network_name, Address(f"0x{i + 2:02X}"), args.objects
+        )
+
+    return topology
+
+
+def routed_topology(args: argparse.Namespace) -> Topology:
+    """
+    The client is on network 1 and the servers are spread across the remote
+    networks, a router connects them all.
+    """
+    topology = Topology("routed")
+    network_names = [f"routed-{net}" for net in range(1, args.networks + 2)]
+    for network_name in network_names:
+        VirtualNetwork(network_name)
+
+    topology.application(
+        [device_json(2, 1476)]
+        + [
+            network_port_json(net, network_name, 1, net)
+            for net, network_name in enumerate(network_names, start=1)
+        ]
+    )
+    topology.client = topology.application(
+        [device_json(1, 206), network_port_json(1, network_names[0], 2)]
+    )
+    for i in range(args.servers):
+        net = 2 + (i % args.networks)
+        topology.add_server(
+            1000 + i,
+            network_names[net - 1],
+            Address(f"{net}:0x{i + 2:02X}"),
+            args.objects,
+        )
+
+    return topology
+
+
+def operations(
+    topology: Topology, args: argparse.Namespace
+) -> List[Tuple[str, Operation, Optional[Callable[[], Awaitable[None]]]]]:
+    """
+    Return a list of (name, operation, setup) tuples for the topology, the
+    setup function is called before the operation is measured.
+    """
+    client = topology.client
+    rng = random.Random(args.seed)
+
+    def target() -> Tuple[Address, str]:
+        address = rng.choice(topology.addresses)
+        return address, f"analog-value,{rng.randint(1, args.objects)}"
+
+    async def read_property(n: int) -> None:
+        address, objid = target()
+        await client.read_property(address, objid, "present-value")
+
+    async def read_property_multiple(n: int) -> None:
+        address, objid = target()
+        await client.read_property_multiple(address, [objid, RPM_PROPERTIES])
+
+    async def write_property(n: int) -> None:
+        address, objid = target()
+        await client.write_property(address, objid, "present-value", float(n))
+
+    async def segmented(n: int) -> None:
+        address = rng.choice(topology.addresses)
+        device_identifier = 1000 + topology.addresses.index(address)
+        await client.read_property(
+            address, f"device,{device_identifier}", "object-list"
+        )
+
+    # one subscription to the first analog value of each server, a lock
+    # keeps the changes to each of them in sequence
+    subscriptions: List[Tuple[_Any, _Any, asyncio.Lock]] = []
+
+    async def cov_setup() -> None:
+        objid = ObjectIdentifier("analog-value,1")
+        for server, address in zip(topology.servers, topology.addresses):
+            scm = client.change_of_value(address, objid, lifetime=0)
+            await scm.__aenter__()
+
+            # toss the initial notification
+            await scm.get_value()
+            await scm.get_value()
+            subscriptions.append((server.get_object_id(objid), scm, asyncio.Lock()))
+
+    async def cov(n: int) -> float:
+        obj, scm, lock = rng.choice(subscriptions)
+        async with lock:
+            start = time.perf_counter()
+            obj.presentValue = float(n + 1)
+            while True:
+                property_identifier, value = await scm.get_value()
+                if (property_identifier == PropertyIdentifier.presentValue) and (
+                    value == n + 1
+                ):
+                    return start
+
+    return [
+        ("read-property", read_property, None),
+        ("read-property-multiple", read_property_multiple, None),
+        ("write-property", write_property, None),
+        ("cov", cov, cov_setup),
+        ("segmented", segmented, None),
+    ]
+
+
+async def run(
+    operation: Operation, count: int, concurrency: int, first: int
+) -> Tuple[List[float], int, float, float]:
+    """
+    Run the operation count times with up to concurrency of them at a time,
+    return the latencies, the number of errors, the elapsed time and the
+    CPU time.
+    """
+    latencies: List[float] = []
+    errors = 0
+    requests = iter(range(first, first + count))
+
+    async def worker() -> None:
+        nonlocal errors
+        for n in requests:
+            start = time.perf_counter()
+            try:
+                started = await operation(n)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - (started or start))
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    return latencies, errors, elapsed, cpu
+
+
+def summarize(
+    latencies: List[float], errors: int, elapsed: float, cpu: float
+) -> Dict[str, _Any]:
+    requests = len(latencies) + errors
+    result: Dict[str, _Any] = {
+        "requests": requests,
+        "errors": errors,
+        "requests_per_second": requests / elapsed,
+        "cpu_us": cpu / requests * 1e6,
+    }
+    if len(latencies) > 1:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        result.update(
+            p50_ms=quantiles[49] * 1e3,
+            p95_ms=quantiles[94] * 1e3,
+            p99_ms=quantiles[98] * 1e3,
+        )
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", type=int, default=500, help="requests in each measurement"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="requests before each measurement"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="requests outstanding at a time"
+    )
+    parser.add_argument("--servers", type=int, default=4, help="number of servers")
+    parser.add_argument(
+        "--networks", type=int, default=2, help="remote networks behind the router"
+    )
+    parser.add_argument(
+        "--objects", type=int, default=100, help="analog value objects in each server"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random number seed")
+    parser.add_argument(
+        "--filter", type=str, default="", help="only the scenarios with this"
+    )
+    parser.add_argument("--json", type=str, help="save the results in this file")
+    parser.add_argument(
+        "--compare", type=str, help="compare the results with a previous JSON file"
+    )
+    args = parser.parse_args()
+
+    previous: Dict[Tuple[str, str], Dict[str, _Any]] = {}
+    if args.compare:
+        with open(args.compare) as compare_file:
+            for result in json.load(compare_file)["results"]:
+                previous[(result["topology"], result["operation"])] = result
+
+    results: List[Dict[str, _Any]] = []
+    for build_topology in (direct_topology, routed_topology):
+        topology = build_topology(args)
+        try:
+            await topology.discover()
+            for name, operation, setup in operations(topology, args):
+                if args.filter and (args.filter not in topology.name + "." + name):
+                    continue
+                if setup:
+                    await setup()
+
+                await run(operation, args.warmup, args.concurrency, 0)
+                result = summarize(
+                    *await run(operation, args.count, args.concurrency, args.warmup)
+                )
+                result = {"topology": topology.name, "operation": name, **result}
+                results.append(result)
+
+                line = (
+                    f"{topology.name + '.' + name:>32s}:"
+                    f" {result['requests_per_second']:8.1f} req/s,"
+                    f" p50 {result.get('p50_ms', 0.0):7.3f}"
+                    f" p95 {result.get('p95_ms', 0.0):7.3f}"
+                    f" p99 {result.get('p99_ms', 0.0):7.3f} ms,"
+                    f" {result['cpu_us']:8.1f} us cpu"
+                )
+                if result["errors"]:
+                    line += f", {result['errors']} errors"
+                before = previous.get((topology.name, name), None)
+                if before:
+                    ratio = (
+                        result["requests_per_second"] / before["requests_per_second"]
+                    )
+                    line += f" ({ratio:5.2f}x)"
+                print(line)
+        finally:
+            topology.close()
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(
+                {
+                    "bacpypes3": bacpypes3.__version__,
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "count": args.count,
+                    "concurrency": args.concurrency,
+                    "servers": args.servers,
+                    "networks": args.networks,
+                    "objects": args.objects,
+                    "seed": args.seed,
+                    "results": results,
+                },
+                json_file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""
+Objects for the applications in the benchmarks that run over virtual
+networks.  The directory of a script is on the module search path so the
+scripts in this directory can import it.
+"""
+
+from typing import Any as _Any, Dict
+
+
+def device_json(instance: int, max_apdu_length_accepted: int) -> Dict[str, _Any]:
+    return {
+        "object-identifier": f"device,{instance}",
+        "object-name": f"Device-{instance}",
+        "object-type": "device",
+        "apdu-segment-timeout": 1000,
+        "apdu-timeout": 3000,
+        "application-software-version": "1.0",
+        "database-revision": 1,
+        "firmware-revision": "N/A",
+        "max-apdu-length-accepted": max_apdu_length_accepted,
+        "max-segments-accepted": 64,
+        "model-name": "N/A",
+        "number-of-apdu-retries": 0,
+        "protocol-revision": 22,
+        "protocol-version": 1,
+        "segmentation-supported": "segmented-both",
+        "system-status": "operational",
+        "vendor-identifier": 999,
+        "vendor-name": "BACpypes",
+    }
+
+
+def network_port_json(
+    instance: int, network_name: str, mac_address: int, network_number: int = 0
+) -> Dict[str, _Any]:
+    network_port = {
+        "object-identifier": f"network-port,{instance}",
+        "object-name": f"NetworkPort-{instance}",
+        "object-type": "network-port",
+        "changes-pending": False,
+        "mac-address": f"0x{mac_address:02X}",
+        "network-interface-name": network_name,
+        "network-type": "virtual",
+        "out-of-service": False,
+        "protocol-level": "bacnet-application",
+        "reliability": "no-fault-detected",
+    }
+    if network_number:
+        network_port["network-number"] = network_number
+        network_port["network-number-quality"] = "configured"
+    return network_port
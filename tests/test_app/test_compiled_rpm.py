@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Compiled Read Property Multiple
+------------------------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier
+from bacpypes3.basetypes import ErrorType, PropertyIdentifier
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def analog_value_json(instance: int):
+    return {
+        "object-identifier": f"analog-value,{instance}",
+        "object-name": f"AV-{instance}",
+        "object-type": "analog-value",
+        "present-value": float(instance),
+    }
+
+
+PARAMETER_LIST = [
+    "analog-value,1",
+    ["present-value", "object-name"],
+    "analog-value,2",
+    ["present-value"],
+    "device,2",
+    ["object-list", "object-list[0]", "object-list[1]"],
+    "analog-value,99",
+    ["present-value"],
+]
+
+
+@bacpypes_debugging
+class TestCompiledRPM:
+    def applications(self, network_name):
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [device_json(1), network_port_json(network_name, "0x01")]
+        )
+        server = Application.from_json(
+            [device_json(2)]
+            + [analog_value_json(i) for i in (1, 2)]
+            + [network_port_json(network_name, "0x02")]
+        )
+        return client, server
+
+    @pytest.mark.asyncio
+    async def test_compiled_rpm(self):
+        if _debug:
+            TestCompiledRPM._debug("test_compiled_rpm")
+
+        client, server = self.applications("test-compiled-rpm")
+        address = Address("0x02")
+        try:
+            compiled = await client.compile_rpm(address, PARAMETER_LIST)
+            assert len(compiled.datatypes) == 7
+
+            # the same results as the request that is not compiled
+            expected = await client.read_property_multiple(address, PARAMETER_LIST)
+            for _ in range(3):
+                assert await compiled.read() == expected
+            assert compiled.reads == 3
+
+            results = await compiled.read()
+            assert results[0] == (
+                ObjectIdentifier("analog-value,1"),
+                PropertyIdentifier.presentValue,
+                None,
+                1.0,
+            )
+            assert results[4][2:] == (0, 4)
+            assert results[5][3] == ObjectIdentifier("device,2")
+            assert isinstance(results[6][3], ErrorType)
+
+            # values change between reads
+            server.get_object_id(ObjectIdentifier("analog-value,2")).presentValue = 7.5
+            assert (await compiled.read())[2][3] == 7.5
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_special_properties(self):
+        if _debug:
+            TestCompiledRPM._debug("test_special_properties")
+
+        client, server = self.applications("test-compiled-rpm-all")
+        try:
+            # the datatypes are resolved when the results come back
+            compiled = await client.compile_rpm(
+                Address("0x02"), ["analog-value,1", ["all"]]
+            )
+            assert compiled.datatypes == {}
+            results = await compiled.read()
+            values = {
+                property_identifier: property_value
+                for _, property_identifier, _, property_value in results
+            }
+            assert values[PropertyIdentifier.objectName] == "AV-1"
+            assert values[PropertyIdentifier.presentValue] == 1.0
+            assert compiled.datatypes
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self):
+        if _debug:
+            TestCompiledRPM._debug("test_single_flight")
+
+        settings.single_flight = True
+        try:
+            client, server = self.applications("test-compiled-rpm-single-flight")
+        finally:
+            settings.single_flight = False
+
+        address = Address("0x02")
+        parameter_list = ["analog-value,1", ["present-value"]]
+        try:
+            # compiled requests share responses with the others
+            compiled = await client.compile_rpm(address, parameter_list)
+            results = await asyncio.gather(
+                compiled.read(),
+                compiled.read(),
+                client.read_property_multiple(address, parameter_list),
+            )
+            assert results[0] == results[1] == results[2]
+            assert client.single_flight.hits == 2
+        finally:
+            client.close()
+            server.close()
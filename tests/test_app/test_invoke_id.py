@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Invoke ID Pool
+-------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.apdu import ReadPropertyRequest
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application, InvokeIDPool
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def read_property_request(invoke_id=None):
+    apdu = ReadPropertyRequest(
+        objectIdentifier="device,1",
+        propertyIdentifier="object-name",
+        destination=Address("0x02"),
+    )
+    apdu.apduInvokeID = invoke_id
+    return apdu
+
+
+@bacpypes_debugging
+class TestInvokeIDPool:
+    @pytest.mark.asyncio
+    async def test_allocate_release(self):
+        if _debug:
+            TestInvokeIDPool._debug("test_allocate_release")
+
+        pool = InvokeIDPool(start=10)
+
+        # IDs are allocated from the starting point
+        apdu1 = read_property_request()
+        assert pool.allocate(apdu1, asyncio.Future())
+        assert apdu1.apduInvokeID == 10
+
+        # a free ID that is asked for is kept, one in use is not
+        apdu2 = read_property_request(20)
+        assert pool.allocate(apdu2, asyncio.Future())
+        assert apdu2.apduInvokeID == 20
+        apdu3 = read_property_request(20)
+        assert pool.allocate(apdu3, asyncio.Future())
+        assert apdu3.apduInvokeID == 11
+
+        # released IDs go to the end of the line
+        assert pool.release(apdu1) is None
+        assert 10 not in pool.requests
+        assert pool.free[-1] == 10
+
+    @pytest.mark.asyncio
+    async def test_exhausted(self):
+        if _debug:
+            TestInvokeIDPool._debug("test_exhausted")
+
+        pool = InvokeIDPool()
+        apdus = [read_property_request() for _ in range(256)]
+        for apdu in apdus:
+            assert pool.allocate(apdu, asyncio.Future())
+        assert len(set(apdu.apduInvokeID for apdu in apdus)) == 256
+
+        # the next ones wait
+        waiting1, future1 = read_property_request(), asyncio.Future()
+        waiting2, future2 = read_property_request(), asyncio.Future()
+        assert not pool.allocate(waiting1, future1)
+        assert not pool.allocate(waiting2, future2)
+
+        # canceled while waiting
+        future1.cancel()
+        assert pool.release(waiting1) is None
+        assert len(pool.pending) == 1
+
+        # the released ID goes to the one still waiting
+        assert pool.release(apdus[5]) == (waiting2, future2)
+        assert waiting2.apduInvokeID == 5
+        assert pool.requests[5] == (waiting2, future2)
+        assert not pool.pending
+
+
+@bacpypes_debugging
+class TestManyRequests:
+    @pytest.mark.asyncio
+    async def test_many_requests(self):
+        if _debug:
+            TestManyRequests._debug("test_many_requests")
+
+        network_name = "test-invoke-id"
+        VirtualNetwork(network_name)
+        apps = [
+            Application.from_json(
+                [device_json(i), network_port_json(network_name, f"0x{i:02X}")]
+            )
+            for i in (1, 2)
+        ]
+        client = apps[0]
+
+        try:
+            # more than there are invoke IDs for one peer
+            reads = [
+                asyncio.ensure_future(
+                    client.read_property(Address("0x02"), "device,2", "object-name")
+                )
+                for _ in range(300)
+            ]
+            while not client._requests:
+                await asyncio.sleep(0)
+            invoke_id_pool = client._requests[Address("0x02")]
+            while len(invoke_id_pool.requests) < 256:
+                await asyncio.sleep(0)
+            assert len(invoke_id_pool.pending) == 44
+
+            assert await asyncio.gather(*reads) == ["Device-2"] * 300
+            assert client._requests == {}
+        finally:
+            for app in apps:
+                app.close()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Property Cache
+-------------------
+"""
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.primitivedata import CharacterString, Real
+from bacpypes3.basetypes import PropertyIdentifier
+from bacpypes3.local.analog import AnalogValueObject, AnalogValueObjectCmd
+from bacpypes3.service.object import read_property_to_any
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestPropertyCache:
+    def setup_method(self):
+        settings.property_cache = True
+
+    def teardown_method(self):
+        settings.property_cache = False
+
+    @pytest.mark.asyncio
+    async def test_read_cached(self):
+        if _debug:
+            TestPropertyCache._debug("test_read_cached")
+
+        avo = AnalogValueObject(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            presentValue=1.0,
+        )
+        assert avo._property_cache == {}
+
+        # first read saves the tags, the second one uses them
+        any1 = await read_property_to_any(avo, "presentValue")
+        assert "presentValue" in avo._property_cache
+        any2 = await read_property_to_any(avo, PropertyIdentifier.presentValue)
+        assert any2 == any1
+        assert any2.cast_out(Real) == 1.0
+
+        # the cached tags are not consumed
+        any3 = await read_property_to_any(avo, "presentValue")
+        assert any3.cast_out(Real) == 1.0
+
+        # calculated values are not cached, the property list is
+        await read_property_to_any(avo, "statusFlags")
+        await read_property_to_any(avo, "propertyList")
+        assert "statusFlags" not in avo._property_cache
+        assert "propertyList" in avo._property_cache
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        if _debug:
+            TestPropertyCache._debug("test_invalidate")
+
+        avo = AnalogValueObject(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            presentValue=1.0,
+        )
+        await read_property_to_any(avo, "presentValue")
+        await read_property_to_any(avo, "objectName")
+        await read_property_to_any(avo, "propertyList")
+
+        # changing the attribute
+        avo.presentValue = 2.0
+        assert "presentValue" not in avo._property_cache
+        assert "propertyList" not in avo._property_cache
+        any1 = await read_property_to_any(avo, "presentValue")
+        assert any1.cast_out(Real) == 2.0
+
+        # changing a @property
+        avo.objectName = "av2"
+        assert "objectName" not in avo._property_cache
+        any1 = await read_property_to_any(avo, "objectName")
+        assert any1.cast_out(CharacterString) == "av2"
+
+        # writing the property, adds it to the property list
+        await read_property_to_any(avo, "propertyList")
+        await avo.write_property("description", "something")
+        assert "propertyList" not in avo._property_cache
+        any1 = await read_property_to_any(avo, "description")
+        assert any1.cast_out(CharacterString) == "something"
+
+        await avo.write_property("description", "something else")
+        any1 = await read_property_to_any(avo, "description")
+        assert any1.cast_out(CharacterString) == "something else"
+
+    @pytest.mark.asyncio
+    async def test_commandable(self):
+        if _debug:
+            TestPropertyCache._debug("test_commandable")
+
+        avo = AnalogValueObjectCmd(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            presentValue=1.0,
+        )
+        await read_property_to_any(avo, "presentValue")
+
+        # the new value comes from the priority array
+        await avo.write_property("presentValue", Real(3.0), priority=8)
+        any1 = await read_property_to_any(avo, "presentValue")
+        assert any1.cast_out(Real) == 3.0
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        if _debug:
+            TestPropertyCache._debug("test_disabled")
+
+        settings.property_cache = False
+        avo = AnalogValueObject(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            presentValue=1.0,
+        )
+        await read_property_to_any(avo, "presentValue")
+        assert avo._property_cache is None
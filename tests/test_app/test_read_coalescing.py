@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Read Property Coalescing
+-----------------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.pdu import Address
+from bacpypes3.basetypes import ErrorCode, Segmentation, ServicesSupported
+from bacpypes3.apdu import AbortPDU, AbortReason, ErrorPDU
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application, DeviceInfo
+
+from ..utilities import device_json, segmented_device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def analog_value_json(instance: int):
+    return {
+        "object-identifier": f"analog-value,{instance}",
+        "object-name": f"AV-{instance}",
+        "object-type": "analog-value",
+        "present-value": float(instance),
+    }
+
+
+@bacpypes_debugging
+class TestReadCoalescing:
+    def setup_method(self):
+        settings.read_coalescing = True
+
+    def teardown_method(self):
+        settings.read_coalescing = False
+
+    def applications(self, network_name):
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [device_json(1), network_port_json(network_name, "0x01")]
+        )
+        server = Application.from_json(
+            [device_json(2)]
+            + [analog_value_json(i) for i in range(1, 21)]
+            + [network_port_json(network_name, "0x02")]
+        )
+        return client, server
+
+    async def read_values(self, client):
+        return await asyncio.gather(
+            *(
+                client.read_property(
+                    Address("0x02"), f"analog-value,{i}", "present-value"
+                )
+                for i in list(range(1, 21)) + [1]
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_coalesced(self):
+        if _debug:
+            TestReadCoalescing._debug("test_coalesced")
+
+        client, server = self.applications("test-read-coalescing")
+        address = Address("0x02")
+        try:
+            assert await self.read_values(client) == [
+                float(i) for i in list(range(1, 21)) + [1]
+            ]
+            assert client.read_property_coalescer.reads == 21
+            assert client.read_property_coalescer.batches == 1
+
+            # errors are per read
+            reads = await asyncio.gather(
+                client.read_property(address, "analog-value,1", "object-name"),
+                client.read_property(address, "analog-value,99", "object-name"),
+                client.read_property(address, "analog-value,2", "priority-array"),
+                return_exceptions=True,
+            )
+            assert reads[0] == "AV-1"
+            assert isinstance(reads[1], ErrorPDU)
+            assert reads[1].errorCode == ErrorCode.unknownObject
+            assert isinstance(reads[2], ErrorPDU)
+            assert reads[2].errorCode == ErrorCode.unknownProperty
+
+            # the batches fit in the device
+            client.device_info_cache.address_cache[address] = DeviceInfo(
+                2, address, max_apdu_length_accepted=206
+            )
+            assert await self.read_values(client) == [
+                float(i) for i in list(range(1, 21)) + [1]
+            ]
+            assert client.read_property_coalescer.batches == 1 + 1 + 3
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_single_reads(self):
+        if _debug:
+            TestReadCoalescing._debug("test_single_reads")
+
+        client, server = self.applications("test-read-coalescing-single")
+        address = Address("0x02")
+        try:
+            # the device says it does not support read property multiple
+            services_supported = ServicesSupported([])
+            services_supported[ServicesSupported.readProperty] = 1
+            client.device_info_cache.address_cache[address] = DeviceInfo(
+                2, address, protocol_services_supported=services_supported
+            )
+            assert (await self.read_values(client))[:3] == [1.0, 2.0, 3.0]
+            assert client.read_property_coalescer.batches == 0
+
+            # the device rejects it
+            del client.device_info_cache.address_cache[address]
+            server.do_ReadPropertyMultipleRequest = None
+            assert (await self.read_values(client))[:3] == [1.0, 2.0, 3.0]
+            assert client.read_property_coalescer.batches == 1
+            assert address in client.read_property_coalescer.single_read
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_errors(self):
+        if _debug:
+            TestReadCoalescing._debug("test_errors")
+
+        client, server = self.applications("test-read-coalescing-errors")
+        address = Address("0x02")
+        try:
+            requests = []
+
+            def request(apdu):
+                requests.append(apdu)
+                future = asyncio.get_running_loop().create_future()
+                future.set_exception(error)
+                return future
+
+            client.request = request
+
+            async def read_values():
+                return await asyncio.gather(
+                    *(
+                        client.read_property(
+                            address, f"analog-value,{i}", "present-value"
+                        )
+                        for i in range(1, 11)
+                    ),
+                    return_exceptions=True,
+                )
+
+            # the device does not answer, the reads are not sent again
+            error = AbortPDU(reason=AbortReason.tsmTimeout)
+            reads = await read_values()
+            assert all(read is error for read in reads)
+            assert len(requests) == 1
+            assert address not in client.read_property_coalescer.single_read
+
+            # something unexpected goes wrong
+            requests.clear()
+            error = RuntimeError("unexpected")
+            reads = await read_values()
+            assert all(read is error for read in reads)
+            assert len(requests) == 1
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_not_segmented(self):
+        if _debug:
+            TestReadCoalescing._debug("test_not_segmented")
+
+        network_name = "test-read-coalescing-not-segmented"
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [device_json(1), network_port_json(network_name, "0x01")]
+        )
+        server = Application.from_json(
+            [
+                device_json(
+                    2,
+                    max_apdu_length_accepted=480,
+                    segmentation_supported="no-segmentation",
+                )
+            ]
+            + [
+                {
+                    "object-identifier": f"analog-value,{i}",
+                    "object-name": f"{'Long-Name-' * 7}{i}",
+                    "object-type": "analog-value",
+                    "present-value": float(i),
+                }
+                for i in range(1, 21)
+            ]
+            + [network_port_json(network_name, "0x02")]
+        )
+        address = Address("0x02")
+
+        async def read_names():
+            return await asyncio.gather(
+                *(
+                    client.read_property(address, f"analog-value,{i}", "object-name")
+                    for i in range(1, 21)
+                )
+            )
+
+        try:
+            # the responses do not fit, the reads are split until they do
+            names = [f"{'Long-Name-' * 7}{i}" for i in range(1, 21)]
+            assert await read_names() == names
+            read_limit = client.read_property_coalescer.read_limits[address]
+            assert 1 < read_limit < 20
+
+            # the next reads are sent in batches that fit
+            batches = client.read_property_coalescer.batches
+            assert await read_names() == names
+            assert client.read_property_coalescer.batches - batches == -(
+                -20 // read_limit
+            )
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_max_reads(self):
+        if _debug:
+            TestReadCoalescing._debug("test_max_reads")
+
+        network_name = "test-read-coalescing-max-reads"
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [segmented_device_json(1), network_port_json(network_name, "0x01")]
+        )
+        coalescer = client.read_property_coalescer
+        try:
+            # the response to a device that does not segment has to fit
+            address = Address("0x03")
+            client.device_info_cache.address_cache[address] = DeviceInfo(
+                3, address, max_apdu_length_accepted=480
+            )
+            assert coalescer.max_reads(address) == 20
+
+            # the response from one that does can be in segments
+            address = Address("0x04")
+            client.device_info_cache.address_cache[address] = DeviceInfo(
+                4,
+                address,
+                max_apdu_length_accepted=480,
+                segmentation_supported=Segmentation.segmentedTransmit,
+            )
+            assert coalescer.max_reads(address) == 20 * 16
+
+            # but no more than it has been able to answer
+            coalescer.read_limits[address] = 5
+            assert coalescer.max_reads(address) == 5
+        finally:
+            client.close()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Request Executor
+---------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.pdu import Address
+from bacpypes3.errors import OutOfResources
+from bacpypes3.apdu import AbortPDU, AbortReason
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application, RequestExecutor
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestRequestExecutor:
+    @pytest.mark.asyncio
+    async def test_queue(self):
+        if _debug:
+            TestRequestExecutor._debug("test_queue")
+
+        executor = RequestExecutor(max_workers=2, max_queue=1)
+        event = asyncio.Event()
+        order = []
+
+        async def helper(apdu):
+            order.append(apdu)
+            await event.wait()
+
+        tasks = [asyncio.ensure_future(executor.run(helper, i)) for i in range(4)]
+        await asyncio.sleep(0)
+        assert order == [0, 1]
+        assert executor.running == 2
+        assert len(executor.waiting) == 1
+
+        # the queue was full for the last one
+        assert tasks[3].done()
+        with pytest.raises(OutOfResources):
+            tasks[3].result()
+
+        # the one waiting gets a turn
+        event.set()
+        assert await asyncio.gather(*tasks[:3]) == [True, True, True]
+        assert order == [0, 1, 2]
+
+        metrics = executor.metrics()
+        assert metrics["running"] == 0
+        assert metrics["executed"] == 3
+        assert metrics["aborted"] == 1
+        assert metrics["max_waiting"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drop(self):
+        if _debug:
+            TestRequestExecutor._debug("test_drop")
+
+        executor = RequestExecutor(max_workers=1, policy="drop")
+        event = asyncio.Event()
+
+        async def helper(apdu):
+            await event.wait()
+
+        task = asyncio.ensure_future(executor.run(helper, 0))
+        await asyncio.sleep(0)
+        assert not await executor.run(helper, 1)
+        assert executor.dropped == 1
+
+        event.set()
+        assert await task
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiting(self):
+        if _debug:
+            TestRequestExecutor._debug("test_cancel_waiting")
+
+        executor = RequestExecutor(max_workers=1, max_queue=2)
+        event = asyncio.Event()
+
+        async def helper(apdu):
+            await event.wait()
+
+        tasks = [asyncio.ensure_future(executor.run(helper, i)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        event.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert tasks[1].cancelled()
+        assert tasks[2].result()
+        assert executor.running == 0
+        assert not executor.waiting
+
+
+@bacpypes_debugging
+class TestLimitedServer:
+    def setup_method(self):
+        settings.server_workers = 1
+        settings.server_queue = 1
+
+    def teardown_method(self):
+        settings.server_workers = 0
+        settings.server_queue = 16
+
+    @pytest.mark.asyncio
+    async def test_limited_server(self):
+        if _debug:
+            TestLimitedServer._debug("test_limited_server")
+
+        network_name = "test-request-executor"
+        VirtualNetwork(network_name)
+        apps = [
+            Application.from_json(
+                [device_json(i), network_port_json(network_name, f"0x{i:02X}")]
+            )
+            for i in (1, 2)
+        ]
+        client, server = apps
+
+        # a server that takes a while to read
+        do_ReadPropertyRequest = server.do_ReadPropertyRequest
+
+        async def slow_read_property(apdu):
+            await asyncio.sleep(0.01)
+            await do_ReadPropertyRequest(apdu)
+
+        server.do_ReadPropertyRequest = slow_read_property
+
+        try:
+            reads = await asyncio.gather(
+                *(
+                    client.read_property(Address("0x02"), "device,2", "object-name")
+                    for _ in range(4)
+                ),
+                return_exceptions=True,
+            )
+            assert reads[:2] == ["Device-2", "Device-2"]
+            for read in reads[2:]:
+                assert isinstance(read, AbortPDU)
+                assert read.apduAbortRejectReason == AbortReason.outOfResources
+
+            metrics = server.request_executor.metrics()
+            assert metrics["executed"] == 2
+            assert metrics["aborted"] == 2
+            assert metrics["max_wait_time"] > 0.0
+        finally:
+            for app in apps:
+                app.close()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Request Scheduler
+----------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.pdu import Address
+from bacpypes3.basetypes import Segmentation
+from bacpypes3.apdu import ReadPropertyRequest
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import (
+    PRIORITY_BULK,
+    Application,
+    DeviceInfo,
+    DeviceInfoCache,
+    RequestScheduler,
+    request_priority,
+)
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def request(address):
+    """Return a request and a future for it."""
+    apdu = ReadPropertyRequest(
+        objectIdentifier="device,1",
+        propertyIdentifier="object-name",
+        destination=Address(address),
+    )
+    return apdu, asyncio.Future()
+
+
+@bacpypes_debugging
+class TestRequestScheduler:
+    @pytest.mark.asyncio
+    async def test_request_limit(self):
+        if _debug:
+            TestRequestScheduler._debug("test_request_limit")
+
+        scheduler = RequestScheduler(max_requests=2)
+        requests = [request(f"0x{i:02X}") for i in range(1, 5)]
+        assert [scheduler.submit(*rf) for rf in requests] == [True, True, False, False]
+        assert scheduler.metrics()["waiting"] == 2
+
+        # one completes, the next one goes
+        assert scheduler.release(requests[0][0]) == [requests[2]]
+        assert scheduler.outstanding == 2
+
+        # canceled while waiting
+        assert scheduler.release(requests[3][0]) == []
+        assert scheduler.metrics()["waiting"] == 0
+        assert scheduler.outstanding == 2
+
+    @pytest.mark.asyncio
+    async def test_device_limit(self):
+        if _debug:
+            TestRequestScheduler._debug("test_device_limit")
+
+        device_info_cache = DeviceInfoCache()
+        device_info_cache.address_cache[Address("0x03")] = DeviceInfo(
+            3, Address("0x03"), segmentation_supported=Segmentation.noSegmentation
+        )
+        scheduler = RequestScheduler(
+            max_device_requests=2, device_info_cache=device_info_cache
+        )
+        scheduler.device_limits[Address("0x04")] = 3
+
+        # the default, a non-segmenting device and one with its own limit
+        for address, limit in (("0x02", 2), ("0x03", 1), ("0x04", 3)):
+            results = [scheduler.submit(*request(address)) for _ in range(4)]
+            assert results.count(True) == limit
+
+    @pytest.mark.asyncio
+    async def test_network_limit(self):
+        if _debug:
+            TestRequestScheduler._debug("test_network_limit")
+
+        scheduler = RequestScheduler(max_network_requests=1)
+        scheduler.network_limits[20] = 2
+
+        assert scheduler.submit(*request("10:0x02"))
+        assert not scheduler.submit(*request("10:0x03"))
+        assert scheduler.submit(*request("20:0x02"))
+        assert scheduler.submit(*request("20:0x03"))
+        assert not scheduler.submit(*request("20:0x04"))
+
+        # local stations are not limited by a network
+        assert scheduler.submit(*request("0x02"))
+
+    @pytest.mark.asyncio
+    async def test_fair_priority(self):
+        if _debug:
+            TestRequestScheduler._debug("test_fair_priority")
+
+        scheduler = RequestScheduler(max_requests=1)
+        first = request("0x01")
+        assert scheduler.submit(*first)
+
+        # bulk requests to two devices, then an interactive one
+        token = request_priority.set(PRIORITY_BULK)
+        try:
+            bulk = [request(address) for address in ("0x02", "0x02", "0x03", "0x03")]
+            for rf in bulk:
+                assert not scheduler.submit(*rf)
+        finally:
+            request_priority.reset(token)
+        interactive = request("0x04")
+        assert not scheduler.submit(*interactive)
+
+        metrics = scheduler.metrics()
+        assert metrics["waiting_interactive"] == 1
+        assert metrics["waiting_bulk"] == 4
+        assert metrics["waiting_devices"] == 3
+
+        # interactive first, then the devices take turns
+        order = []
+        previous = first
+        while True:
+            next_requests = scheduler.release(previous[0])
+            if not next_requests:
+                break
+            previous = next_requests[0]
+            order.append(previous)
+        assert order == [interactive, bulk[0], bulk[2], bulk[1], bulk[3]]
+        assert scheduler.metrics()["max_waiting"] == 5
+
+    @pytest.mark.asyncio
+    async def test_other_priority(self):
+        if _debug:
+            TestRequestScheduler._debug("test_other_priority")
+
+        scheduler = RequestScheduler(max_requests=1)
+        first = request("0x01")
+        assert scheduler.submit(*first)
+
+        # priority classes that are not known are bulk
+        waiting = []
+        for priority in (PRIORITY_BULK + 1, -1):
+            token = request_priority.set(priority)
+            try:
+                rf = request("0x02")
+                assert not scheduler.submit(*rf)
+                waiting.append(rf)
+            finally:
+                request_priority.reset(token)
+        interactive = request("0x03")
+        assert not scheduler.submit(*interactive)
+
+        metrics = scheduler.metrics()
+        assert metrics["waiting_interactive"] == 1
+        assert metrics["waiting_bulk"] == 2
+        assert scheduler.release(first[0]) == [interactive]
+
+
+@bacpypes_debugging
+class TestScheduledApplication:
+    def setup_method(self):
+        settings.request_scheduler = True
+        settings.request_limit = 2
+
+    def teardown_method(self):
+        settings.request_scheduler = False
+        settings.request_limit = 0
+
+    @pytest.mark.asyncio
+    async def test_scheduled_requests(self):
+        if _debug:
+            TestScheduledApplication._debug("test_scheduled_requests")
+
+        network_name = "test-request-scheduler"
+        VirtualNetwork(network_name)
+        apps = [
+            Application.from_json(
+                [device_json(i), network_port_json(network_name, f"0x{i:02X}")]
+            )
+            for i in (1, 2, 3)
+        ]
+        client = apps[0]
+
+        try:
+            reads = [
+                client.read_property(
+                    Address(f"0x{i:02X}"), f"device,{i}", "object-name"
+                )
+                for i in (2, 3) * 10
+            ]
+            assert await asyncio.gather(*reads) == ["Device-2", "Device-3"] * 10
+
+            metrics = client.request_scheduler.metrics()
+            assert metrics["outstanding"] == 0
+            assert metrics["waiting"] == 0
+            assert metrics["max_waiting"] == 18
+        finally:
+            for app in apps:
+                app.close()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Result Columns
+-------------------
+"""
+
+import math
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier
+from bacpypes3.basetypes import ErrorCode, StatusFlags
+from bacpypes3.apdu import AbortPDU, AbortReason
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+from bacpypes3.lib.batchread import DeviceAddressObjectPropertyReference, BatchRead
+from bacpypes3.lib.columns import (
+    FAILED,
+    NO_ERROR,
+    STATUS_FAULT,
+    STATUS_OUT_OF_SERVICE,
+    ResultColumns,
+)
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def analog_value_json(instance: int):
+    return {
+        "object-identifier": f"analog-value,{instance}",
+        "object-name": f"AV-{instance}",
+        "object-type": "analog-value",
+        "present-value": instance + 0.5,
+        "out-of-service": instance == 2,
+    }
+
+
+# the last one is not there
+OBJECT_IDENTIFIERS = [ObjectIdentifier(f"analog-value,{i}") for i in (1, 2, 3, 99)]
+
+
+@bacpypes_debugging
+class TestResultColumns:
+    def test_store(self):
+        if _debug:
+            TestResultColumns._debug("test_store")
+
+        columns = ResultColumns(["a", "b", "c", "d"], use_numpy=False)
+        columns.store("a", 1.5, timestamp=10.0)
+        columns.store("a", StatusFlags([0, 1, 0, 1]), timestamp=10.0)
+        columns.store("b", AbortPDU(reason=AbortReason.outOfResources))
+        columns.store("c", "not a number")
+        columns.store("e", 2.0)
+
+        assert columns.values[0] == 1.5
+        assert math.isnan(columns.values[1])
+        assert columns.status_flags[0] == STATUS_FAULT | STATUS_OUT_OF_SERVICE
+        assert list(columns.error_codes) == [NO_ERROR, FAILED, NO_ERROR, NO_ERROR]
+        assert columns.timestamps[0] == 10.0
+        assert math.isnan(columns.timestamps[2])
+        assert (columns.stored, columns.errors) == (1, 1)
+        assert (columns.unsupported, columns.unknown) == (1, 1)
+
+        columns.clear()
+        assert math.isnan(columns.values[0])
+        assert columns.status_flags[0] == 0
+
+        with pytest.raises(ValueError):
+            ResultColumns(["a", "a"])
+
+    def test_numpy(self):
+        if _debug:
+            TestResultColumns._debug("test_numpy")
+
+        numpy = pytest.importorskip("numpy")
+        columns = ResultColumns(range(3))
+        assert isinstance(columns.values, numpy.ndarray)
+        columns.store(1, 2.5)
+        assert columns.values[1] == 2.5
+        assert numpy.isnan(columns.values[0])
+
+
+@bacpypes_debugging
+class TestReadColumns:
+    def applications(self, network_name):
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [device_json(1), network_port_json(network_name, "0x01")]
+        )
+        server = Application.from_json(
+            [device_json(2)]
+            + [analog_value_json(i) for i in (1, 2, 3)]
+            + [network_port_json(network_name, "0x02")]
+        )
+        return client, server
+
+    def check_columns(self, columns):
+        assert list(columns.values[:3]) == [1.5, 2.5, 3.5]
+        assert math.isnan(columns.values[3])
+        assert list(columns.status_flags) == [0, STATUS_OUT_OF_SERVICE, 0, 0]
+        assert list(columns.error_codes) == [
+            NO_ERROR,
+            NO_ERROR,
+            NO_ERROR,
+            ErrorCode.unknownObject,
+        ]
+        assert not any(math.isnan(timestamp) for timestamp in columns.timestamps)
+
+    @pytest.mark.asyncio
+    async def test_read_columns(self):
+        if _debug:
+            TestReadColumns._debug("test_read_columns")
+
+        client, server = self.applications("test-result-columns")
+        address = Address("0x02")
+        parameter_list = []
+        for object_identifier in OBJECT_IDENTIFIERS:
+            parameter_list.extend(
+                [object_identifier, ["present-value", "status-flags"]]
+            )
+
+        try:
+            # compiled request, the values are decoded from the tags
+            compiled = await client.compile_rpm(address, parameter_list)
+            columns = ResultColumns(OBJECT_IDENTIFIERS, use_numpy=False)
+            assert await compiled.read_columns(columns) is None
+            self.check_columns(columns)
+
+            # keyed by address as well
+            columns = ResultColumns(
+                [
+                    (address, object_identifier)
+                    for object_identifier in OBJECT_IDENTIFIERS
+                ],
+                use_numpy=False,
+            )
+            assert await compiled.read_columns(columns, with_address=True) is None
+            self.check_columns(columns)
+
+            # the results of the request that is not compiled
+            columns = ResultColumns(OBJECT_IDENTIFIERS, use_numpy=False)
+            columns.store_results(
+                await client.read_property_multiple(address, parameter_list)
+            )
+            self.check_columns(columns)
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_read(self):
+        if _debug:
+            TestReadColumns._debug("test_batch_read")
+
+        client, server = self.applications("test-result-columns-batch")
+        daopr_list = [
+            DeviceAddressObjectPropertyReference(
+                object_identifier, "0x02", object_identifier, property_identifier
+            )
+            for object_identifier in OBJECT_IDENTIFIERS[:3]
+            for property_identifier in ("present-value", "status-flags")
+        ]
+
+        try:
+            columns = ResultColumns(OBJECT_IDENTIFIERS[:3], use_numpy=False)
+            await BatchRead(daopr_list).run(client, callback=columns.store)
+            assert list(columns.values) == [1.5, 2.5, 3.5]
+            assert list(columns.status_flags) == [0, STATUS_OUT_OF_SERVICE, 0]
+            assert columns.stored == 3
+        finally:
+            client.close()
+            server.close()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Round Trip Time
+--------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.pdu import Address
+from bacpypes3.basetypes import Segmentation
+from bacpypes3.apdu import AbortPDU
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application, DeviceInfo
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+# the devices retry requests once
+DEVICE_PROPERTIES = {"apdu_timeout": 3000, "number_of_apdu_retries": 1}
+
+
+@bacpypes_debugging
+class TestDeviceInfo:
+    def test_rtt_sample(self):
+        if _debug:
+            TestDeviceInfo._debug("test_rtt_sample")
+
+        device_info = DeviceInfo(2, Address("0x02"))
+        assert device_info.apdu_timeout(3000) == 3000
+
+        # the first one sets the variation
+        device_info.rtt_sample(1000.0)
+        assert (device_info.srtt, device_info.rttvar) == (1000.0, 500.0)
+        assert device_info.rto == 3000.0
+
+        # the next ones are smoothed
+        device_info.rtt_sample(200.0)
+        assert device_info.srtt == 900.0
+        assert device_info.rttvar == 575.0
+        assert device_info.rto == 3200.0
+        assert device_info.apdu_timeout(3000) == 3200
+        assert device_info.rtt_samples == 2
+
+    def test_floor_and_cap(self):
+        if _debug:
+            TestDeviceInfo._debug("test_floor_and_cap")
+
+        # fast devices are limited by the floor
+        device_info = DeviceInfo(2, Address("0x02"))
+        for _ in range(10):
+            device_info.rtt_sample(2.0)
+        assert device_info.rto == settings.adaptive_timeout_min
+
+        # slow ones by the cap, backing off as well
+        device_info = DeviceInfo(3, Address("0x03"))
+        device_info.rtt_sample(4000.0)
+        assert device_info.rto == settings.adaptive_timeout_max
+
+        device_info = DeviceInfo(4, Address("0x04"))
+        device_info.rtt_sample(1000.0)
+        device_info.rtt_timeout()
+        assert device_info.rto == 6000.0
+        device_info.rtt_timeout()
+        assert device_info.rto == settings.adaptive_timeout_max
+
+
+@bacpypes_debugging
+class TestAdaptiveTimeout:
+    def setup_method(self):
+        settings.adaptive_timeout = True
+        settings.adaptive_timeout_min = 50
+
+    def teardown_method(self):
+        settings.adaptive_timeout = False
+        settings.adaptive_timeout_min = 500
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout(self):
+        if _debug:
+            TestAdaptiveTimeout._debug("test_adaptive_timeout")
+
+        network_name = "test-round-trip-time"
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [
+                device_json(1, **DEVICE_PROPERTIES),
+                network_port_json(network_name, "0x01"),
+            ]
+        )
+        server = Application.from_json(
+            [
+                device_json(2, **DEVICE_PROPERTIES),
+                network_port_json(network_name, "0x02"),
+            ]
+        )
+
+        # the client knows about both of these devices, the second one is
+        # not there
+        for instance in (2, 3):
+            address = Address(f"0x{instance:02X}")
+            client.device_info_cache.address_cache[address] = DeviceInfo(
+                instance, address, segmentation_supported=Segmentation.segmentedBoth
+            )
+
+        try:
+            for _ in range(5):
+                assert (
+                    await client.read_property(
+                        Address("0x02"), "device,2", "object-name"
+                    )
+                    == "Device-2"
+                )
+            stats = client.device_info_cache.rtt_stats()
+            assert list(stats) == [Address("0x02")]
+            assert stats[Address("0x02")]["samples"] == 5
+            assert stats[Address("0x02")]["rto"] == 50
+
+            # the missing device has been fast, so it fails fast with the
+            # timeout backing off for the retry
+            device_info = client.device_info_cache.address_cache[Address("0x03")]
+            device_info.rtt_sample(5.0)
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            with pytest.raises(AbortPDU):
+                await client.read_property(Address("0x03"), "device,3", "object-name")
+            assert loop.time() - start_time < 1.0
+            assert device_info.rto == 200
+            assert device_info.rtt_samples == 1
+        finally:
+            client.close()
+            server.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Segmentation Window
+------------------------
+"""
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+from bacpypes3.appservice import WINDOW_SIZES_LENGTH, ServerSSM
+
+from ..utilities import segmented_device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestSegmentationWindow:
+    @pytest.mark.asyncio
+    async def test_window_size(self):
+        if _debug:
+            TestSegmentationWindow._debug("test_window_size")
+
+        network_name = "test-segmentation-window"
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [
+                segmented_device_json(1, 206),
+                network_port_json(network_name, "0x01"),
+            ]
+        )
+        server = Application.from_json(
+            [segmented_device_json(2)]
+            + [
+                {
+                    "object-identifier": f"analog-value,{i}",
+                    "object-name": f"AV-{i}",
+                    "object-type": "analog-value",
+                    "present-value": float(i),
+                }
+                for i in range(1, 201)
+            ]
+            + [network_port_json(network_name, "0x02")]
+        )
+        client_address = Address("0x01")
+
+        try:
+            # each response goes through, the window proposed to the client
+            # grows up to the number of segments it accepts
+            window_sizes = []
+            for _ in range(5):
+                object_list = await client.read_property(
+                    Address("0x02"), "device,2", "object-list"
+                )
+                assert len(object_list) == 202
+                assert object_list[0] == ObjectIdentifier("device,2")
+                assert object_list[-1] == ObjectIdentifier("network-port,1")
+                window_sizes.append(server.asap.windowSizes[client_address])
+            assert window_sizes == [4, 8, 16, 16, 16]
+
+            # lost segments cut it in half, back to the default it is dropped
+            ssm = ServerSSM(server.asap, client_address)
+            ssm.segmentLoss = True
+            ssm.adapt_window_size()
+            assert server.asap.windowSizes[client_address] == 8
+            ssm.adapt_window_size()
+            ssm.adapt_window_size()
+            assert client_address not in server.asap.windowSizes
+            assert ssm.window_size() == server.asap.proposedWindowSize
+
+            assert server.asap.serverTransactions == {}
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_window_sizes_length(self):
+        if _debug:
+            TestSegmentationWindow._debug("test_window_sizes_length")
+
+        network_name = "test-segmentation-window-length"
+        VirtualNetwork(network_name)
+        server = Application.from_json(
+            [segmented_device_json(2), network_port_json(network_name, "0x02")]
+        )
+
+        try:
+            # each peer that gets a larger window is remembered, the ones
+            # that have not been seen recently are forgotten
+            for i in range(WINDOW_SIZES_LENGTH + 10):
+                ServerSSM(server.asap, Address(f"1:0x{i:04X}")).adapt_window_size()
+            ServerSSM(server.asap, Address("1:0x000A")).adapt_window_size()
+            ServerSSM(server.asap, Address("1:0xFFFF")).adapt_window_size()
+
+            window_sizes = server.asap.windowSizes
+            assert len(window_sizes) == WINDOW_SIZES_LENGTH
+            assert Address("1:0x000A") in window_sizes
+            assert Address("1:0x000B") not in window_sizes
+            assert list(window_sizes)[-2:] == [Address("1:0x000A"), Address("1:0xFFFF")]
+        finally:
+            server.close()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Single Flight
+------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier
+from bacpypes3.apdu import ReadPropertyRequest
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestSingleFlight:
+    def setup_method(self):
+        settings.single_flight = True
+
+    def teardown_method(self):
+        settings.single_flight = False
+
+    def applications(self, network_name):
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [device_json(1), network_port_json(network_name, "0x01")]
+        )
+        server = Application.from_json(
+            [
+                device_json(2),
+                {
+                    "object-identifier": "analog-value,1",
+                    "object-name": "AV-1",
+                    "object-type": "analog-value",
+                    "present-value": 12.5,
+                },
+                network_port_json(network_name, "0x02"),
+            ]
+        )
+        return client, server
+
+    @pytest.mark.asyncio
+    async def test_shared_response(self):
+        if _debug:
+            TestSingleFlight._debug("test_shared_response")
+
+        client, server = self.applications("test-single-flight")
+        address = Address("0x02")
+        try:
+            reads = [
+                client.read_property(address, "analog-value,1", "present-value")
+                for _ in range(10)
+            ] + [
+                client.read_property_multiple(
+                    address, ["analog-value,1", ["present-value", "object-name"]]
+                )
+                for _ in range(5)
+            ]
+            results = await asyncio.gather(*reads)
+            assert results[:10] == [12.5] * 10
+            assert all(result == results[10] for result in results[10:])
+
+            # a different property is a different request
+            assert await asyncio.gather(
+                client.read_property(address, "device,2", "object-list", 0),
+                client.read_property(address, "device,2", "object-list", 1),
+            ) == [3, ObjectIdentifier("device,2")]
+
+            assert client.single_flight.metrics() == {
+                "requests": 17,
+                "hits": 13,
+                "in_flight": 0,
+            }
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel(self):
+        if _debug:
+            TestSingleFlight._debug("test_cancel")
+
+        client, server = self.applications("test-single-flight-cancel")
+
+        def read_property_request():
+            return ReadPropertyRequest(
+                objectIdentifier="analog-value,1",
+                propertyIdentifier="present-value",
+                destination=Address("0x02"),
+            )
+
+        try:
+            # one of them is canceled, the other still gets the response
+            future1 = client.request(read_property_request())
+            future2 = client.request(read_property_request())
+            future1.cancel()
+            response = await future2
+            assert response.propertyValue is not None
+
+            # all of them are canceled, the request is as well
+            future1 = client.request(read_property_request())
+            future2 = client.request(read_property_request())
+            (flight,) = client.single_flight.flights.values()
+            future1.cancel()
+            future2.cancel()
+            while client.single_flight.flights:
+                await asyncio.sleep(0)
+            assert flight[0].cancelled()
+            assert client._requests == {}
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_encoded_once(self, monkeypatch):
+        if _debug:
+            TestSingleFlight._debug("test_encoded_once")
+
+        client, server = self.applications("test-single-flight-encoded")
+        address = Address("0x02")
+
+        # count the times a read property request is encoded
+        encoded = []
+        encode = ReadPropertyRequest.encode
+
+        def counted_encode(self):
+            encoded.append(self)
+            return encode(self)
+
+        monkeypatch.setattr(ReadPropertyRequest, "encode", counted_encode)
+
+        try:
+            assert await asyncio.gather(
+                client.read_property(address, "analog-value,1", "present-value"),
+                client.read_property(address, "analog-value,1", "object-name"),
+            ) == [12.5, "AV-1"]
+            assert len(encoded) == 2
+        finally:
+            client.close()
+            server.close()
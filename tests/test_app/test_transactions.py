@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Transactions
+-----------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application
+from bacpypes3.appservice import transaction_key
+
+from ..utilities import segmented_device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestTransactions:
+    @pytest.mark.asyncio
+    async def test_transactions(self):
+        if _debug:
+            TestTransactions._debug("test_transactions")
+
+        VirtualNetwork("test-transactions")
+        client = Application.from_json(
+            [
+                segmented_device_json(1, 206),
+                network_port_json("test-transactions", "0x01"),
+            ]
+        )
+        server = Application.from_json(
+            [segmented_device_json(2)]
+            + [
+                {
+                    "object-identifier": f"analog-value,{i}",
+                    "object-name": f"AV-{i}",
+                    "object-type": "analog-value",
+                    "present-value": float(i),
+                }
+                for i in range(1, 51)
+            ]
+            + [network_port_json("test-transactions", "0x02")]
+        )
+        address = Address("0x02")
+
+        try:
+            # lots of transactions at the same time
+            reads = [
+                asyncio.ensure_future(
+                    client.read_property(address, f"analog-value,{i}", "present-value")
+                )
+                for i in range(1, 51)
+            ]
+            while len(client.asap.clientTransactions) < 50:
+                await asyncio.sleep(0)
+            for key, tr in client.asap.clientTransactions.items():
+                assert key == transaction_key(tr.pdu_address, tr.invokeID)
+
+            assert await asyncio.gather(*reads) == [float(i) for i in range(1, 51)]
+
+            # the object list needs a segmented response
+            object_list = await client.read_property(address, "device,2", "object-list")
+            assert len(object_list) == 52
+
+            # completed transactions are removed
+            assert client.asap.clientTransactions == {}
+            assert server.asap.serverTransactions == {}
+        finally:
+            client.close()
+            server.close()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Write Property Multiple
+----------------------------
+"""
+
+import asyncio
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier
+from bacpypes3.basetypes import (
+    ErrorCode,
+    ErrorType,
+    PropertyIdentifier,
+    ServicesSupported,
+)
+from bacpypes3.apdu import ComplexAckPDU, WritePropertyMultipleError
+from bacpypes3.vlan import VirtualNetwork
+from bacpypes3.app import Application, DeviceInfo
+from bacpypes3.lib.batchwrite import DeviceAddressObjectPropertyValue, BatchWrite
+
+from ..utilities import device_json, network_port_json
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def analog_value_json(instance: int):
+    return {
+        "object-identifier": f"analog-value,{instance}",
+        "object-name": f"AV-{instance}",
+        "object-type": "analog-value",
+        "present-value": 0.0,
+    }
+
+
+@bacpypes_debugging
+class TestWritePropertyMultiple:
+    def applications(self, network_name, server_count=1):
+        VirtualNetwork(network_name)
+        client = Application.from_json(
+            [device_json(1), network_port_json(network_name, "0x01")]
+        )
+        servers = [
+            Application.from_json(
+                [device_json(i)]
+                + [analog_value_json(j) for j in range(1, 6)]
+                + [network_port_json(network_name, f"0x{i:02X}")]
+            )
+            for i in range(2, 2 + server_count)
+        ]
+        return client, servers
+
+    @pytest.mark.asyncio
+    async def test_write_property_multiple(self):
+        if _debug:
+            TestWritePropertyMultiple._debug("test_write_property_multiple")
+
+        client, (server,) = self.applications("test-wpm")
+        try:
+            await client.write_property_multiple(
+                Address("0x02"),
+                [
+                    "analog-value,1",
+                    [("present-value", 1.5), ("object-name", "first")],
+                    "analog-value,2",
+                    [("description", "second")],
+                ],
+            )
+            av1 = server.get_object_id(ObjectIdentifier("analog-value,1"))
+            assert (av1.presentValue, av1.objectName) == (1.5, "first")
+            av2 = server.get_object_id(ObjectIdentifier("analog-value,2"))
+            assert av2.description == "second"
+
+            # the first failed write attempt is in the error, the writes
+            # before it have been made
+            with pytest.raises(WritePropertyMultipleError) as exc_info:
+                await client.write_property_multiple(
+                    Address("0x02"),
+                    [
+                        "analog-value,3",
+                        [("present-value", 3.5)],
+                        "analog-value,99",
+                        [("present-value", 99.5)],
+                    ],
+                )
+            err = exc_info.value
+            assert err.errorType.errorCode == ErrorCode.unknownObject
+            assert err.firstFailedWriteAttempt.objectIdentifier == ObjectIdentifier(
+                "analog-value,99"
+            )
+            av3 = server.get_object_id(ObjectIdentifier("analog-value,3"))
+            assert av3.presentValue == 3.5
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_write(self):
+        if _debug:
+            TestWritePropertyMultiple._debug("test_batch_write")
+
+        client, servers = self.applications("test-wpm-batch", server_count=2)
+
+        # the first server only accepts small requests, the second does not
+        # support Write Property Multiple
+        device_info = DeviceInfo(2, Address("0x02"))
+        device_info.max_apdu_length_accepted = 50
+        client.device_info_cache.address_cache[Address("0x02")] = device_info
+        servers[1].do_WritePropertyMultipleRequest = None
+
+        daopv_list = []
+        for address in ("0x02", "0x03"):
+            for instance in (1, 2, 99, 3, 4, 5):
+                daopv_list.append(
+                    DeviceAddressObjectPropertyValue(
+                        (address, instance),
+                        address,
+                        f"analog-value,{instance}",
+                        "present-value",
+                        instance + 0.5,
+                        8,
+                    )
+                )
+            daopv_list.append(
+                DeviceAddressObjectPropertyValue(
+                    (address, "name"), address, "analog-value,5", "object-name", "five"
+                )
+            )
+
+        try:
+            callback_results = {}
+            results = await BatchWrite(daopv_list).run(
+                client, callback=callback_results.__setitem__
+            )
+            assert results == callback_results
+            assert len(results) == len(daopv_list)
+
+            for server in servers:
+                for instance in (1, 2, 3, 4, 5):
+                    obj = server.get_object_id(
+                        ObjectIdentifier(f"analog-value,{instance}")
+                    )
+                    assert obj.presentValue == instance + 0.5
+                assert obj.objectName == "five"
+
+            # the unknown object failed, the writes after it were made
+            assert isinstance(results["0x02", 99], ErrorType)
+            assert results["0x02", 99].errorCode == ErrorCode.unknownObject
+            assert results["0x03", 99].errorCode == ErrorCode.unknownObject
+            assert all(
+                result is None for key, result in results.items() if key[1] != 99
+            )
+        finally:
+            client.close()
+            for server in servers:
+                server.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_write_values(self):
+        if _debug:
+            TestWritePropertyMultiple._debug("test_batch_write_values")
+
+        client, (server,) = self.applications("test-wpm-values")
+        daopv_list = [
+            DeviceAddressObjectPropertyValue(
+                "description", "0x02", "analog-value,1", "description", "first"
+            ),
+            DeviceAddressObjectPropertyValue(
+                "bad", "0x02", "analog-value,1", "present-value", "not a number"
+            ),
+            DeviceAddressObjectPropertyValue(
+                "unknown", "0x02", "analog-value,2", PropertyIdentifier(9999), 1
+            ),
+        ]
+        try:
+            results = await BatchWrite(daopv_list).run(client)
+            assert results["description"] is None
+            obj = server.get_object_id(ObjectIdentifier("analog-value,1"))
+            assert obj.description == "first"
+            assert isinstance(results["bad"], ValueError)
+            assert isinstance(results["unknown"], ValueError)
+        finally:
+            client.close()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_write_response(self):
+        if _debug:
+            TestWritePropertyMultiple._debug("test_batch_write_response")
+
+        client, (server,) = self.applications("test-wpm-response")
+        daopv_list = [
+            DeviceAddressObjectPropertyValue(
+                instance, "0x02", f"analog-value,{instance}", "present-value", 1.0
+            )
+            for instance in (1, 2)
+        ]
+
+        def request(apdu):
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(ComplexAckPDU())
+            return future
+
+        try:
+            # the device answers with something other than a simple ack
+            client.request = request
+            with pytest.raises(RuntimeError):
+                await client.write_property_multiple(
+                    Address("0x02"), ["analog-value,1", [("present-value", 1.0)]]
+                )
+
+            results = await BatchWrite(daopv_list).run(client)
+            assert isinstance(results[1], RuntimeError)
+            assert isinstance(results[2], RuntimeError)
+        finally:
+            client.close()
+            server.close()
+
+
+@bacpypes_debugging
+class TestServiceSupported:
+    def test_service_supported(self):
+        if _debug:
+            TestServiceSupported._debug("test_service_supported")
+
+        device_info = DeviceInfo(2, Address("0x02"))
+        assert device_info.service_supported(ServicesSupported.readProperty) is None
+
+        services_supported = ServicesSupported([])
+        services_supported[ServicesSupported.readProperty] = 1
+        device_info.protocol_services_supported = services_supported
+        assert device_info.service_supported(ServicesSupported.readProperty) is True
+        assert (
+            device_info.service_supported(ServicesSupported.writePropertyMultiple)
+            is False
+        )
+
+        # a bit string from a device that predates the service
+        del services_supported[ServicesSupported.writePropertyMultiple :]
+        assert len(services_supported) == ServicesSupported.writePropertyMultiple
+        assert (
+            device_info.service_supported(ServicesSupported.writePropertyMultiple)
+            is False
+        )
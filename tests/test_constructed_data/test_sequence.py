@@ -444,3 +444,38 @@ class TestThing008(unittest.TestCase):
 
         # pre-initialized value
         sequence_endec(Thing008)
+
+
+#
+#   Thing009
+#
+
+
+class Thing009(Thing006):
+    _order = ("i", "j", "k")
+    k = Integer(_context=2, _optional=True)
+
+
+@bacpypes_debugging
+class TestThing009(unittest.TestCase):
+    def test_plan(self):
+        if _debug:
+            TestThing009._debug("test_plan")
+
+        # the plan follows the order, including the inherited elements
+        assert [plan[0] for plan in Thing009._plan] == ["i", "j", "k"]
+
+        # (attr, element, kind, context, optional, app_tags, plain)
+        _, _, _, context, optional, app_tags, plain = Thing009._plan[0]
+        assert (context, optional, plain) == (None, True, True)
+        assert app_tags == {TagNumber.integer}
+
+        _, _, _, context, optional, app_tags, _ = Thing009._plan[2]
+        assert (context, optional) == (2, True)
+
+    def test_endec(self):
+        if _debug:
+            TestThing009._debug("test_endec")
+
+        sequence_endec(Thing009, j=1.5)
+        sequence_endec(Thing009, i=1, j=2.5, k=3)
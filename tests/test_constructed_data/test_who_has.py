@@ -7,10 +7,12 @@ Test WhoHas
 """
 
 import unittest
+import pytest
 
-from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger, xtob
+from bacpypes3.errors import DecodingError
 from bacpypes3.basetypes import WhoHasObject, WhoHasLimits
-from bacpypes3.apdu import WhoHasRequest
+from bacpypes3.apdu import APCISequence, UnconfirmedRequestPDU, WhoHasRequest
 
 # some debugging
 _debug = 0
@@ -62,3 +64,46 @@ class TestWhoHasRequest(unittest.TestCase):
         if _debug:
             TestWhoHasRequest._debug("    - z: %r", z)
 
+    def test_lazy(self):
+        if _debug:
+            TestWhoHasRequest._debug("test_lazy")
+
+        x = WhoHasRequest(
+            limits=WhoHasLimits(
+                deviceInstanceRangeLowLimit=0,
+                deviceInstanceRangeHighLimit=999,
+            ),
+            object=WhoHasObject(objectIdentifier="analog-value,1"),
+        )
+        y = x.encode()
+
+        # only the header is decoded
+        z = APCISequence.decode(y, lazy=True)
+        assert isinstance(z, WhoHasRequest)
+        assert z.__class__.__name__ == "WhoHasRequest"
+        assert z._lazy_data is not None
+
+        # elements are decoded on first reference
+        assert z.limits.deviceInstanceRangeHighLimit == 999
+        assert type(z) is WhoHasRequest
+        assert z._lazy_data is None
+        assert z == x
+
+        # elements set before they are referenced are kept
+        z = APCISequence.decode(x.encode(), lazy=True)
+        z.limits = None
+        assert z.object.objectIdentifier == x.object.objectIdentifier
+        assert z.limits is None
+
+    def test_lazy_error(self):
+        if _debug:
+            TestWhoHasRequest._debug("test_lazy_error")
+
+        # who-has with an opening tag that is not closed
+        y = UnconfirmedRequestPDU(service_choice=7)
+        y.put_data(xtob("3e"))
+
+        z = APCISequence.decode(y, lazy=True)
+        with pytest.raises(DecodingError):
+            z.object
+        assert z.object is None
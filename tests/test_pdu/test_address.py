@@ -13,6 +13,7 @@ from bacpypes3.settings import settings
 from bacpypes3.debugging import bacpypes_debugging, ModuleLogger, xtob
 from bacpypes3.pdu import (
     Address,
+    IPv4Address,
     LocalStation,
     RemoteStation,
     LocalBroadcast,
@@ -511,3 +512,46 @@ class TestAddressEquality(unittest.TestCase, MatchAddressMixin):
         assert Address("3:4@6.7.8.9") == RemoteStation(3, 4, route=Address("6.7.8.9"))
         assert Address("5:*@6.7.8.9") == RemoteBroadcast(5, route=Address("6.7.8.9"))
         assert Address("*:*@6.7.8.9") == GlobalBroadcast(route=Address("6.7.8.9"))
+
+
+@bacpypes_debugging
+class TestAddressCache(unittest.TestCase):
+    def test_address_cache(self):
+        if _debug:
+            TestAddressCache._debug("test_address_cache")
+
+        # strings, bytes, and tuples are shared
+        assert Address("1.2.3.4:47809") is Address("1.2.3.4:47809")
+        assert Address("3:4") is Address("3:4")
+        assert Address(xtob("01020304bac0")) is Address(bytearray(xtob("01020304bac0")))
+        assert IPv4Address(("1.2.3.4", 47808)) is IPv4Address(("1.2.3.4", 47808))
+
+        # the class is part of the key
+        assert Address(("1.2.3.4", 47808)) is not IPv4Address(("1.2.3.4", 47808))
+        assert Address(("1.2.3.4", 47808)) == IPv4Address(("1.2.3.4", 47808))
+
+        # other forms are not
+        assert Address(1) is not Address(1)
+        assert LocalStation(1) is not LocalStation(1)
+
+    def test_address_cache_size(self):
+        if _debug:
+            TestAddressCache._debug("test_address_cache_size")
+
+        address_cache = settings.address_cache
+        try:
+            settings.address_cache = 2
+            addr1 = Address("10:1")
+            addr2 = Address("10:2")
+            assert Address("10:1") is addr1
+
+            # least recently used is evicted
+            Address("10:3")
+            assert Address("10:1") is addr1
+            assert Address("10:2") is not addr2
+
+            # disabled
+            settings.address_cache = 0
+            assert Address("10:4") is not Address("10:4")
+        finally:
+            settings.address_cache = address_cache
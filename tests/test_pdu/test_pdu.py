@@ -1 +1,91 @@
-# placeholder
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test PDU Data
+-------------
+"""
+
+import unittest
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger, xtob
+from bacpypes3.errors import DecodingError
+from bacpypes3.pdu import PDUData, PDU
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestPDUData(unittest.TestCase):
+    def test_get(self):
+        if _debug:
+            TestPDUData._debug("test_get")
+
+        pdu_data = PDUData(xtob("01020304050607"))
+        assert pdu_data.remaining() == 7
+
+        assert pdu_data.get() == 1
+        assert pdu_data.get_short() == 0x0203
+        assert pdu_data.get_long() == 0x04050607
+        assert pdu_data.remaining() == 0
+
+        with pytest.raises(DecodingError):
+            pdu_data.get()
+
+    def test_get_data(self):
+        if _debug:
+            TestPDUData._debug("test_get_data")
+
+        pdu_data = PDUData(xtob("0102030405"))
+        assert pdu_data.get_data(2) == xtob("0102")
+        assert pdu_data.remaining() == 3
+        assert pdu_data.pduData == xtob("030405")
+
+        with pytest.raises(DecodingError):
+            pdu_data.get_data(4)
+        with pytest.raises(DecodingError):
+            pdu_data.get_long()
+
+        # the cursor did not move
+        assert pdu_data.get_data(3) == xtob("030405")
+
+    def test_put_after_get(self):
+        if _debug:
+            TestPDUData._debug("test_put_after_get")
+
+        pdu_data = PDUData(xtob("0102"))
+        assert pdu_data.get() == 1
+
+        pdu_data.put(3)
+        pdu_data.put_short(0x0405)
+        pdu_data.put_data(memoryview(xtob("06")))
+        assert pdu_data.pduData == xtob("0203040506")
+
+    def test_copy(self):
+        if _debug:
+            TestPDUData._debug("test_copy")
+
+        pdu1 = PDU(xtob("01020304"))
+        pdu1.get()
+
+        # copy constructor only gets what is left
+        pdu2 = PDU(pdu1)
+        assert pdu2.pduData == xtob("020304")
+
+        pdu2.get()
+        assert pdu1.remaining() == 3
+        assert pdu2.remaining() == 2
+
+    def test_assign(self):
+        if _debug:
+            TestPDUData._debug("test_assign")
+
+        pdu_data = PDUData(xtob("0102"))
+        pdu_data.get()
+
+        pdu_data.pduData = b"\x05\x06"
+        assert pdu_data.remaining() == 2
+        assert pdu_data.get() == 5
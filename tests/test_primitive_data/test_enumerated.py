@@ -23,6 +23,11 @@ class QuickBrownFox(Enumerated):
     fox = 2
 
 
+class JumpedOverTheLazyDog(QuickBrownFox):
+    _high_limit = 10
+    jumpedOver = 3
+
+
 @bacpypes_debugging
 def enumerated_tag(x):
     """Convert a hex string to an octet string application tag."""
@@ -106,6 +111,33 @@ class TestBitString(unittest.TestCase):
         assert obj == 1
         assert str(obj) == "brown"
 
+    def test_enumerated_lookup(self):
+        if _debug:
+            TestBitString._debug("test_enumerated_lookup")
+
+        # inherited names, both forms
+        obj = JumpedOverTheLazyDog("jumped-over")
+        assert obj == 3
+        assert obj.attr == "jumpedOver"
+        assert obj.asn1 == "jumped-over"
+        assert JumpedOverTheLazyDog("fox") == 2
+
+        # attribute form without an instance
+        assert JumpedOverTheLazyDog.attr_of(3) == "jumpedOver"
+        assert JumpedOverTheLazyDog.attr_of("jumped-over") == "jumpedOver"
+        assert JumpedOverTheLazyDog.attr_of("jumpedOver") == "jumpedOver"
+        assert JumpedOverTheLazyDog.attr_of(obj) == "jumpedOver"
+        assert JumpedOverTheLazyDog.attr_of(7) == "7"
+        assert JumpedOverTheLazyDog.attr_of("7") == "7"
+        with pytest.raises(ValueError):
+            JumpedOverTheLazyDog.attr_of("lazy-dog")
+
+        # unnamed values are still checked
+        assert JumpedOverTheLazyDog(7).attr == "7"
+        assert JumpedOverTheLazyDog(7).asn1 == "7"
+        with pytest.raises(ValueError):
+            JumpedOverTheLazyDog(11)
+
     def test_enumerated_copy(self):
         if _debug:
             TestBitString._debug("test_enumerated_copy")
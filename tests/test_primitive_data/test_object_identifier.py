@@ -9,6 +9,7 @@ Test ObjectIdentifier
 import unittest
 import pytest
 
+from bacpypes3.settings import settings
 from bacpypes3.debugging import bacpypes_debugging, ModuleLogger, xtob, btox
 from bacpypes3.primitivedata import (
     Tag,
@@ -17,6 +18,9 @@ from bacpypes3.primitivedata import (
     TagList,
     ObjectType,
     ObjectIdentifier,
+    PropertyIdentifier,
+    Unsigned,
+    encode_cache,
 )
 
 # some debugging
@@ -141,3 +145,64 @@ class TestObjectIdentifier(unittest.TestCase):
 
         # object_identifier_endec("", "00")
         # object_identifier_endec("abc", "00616263")
+
+
+@bacpypes_debugging
+class TestEncodeCache(unittest.TestCase):
+    def setUp(self):
+        self.encode_cache = settings.encode_cache
+        settings.encode_cache = 8
+        encode_cache.clear()
+
+    def tearDown(self):
+        settings.encode_cache = self.encode_cache
+        encode_cache.clear()
+
+    def test_encode_cache(self):
+        if _debug:
+            TestEncodeCache._debug("test_encode_cache")
+
+        # first time is a miss, then it is shared
+        tag1 = ObjectIdentifier("analog-value,1").encode()[0]
+        tag2 = ObjectIdentifier("analog-value,1").encode()[0]
+        assert tag1 is tag2
+        assert tag1 == Tag(
+            TagClass.application, TagNumber.objectIdentifier, 4, xtob("00800001")
+        )
+        assert encode_cache.stats() == {
+            "size": 1,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+        # the class is part of the key, including the context
+        tag3 = ObjectIdentifier("analog-value,1", _context=1).encode()[0]
+        assert tag3 is not tag1
+        assert tag3.tag_class == TagClass.context
+        assert (
+            PropertyIdentifier(85).encode()[0]
+            is PropertyIdentifier("present-value").encode()[0]
+        )
+
+        # large unsigned values are not saved
+        Unsigned(100000).encode()
+        assert encode_cache.stats()["size"] == 3
+
+    def test_encode_cache_size(self):
+        if _debug:
+            TestEncodeCache._debug("test_encode_cache_size")
+
+        for i in range(10):
+            Unsigned(i).encode()
+        assert encode_cache.stats()["size"] == 8
+
+        # the oldest were evicted
+        assert (Unsigned, 0) not in encode_cache.tags
+        assert (Unsigned, 9) in encode_cache.tags
+
+        # disabled
+        settings.encode_cache = 0
+        encode_cache.clear()
+        Unsigned(1).encode()
+        assert encode_cache.stats()["misses"] == 0
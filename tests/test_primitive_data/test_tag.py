@@ -15,6 +15,8 @@ from bacpypes3.primitivedata import (
     Tag,
     ContextTag,
     OpeningTag,
+    ClosingTag,
+    TagList,
 )
 
 # some debugging
@@ -171,3 +173,79 @@ class TestOpeningTag(unittest.TestCase):
         opening_endec(14, "EE")
         opening_endec(15, "FE0F")
         opening_endec(254, "FEFE")
+
+
+@bacpypes_debugging
+class TestTagList(unittest.TestCase):
+    def test_pop_push(self):
+        if _debug:
+            TestTagList._debug("test_pop_push")
+
+        tag0, tag1, tag2 = ContextTag(0, b"a"), ContextTag(1, b"b"), ContextTag(2, b"c")
+        tag_list = TagList([tag0, tag1, tag2])
+
+        assert tag_list.pop() is tag0
+        assert len(tag_list) == 2
+        assert tag_list.peek() is tag1
+        assert tag_list[0] is tag1
+        assert list(tag_list) == [tag1, tag2]
+
+        tag_list.push(tag0)
+        assert len(tag_list) == 3
+        assert tag_list.peek() is tag0
+
+        # pushing in front of a fresh list
+        tag_list = TagList([tag1])
+        tag_list.push(tag0)
+        assert list(tag_list) == [tag0, tag1]
+
+    def test_tell_seek(self):
+        if _debug:
+            TestTagList._debug("test_tell_seek")
+
+        tags = [ContextTag(i, b"x") for i in range(4)]
+        tag_list = TagList(tags[:])
+
+        tag_list.pop()
+        position = tag_list.tell()
+        tag_list.pop()
+        tag_list.pop()
+        tag_list.seek(position)
+        assert tag_list.peek() is tags[1]
+
+        # copy constructor and tagList are what has not been consumed
+        assert TagList(tag_list) == TagList(tags[1:])
+        assert tag_list.tagList == tags[1:]
+
+    def test_pop_context(self):
+        if _debug:
+            TestTagList._debug("test_pop_context")
+
+        inner = [OpeningTag(1), ContextTag(0, b"a"), ClosingTag(1)]
+        tag_list = TagList([ContextTag(0, b"z")] + inner + [ContextTag(2, b"b")])
+
+        assert len(tag_list.pop_context()) == 1
+        assert list(tag_list.pop_context()) == inner
+        assert len(tag_list) == 1
+
+    def test_encode_into(self):
+        if _debug:
+            TestTagList._debug("test_encode_into")
+
+        tag_list = TagList([OpeningTag(1), ContextTag(0, b"a"), ClosingTag(1)])
+
+        # tags are appended to the end of existing data
+        pdu_data = PDUData(xtob("ff"))
+        assert tag_list.encode(pdu_data) is pdu_data
+        assert pdu_data.pduData == xtob("ff" "1e" "0961" "1f")
+
+        # a new one when none is provided
+        assert tag_list.encode().pduData == xtob("1e09611f")
+
+    def test_slots(self):
+        if _debug:
+            TestTagList._debug("test_slots")
+
+        # tags and tag lists are created for every packet, keep them compact
+        assert not hasattr(ContextTag(0, b""), "__dict__")
+        assert not hasattr(TagList(), "__dict__")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Timer Wheel
+----------------
+"""
+
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.settings import settings
+from bacpypes3.timer import TimerHandle, TimerWheel, call_later, get_timer_wheel
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestTimerWheel:
+    @pytest.mark.asyncio
+    async def test_call_later(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_call_later")
+
+        timer_wheel = TimerWheel(clocked_test.loop)
+        fired = []
+
+        def callback(label):
+            fired.append((label, clocked_test.loop.time()))
+
+        # delays that land in each of the levels and past the horizon
+        delays = [0.5, 0.03, 2.0, 300.0, 5000.0, 1000000.0]
+        for delay in delays:
+            timer_wheel.call_later(delay, callback, delay)
+        assert len(timer_wheel) == len(delays)
+
+        await clocked_test.advance(1000001.0)
+        assert [label for label, when in fired] == sorted(delays)
+        for label, when in fired:
+            assert label <= when < label + 0.02
+        assert len(timer_wheel) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_cancel")
+
+        timer_wheel = TimerWheel(clocked_test.loop)
+        fired = []
+
+        handles = [
+            timer_wheel.call_later(delay, fired.append, delay)
+            for delay in (1.0, 2.0, 3.0, 400.0)
+        ]
+        handles[1].cancel()
+        handles[3].cancel()
+        handles[3].cancel()
+        assert handles[1].cancelled()
+        assert len(timer_wheel) == 2
+
+        # a callback that cancels another timer in the same tick
+        timer_wheel.call_later(3.0, lambda: later.cancel())
+        later = timer_wheel.call_later(3.0, fired.append, "later")
+
+        await clocked_test.advance(500.0)
+        assert fired == [1.0, 3.0]
+        assert later.cancelled()
+        assert len(timer_wheel) == 0
+
+    @pytest.mark.asyncio
+    async def test_reschedule(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_reschedule")
+
+        timer_wheel = get_timer_wheel()
+        assert get_timer_wheel() is timer_wheel
+        fired = []
+
+        # a callback that starts another one, like a periodic clock
+        def clock():
+            fired.append(clocked_test.loop.time())
+            if clocked_test.loop.time() < 5.0:
+                timer_wheel.call_later(1.0, clock)
+
+        timer_wheel.call_later(1.0, clock)
+
+        # an earlier one added after the loop timer is scheduled
+        timer_wheel.call_later(0.5, fired.append, "early")
+
+        await clocked_test.advance(10.0)
+        assert fired == ["early", 1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_loop_closed(self):
+        if _debug:
+            TestTimerWheel._debug("test_loop_closed")
+
+        loops = []
+
+        async def start_timer():
+            loop = asyncio.get_running_loop()
+            loops.append(weakref.ref(loop))
+            get_timer_wheel(loop).call_later(60.0, print)
+
+        for _ in range(5):
+            asyncio.run(start_timer())
+
+        # the wheels do not keep the loops around
+        gc.collect()
+        assert [loop_ref() for loop_ref in loops] == [None] * 5
+
+    @pytest.mark.asyncio
+    async def test_timer_wheel_setting(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_timer_wheel_setting")
+
+        fired = []
+
+        # the event loop timers by default
+        handle = call_later(1.0, fired.append, "loop")
+        assert isinstance(handle, asyncio.TimerHandle)
+
+        settings.timer_wheel = True
+        try:
+            handle = call_later(1.0, fired.append, "wheel")
+            assert isinstance(handle, TimerHandle)
+            assert len(get_timer_wheel()) == 1
+        finally:
+            settings.timer_wheel = False
+
+        await clocked_test.advance(2.0)
+        assert sorted(fired) == ["loop", "wheel"]
@@ -7,7 +7,7 @@ BACpypes Testing Utilities
 
 import os
 
-from typing import Callable, cast
+from typing import Any, Callable, Dict, cast
 
 from bacpypes3.settings import os_settings
 from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
@@ -58,3 +58,53 @@ def teardown_package() -> None:
 
     if _debug:
         fn_debug("teardown_package")
+
+
+def device_json(instance: int, **properties: Any) -> Dict[str, Any]:
+    """
+    Return the JSON for a device object, keyword arguments like
+    max_apdu_length_accepted=206 are more property values.
+    """
+    device = {
+        "object-identifier": f"device,{instance}",
+        "object-name": f"Device-{instance}",
+        "object-type": "device",
+        "vendor-identifier": 999,
+    }
+    for attr, value in properties.items():
+        device[attr.replace("_", "-")] = value
+
+    return device
+
+
+def segmented_device_json(
+    instance: int, max_apdu_length_accepted: int = 1024
+) -> Dict[str, Any]:
+    """
+    Return the JSON for a device object that segments requests and responses
+    and does not retry them.
+    """
+    return device_json(
+        instance,
+        apdu_segment_timeout=1000,
+        apdu_timeout=3000,
+        max_apdu_length_accepted=max_apdu_length_accepted,
+        max_segments_accepted=16,
+        number_of_apdu_retries=0,
+        segmentation_supported="segmented-both",
+    )
+
+
+def network_port_json(network_name: str, mac_address: str) -> Dict[str, Any]:
+    """
+    Return the JSON for a network port object on a virtual network.
+    """
+    return {
+        "object-identifier": "network-port,1",
+        "object-name": "NetworkPort-1",
+        "object-type": "network-port",
+        "mac-address": mac_address,
+        "network-interface-name": network_name,
+        "network-type": "virtual",
+        "protocol-level": "bacnet-application",
+    }